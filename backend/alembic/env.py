@@ -29,6 +29,8 @@ from app.models import (  # noqa: E402, F401
     DocLink,
     GongCall,
     AIAnalysis,
+    PortfolioMetrics,
+    POCChange,
 )
 
 target_metadata = Base.metadata
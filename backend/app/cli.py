@@ -0,0 +1,193 @@
+"""Command-line maintenance tasks.
+
+Run from the ``backend`` directory::
+
+    python -m app.cli reconcile-progress [--batch-size 500]
+    python -m app.cli bulk-create accounts.csv [--template default] [--chunk-size 200]
+    python -m app.cli check-event-bus [--workers 4] [--notices 100]
+    python -m app.cli rebalance-sort-keys
+    python -m app.cli check-query-budgets POC_ID
+    python -m app.cli sync-gong-index
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import uuid
+from pathlib import Path
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.poc import POC
+from app.services.bulk_import_service import BULK_CHUNK_SIZE, bulk_create_pocs, load_rows
+from app.services.event_bus import check_fanout
+from app.services.gong_index import sync_call_index
+from app.services.gong_service import GongService
+from app.services.ordering_service import SCOPE_COLUMNS, rebalance_all
+from app.services.poc_service import RECONCILE_BATCH_SIZE, POCService
+
+
+def reconcile_progress(args: argparse.Namespace) -> None:
+    """Rebuild the denormalized progress counters on every POC."""
+    db = SessionLocal()
+    try:
+        fixed = POCService.reconcile_progress_counters(db, batch_size=args.batch_size)
+    finally:
+        db.close()
+    print(f"Reconciled progress counters: {fixed} POC(s) corrected.")
+
+
+def bulk_create(args: argparse.Namespace) -> None:
+    """Create POCs for every account in a CSV or JSON file."""
+    rows = load_rows(Path(args.file))
+    db = SessionLocal()
+    try:
+        result = bulk_create_pocs(
+            db, rows, default_template=args.template, chunk_size=args.chunk_size
+        )
+    finally:
+        db.close()
+    for error in result["errors"]:
+        print(f"Row {error['row']}: {error['error']}")
+    print(f"Created {len(result['created'])} POC(s); {len(result['errors'])} row(s) failed.")
+
+
+def check_event_bus(args: argparse.Namespace) -> None:
+    """Verify that every simulated worker receives every change notice."""
+    counts = check_fanout(
+        workers=args.workers, notices=args.notices, timeout=args.timeout
+    )
+    for worker, received in enumerate(counts, start=1):
+        print(f"Worker {worker}: {received}/{args.notices} notice(s) received.")
+    if any(received != args.notices for received in counts):
+        sys.exit(1)
+
+
+def rebalance_sort_keys(args: argparse.Namespace) -> None:
+    """Respace crowded sort keys so drag-and-drop moves stay single-row."""
+    db = SessionLocal()
+    try:
+        for model in SCOPE_COLUMNS:
+            fixed = rebalance_all(db, model)
+            db.commit()
+            print(f"{model.__tablename__}: {fixed} row(s) renumbered.")
+    finally:
+        db.close()
+
+
+def check_query_budgets(args: argparse.Namespace) -> None:
+    """Run every read endpoint for one POC and compare query counts to budgets."""
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+    from app.testing import check_query_budgets as run_checks
+
+    db = SessionLocal()
+    try:
+        poc = db.get(POC, uuid.UUID(args.poc_id))
+        share_token = poc.share_token if poc else None
+    finally:
+        db.close()
+    if share_token is None:
+        sys.exit(f"POC {args.poc_id} not found.")
+
+    over = 0
+    for path, queries, budget in run_checks(TestClient(app), args.poc_id, share_token):
+        status = "ok" if queries <= budget else "OVER BUDGET"
+        over += queries > budget
+        print(f"{queries:3d}/{budget:<3d} {status:11s} {path}")
+    if over:
+        sys.exit(1)
+
+
+def sync_gong_index(args: argparse.Namespace) -> None:
+    async def run() -> int | None:
+        gong = GongService(get_settings())
+        try:
+            return await sync_call_index(gong)
+        finally:
+            await gong.aclose()
+
+    stored = asyncio.run(run())
+    if stored is None:
+        print("Another process is syncing the Gong call index.")
+        sys.exit(1)
+    print(f"Gong call index synced: {stored} call(s) stored.")
+
+
+def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    reconcile = subparsers.add_parser(
+        "reconcile-progress",
+        help="Rebuild drifted task/milestone counters on the pocs table.",
+    )
+    reconcile.add_argument(
+        "--batch-size",
+        type=int,
+        default=RECONCILE_BATCH_SIZE,
+        help="Number of POCs rebuilt per transaction.",
+    )
+    reconcile.set_defaults(func=reconcile_progress)
+
+    bulk = subparsers.add_parser(
+        "bulk-create",
+        help="Create POCs from a CSV or JSON list of accounts.",
+    )
+    bulk.add_argument("file", help="Path to a .csv (with header row) or .json file.")
+    bulk.add_argument(
+        "--template",
+        default=None,
+        help="Template for rows that do not name one.",
+    )
+    bulk.add_argument(
+        "--chunk-size",
+        type=int,
+        default=BULK_CHUNK_SIZE,
+        help="Number of POCs created per transaction.",
+    )
+    bulk.set_defaults(func=bulk_create)
+
+    bus = subparsers.add_parser(
+        "check-event-bus",
+        help="Check LISTEN/NOTIFY fan-out across simulated worker processes.",
+    )
+    bus.add_argument("--workers", type=int, default=4, help="Listener processes.")
+    bus.add_argument("--notices", type=int, default=100, help="Notices to publish.")
+    bus.add_argument(
+        "--timeout",
+        type=float,
+        default=10.0,
+        help="Seconds to wait for listeners and deliveries.",
+    )
+    bus.set_defaults(func=check_event_bus)
+
+    rebalance = subparsers.add_parser(
+        "rebalance-sort-keys",
+        help="Respace sort keys of milestones, phases, tasks, criteria and team.",
+    )
+    rebalance.set_defaults(func=rebalance_sort_keys)
+
+    budgets = subparsers.add_parser(
+        "check-query-budgets",
+        help="Fail if a read endpoint runs more queries than its budget (N+1 check).",
+    )
+    budgets.add_argument("poc_id", help="A POC with several phases, tasks and entries.")
+    budgets.set_defaults(func=check_query_budgets)
+
+    gong_index = subparsers.add_parser(
+        "sync-gong-index",
+        help="Page new Gong calls into the org-wide call index now.",
+    )
+    gong_index.set_defaults(func=sync_gong_index)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
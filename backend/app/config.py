@@ -10,6 +10,13 @@ class Settings(BaseSettings):
     gong_api_base_url: str = "https://api.gong.io/v2"
     gong_access_key: str = ""
     gong_access_key_secret: str = ""
+    # Shared, pooled HTTP client (one per process); HTTP/2 needs the h2 package
+    gong_http2: bool = True
+    gong_max_connections: int = 10
+    gong_max_keepalive_connections: int = 5
+    gong_keepalive_expiry_seconds: float = 60.0
+    # Org-wide call index sync; 0 disables it (POC searches then page the API)
+    gong_index_sync_interval_seconds: int = 900
 
     # Anthropic Claude API
     anthropic_api_key: str = ""
@@ -19,6 +26,25 @@ class Settings(BaseSettings):
     sentry_dsn: str = ""
     sentry_traces_sample_rate: float = 1.0
 
+    # Portfolio dashboard
+    portfolio_refresh_interval_seconds: int = 300  # 0 disables the refresher
+
+    # POC templates: how often (seconds) to check template files for changes
+    template_reload_interval_seconds: float = 5.0
+
+    # Customer portal share-token cache (per process)
+    share_token_cache_size: int = 10000
+    share_token_cache_ttl_seconds: float = 60.0
+    share_token_negative_cache_size: int = 10000
+    share_token_negative_cache_ttl_seconds: float = 30.0
+
+    # Postgres LISTEN/NOTIFY change bus (cross-worker cache invalidation)
+    event_bus_enabled: bool = True
+
+    # Server-Sent Events change streams
+    change_stream_poll_interval_seconds: float = 1.0  # used while the bus is down
+    change_stream_heartbeat_seconds: float = 15.0
+
     # App
     app_url: str = "http://localhost:3000"
     cors_origins: list[str] = ["http://localhost:3000"]
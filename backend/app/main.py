@@ -1,3 +1,6 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 import sentry_sdk
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -13,7 +16,15 @@ from app.routers import (
     ai_analysis,
     docs_lookup,
     customer_portal,
+    portfolio,
+    templates,
 )
+from app.services.event_bus import get_event_bus
+from app.services.gong_index import sync_periodically
+from app.services.gong_service import GongService, create_http_client
+from app.services.portfolio_service import refresh_periodically
+from app.services.share_token_cache import get_share_token_cache
+from app.services.template_service import get_template_registry
 
 settings = get_settings()
 
@@ -28,11 +39,64 @@ if settings.sentry_dsn:
     )
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Compile the POC templates once, before the first request needs them
+    get_template_registry()
+
+    # One pooled HTTP client for all Gong API calls of this process
+    gong_client = create_http_client(settings)
+    app.state.gong_service = GongService(settings, gong_client)
+
+    # Org-wide Gong call index that POC call searches query locally
+    gong_sync: asyncio.Task | None = None
+    if (
+        settings.gong_index_sync_interval_seconds > 0
+        and settings.gong_access_key
+        and settings.gong_access_key_secret
+    ):
+        gong_sync = asyncio.create_task(
+            sync_periodically(
+                app.state.gong_service, settings.gong_index_sync_interval_seconds
+            )
+        )
+
+    # Background refresher for the precomputed portfolio dashboard
+    refresher: asyncio.Task | None = None
+    if settings.portfolio_refresh_interval_seconds > 0:
+        refresher = asyncio.create_task(
+            refresh_periodically(settings.portfolio_refresh_interval_seconds)
+        )
+
+    # Cross-process change notifications: keep this process's caches coherent
+    # with writes committed by other workers and wake SSE streams
+    bus = get_event_bus()
+    if settings.event_bus_enabled:
+        share_tokens = get_share_token_cache()
+        bus.add_handler(share_tokens.on_change)
+        bus.add_reconnect_handler(share_tokens.clear)
+        bus.start()
+
+    yield
+
+    await bus.stop()
+    if gong_sync:
+        gong_sync.cancel()
+        with suppress(asyncio.CancelledError):
+            await gong_sync
+    await gong_client.aclose()
+    if refresher:
+        refresher.cancel()
+        with suppress(asyncio.CancelledError):
+            await refresher
+
+
 def create_app() -> FastAPI:
     app = FastAPI(
         title="Sentry POC/MAP Portal API",
         description="Backend API for managing Sentry POC and Mutual Action Plan documents",
         version="0.1.0",
+        lifespan=lifespan,
     )
 
     app.add_middleware(
@@ -41,6 +105,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[pocs.NEXT_CURSOR_HEADER, "ETag"],
     )
 
     # Staff-facing endpoints
@@ -58,6 +123,8 @@ def create_app() -> FastAPI:
     app.include_router(
         docs_lookup.router, prefix="/api/v1", tags=["Docs Lookup"]
     )
+    app.include_router(portfolio.router, prefix="/api/v1", tags=["Portfolio"])
+    app.include_router(templates.router, prefix="/api/v1", tags=["POC Templates"])
 
     # Customer-facing endpoints
     app.include_router(
@@ -68,6 +135,10 @@ def create_app() -> FastAPI:
     async def health_check():
         return {"status": "healthy"}
 
+    @app.get("/api/v1/health/share-token-cache")
+    async def share_token_cache_stats():
+        return get_share_token_cache().stats()
+
     return app
 
 
@@ -4,7 +4,15 @@ from app.models.phase import Phase, Task
 from app.models.success_criteria import SuccessCriterion
 from app.models.team_member import TeamMember
 from app.models.tech_stack import TechStackEntry, DocLink
-from app.models.gong import GongCall, AIAnalysis
+from app.models.gong import (
+    AIAnalysis,
+    GongCall,
+    GongCallDomain,
+    GongCallIndexEntry,
+    GongSyncState,
+)
+from app.models.portfolio import PortfolioMetrics
+from app.models.change_log import POCChange
 
 __all__ = [
     "POC",
@@ -18,4 +26,9 @@ __all__ = [
     "DocLink",
     "GongCall",
     "AIAnalysis",
+    "GongCallIndexEntry",
+    "GongCallDomain",
+    "GongSyncState",
+    "PortfolioMetrics",
+    "POCChange",
 ]
@@ -0,0 +1,35 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, String, DateTime, Integer, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class POCChange(Base):
+    """Append-only log of entity-level writes, one row per changed entity.
+
+    Written in the same transaction as the change by
+    ``app.services.change_tracking``; ``version`` is the POC version the
+    write produced.  Rows for deletes double as tombstones.
+    """
+
+    __tablename__ = "poc_changes"
+    __table_args__ = (
+        Index("ix_poc_changes_poc_id_id", "poc_id", "id"),
+        Index("ix_poc_changes_poc_id_version", "poc_id", "version"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    poc_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("pocs.id", ondelete="CASCADE"), nullable=False
+    )
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    entity_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    entity_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    op: Mapped[str] = mapped_column(String(10), nullable=False)  # insert, update, delete
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, Text, Boolean, DateTime, Integer, Float, ForeignKey, func
+from sqlalchemy import String, Text, Boolean, DateTime, Integer, Float, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -67,4 +67,55 @@ class AIAnalysis(Base):
     poc: Mapped["POC"] = relationship(back_populates="ai_analyses")
 
 
+class GongCallIndexEntry(Base):
+    """Org-wide Gong call metadata shared by all POCs.
+
+    Filled by the background call index sync (``app.services.gong_index``),
+    which pages ``/calls/extensive`` once for the whole organization.
+    """
+
+    __tablename__ = "gong_call_index"
+    __table_args__ = (Index("ix_gong_call_index_started_at", "started_at"),)
+
+    gong_call_id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    title: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    duration_seconds: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    url: Mapped[str | None] = mapped_column(String(1000), nullable=True)
+    participant_emails: Mapped[list | None] = mapped_column(JSONB, nullable=True)
+    synced_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+
+class GongCallDomain(Base):
+    """Inverted index from participant email domain to indexed call.
+
+    Holds every domain suffix of each participant address (``eu.acme.com``
+    and ``acme.com``), so a domain lookup also finds its subdomains.
+    """
+
+    __tablename__ = "gong_call_domains"
+
+    domain: Mapped[str] = mapped_column(String(255), primary_key=True)
+    gong_call_id: Mapped[str] = mapped_column(
+        String(100),
+        ForeignKey("gong_call_index.gong_call_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+
+class GongSyncState(Base):
+    """High-water marks of org-wide Gong syncs, one row per sync."""
+
+    __tablename__ = "gong_sync_state"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    last_synced_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+
 from app.models.poc import POC  # noqa: E402
@@ -29,7 +29,9 @@ class Phase(Base):
 
     poc: Mapped["POC"] = relationship(back_populates="phases")
     tasks: Mapped[list["Task"]] = relationship(
-        back_populates="phase", cascade="all, delete-orphan"
+        back_populates="phase",
+        cascade="all, delete-orphan",
+        order_by="Task.sort_order",
     )
 
 
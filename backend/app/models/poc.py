@@ -1,15 +1,43 @@
 import uuid
 from datetime import datetime, date
 
-from sqlalchemy import String, Text, Date, DateTime, Float, Boolean, ForeignKey, func
+from sqlalchemy import (
+    String,
+    Text,
+    Date,
+    DateTime,
+    Float,
+    Boolean,
+    Integer,
+    Computed,
+    ForeignKey,
+    Index,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
+# Sort key that places undated POCs after every dated one.  Shared by the
+# ``ix_pocs_end_date_sort`` expression index and the list endpoint so the
+# planner can match the two.
+END_DATE_SORT_SQL = "coalesce(poc_end_date, DATE '9999-12-31')"
+
 
 class POC(Base):
     __tablename__ = "pocs"
+    __table_args__ = (
+        # Keyset pagination / sorting for GET /pocs: every sort key is paired
+        # with ``id`` as a tie-breaker.
+        Index("ix_pocs_created_at_id", "created_at", "id"),
+        Index("ix_pocs_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_pocs_completion_pct_id", "completion_pct", "id"),
+        Index("ix_pocs_account_name_id", "account_name", "id"),
+        Index("ix_pocs_end_date_sort", text(END_DATE_SORT_SQL), "id"),
+        Index("ix_pocs_account_domain_lower", func.lower(text("account_domain"))),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -26,6 +54,56 @@ class POC(Base):
     poc_start_date: Mapped[date | None] = mapped_column(Date, nullable=True)
     poc_end_date: Mapped[date | None] = mapped_column(Date, nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+    template_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    template_version: Mapped[str | None] = mapped_column(String(50), nullable=True)
+
+    # Incremented whenever the POC or any of its child rows is written; see
+    # ``app.services.change_tracking``. Served to clients as an ETag.
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
+
+    # Denormalized progress counters. Kept in sync by every task and milestone
+    # write path via ``POCService.adjust_*_counters``; rebuilt from scratch by
+    # ``python -m app.cli reconcile-progress``.
+    total_tasks: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    completed_tasks: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    in_progress_tasks: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    total_milestones: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    completed_milestones: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    in_progress_milestones: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    # Task completion percentage derived from the counters above; stored so
+    # the list endpoint can filter and sort on it through an index.
+    completion_pct: Mapped[float] = mapped_column(
+        Float,
+        Computed(
+            "CASE WHEN total_tasks > 0 "
+            "THEN round(completed_tasks * 100.0 / total_tasks, 1) ELSE 0 END",
+            persisted=True,
+        ),
+    )
+
+    # High-water mark of the last successful Gong call search for
+    # ``gong_synced_domain``; later searches only ask Gong for newer calls.
+    gong_last_synced_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    gong_synced_domain: Mapped[str | None] = mapped_column(
+        String(255), nullable=True
+    )
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
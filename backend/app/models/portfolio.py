@@ -0,0 +1,50 @@
+import uuid
+from datetime import datetime, date
+
+from sqlalchemy import String, Date, DateTime, Float, Integer, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class PortfolioMetrics(Base):
+    """Precomputed per-POC metrics backing the portfolio dashboard.
+
+    One row per POC, rebuilt in bulk by ``PortfolioService.refresh`` on a
+    timer; never written by request handlers.
+    """
+
+    __tablename__ = "portfolio_metrics"
+    __table_args__ = (
+        Index("ix_portfolio_metrics_status", "status"),
+        Index("ix_portfolio_metrics_poc_end_date", "poc_end_date"),
+        Index(
+            "ix_portfolio_metrics_overdue",
+            "overdue_milestones",
+            postgresql_where="overdue_milestones > 0",
+        ),
+    )
+
+    poc_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("pocs.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    account_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    poc_start_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    poc_end_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    total_milestones: Mapped[int] = mapped_column(Integer, nullable=False)
+    completed_milestones: Mapped[int] = mapped_column(Integer, nullable=False)
+    overdue_milestones: Mapped[int] = mapped_column(Integer, nullable=False)
+    oldest_overdue_due_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    total_tasks: Mapped[int] = mapped_column(Integer, nullable=False)
+    completed_tasks: Mapped[int] = mapped_column(Integer, nullable=False)
+    in_progress_tasks: Mapped[int] = mapped_column(Integer, nullable=False)
+    milestones_pct: Mapped[float] = mapped_column(Float, nullable=False)
+    tasks_pct: Mapped[float] = mapped_column(Float, nullable=False)
+    overall_pct: Mapped[float] = mapped_column(Float, nullable=False)
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
@@ -8,4 +8,6 @@ from app.routers import (
     ai_analysis,
     docs_lookup,
     customer_portal,
+    portfolio,
+    templates,
 )
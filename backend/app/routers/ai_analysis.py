@@ -1,7 +1,14 @@
 import uuid
 from typing import Any, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+)
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -9,6 +16,8 @@ from app.database import get_db, SessionLocal
 from app.models.poc import POC, ValueFramework
 from app.models.gong import AIAnalysis, GongCall
 from app.schemas.gong import AIAnalysisResponse
+from app.services.change_tracking import not_modified, poc_etag
+from app.services.scoped_access import get_child_or_404
 
 router = APIRouter(prefix="/pocs/{poc_id}/ai", tags=["ai-analysis"])
 
@@ -27,14 +36,7 @@ def _get_poc_or_404(poc_id: uuid.UUID, db: Session) -> POC:
 def _get_analysis_or_404(
     poc_id: uuid.UUID, analysis_id: uuid.UUID, db: Session
 ) -> AIAnalysis:
-    analysis = (
-        db.query(AIAnalysis)
-        .filter(AIAnalysis.id == analysis_id, AIAnalysis.poc_id == poc_id)
-        .first()
-    )
-    if not analysis:
-        raise HTTPException(status_code=404, detail="Analysis not found")
-    return analysis
+    return get_child_or_404(db, AIAnalysis, poc_id, analysis_id, "Analysis")
 
 
 # ---------------------------------------------------------------------------
@@ -156,9 +158,17 @@ def trigger_analysis(
 
 
 @router.get("/analyses", response_model=list[AIAnalysisResponse])
-def list_analyses(poc_id: uuid.UUID, db: Session = Depends(get_db)):
+def list_analyses(
+    poc_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """List all AI analysis runs for a POC."""
-    _get_poc_or_404(poc_id, db)
+    poc = _get_poc_or_404(poc_id, db)
+    cached = not_modified(request, response, poc_etag(poc.version))
+    if cached:
+        return cached
     analyses = (
         db.query(AIAnalysis)
         .filter(AIAnalysis.poc_id == poc_id)
@@ -189,7 +199,6 @@ def apply_analysis(
     Apply extracted data from an analysis to the POC's value framework.
     Optionally accepts field overrides to selectively replace extracted values.
     """
-    poc = _get_poc_or_404(poc_id, db)
     analysis = _get_analysis_or_404(poc_id, analysis_id, db)
 
     if analysis.status != "completed":
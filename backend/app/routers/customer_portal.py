@@ -1,9 +1,11 @@
 import uuid
+from datetime import date
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.database import get_db
 from app.models.poc import POC, ValueFramework
@@ -26,6 +28,18 @@ from app.schemas.tech_stack import (
     TechStackEntryCreate,
     TechStackEntryResponse,
 )
+from app.services.change_stream import (
+    CUSTOMER_ENTITY_TYPES,
+    SSE_HEADERS,
+    change_events,
+)
+from app.services.change_tracking import not_modified, poc_etag
+from app.services.load_policy import load_options
+from app.services.ordering_service import next_sort_key
+from app.services.poc_service import POCService
+from app.services.scoped_access import flush_or_404, update_child_or_404
+from app.services.share_token_cache import ShareTokenEntry, get_share_token_cache
+from app.services.task_batch_service import batch_update_tasks
 
 router = APIRouter(prefix="/customer", tags=["customer-portal"])
 
@@ -34,19 +48,51 @@ router = APIRouter(prefix="/customer", tags=["customer-portal"])
 # Helpers
 # ---------------------------------------------------------------------------
 
+def resolve_share_token(share_token: str, db: Session) -> ShareTokenEntry:
+    """Map a share token to its POC id and status, or raise 404.
+
+    Served from the per-process share token cache; unknown tokens are cached
+    too, so repeated guesses do not reach the database.
+    """
+    cache = get_share_token_cache()
+    entry = cache.get(share_token)
+    if entry is None:
+        row = (
+            db.query(POC.id, POC.status)
+            .filter(POC.share_token == share_token)
+            .first()
+        )
+        if row is None:
+            cache.put_missing(share_token)
+            entry = False
+        else:
+            entry = ShareTokenEntry(row.id, row.status)
+            cache.put(share_token, entry)
+    if entry is False:
+        raise HTTPException(status_code=404, detail="POC not found")
+    return entry
+
+
 def get_poc_by_token(share_token: str, db: Session) -> POC:
-    poc = db.query(POC).filter(POC.share_token == share_token).first()
+    poc = db.get(POC, resolve_share_token(share_token, db).poc_id)
     if not poc:
+        get_share_token_cache().invalidate_token(share_token)
         raise HTTPException(status_code=404, detail="POC not found")
     return poc
 
 
-def _calculate_progress(db: Session, poc_id: uuid.UUID) -> POCProgress:
-    tasks = db.query(Task).filter(Task.poc_id == poc_id).all()
-    total = len(tasks)
-    completed = sum(1 for t in tasks if t.status == "completed")
-    pct = round((completed / total) * 100, 1) if total > 0 else 0.0
-    return POCProgress(total_tasks=total, completed_tasks=completed, completion_pct=pct)
+def _poc_version(poc_id: uuid.UUID, db: Session) -> int:
+    """Return the POC's change version (a primary-key lookup), or raise 404."""
+    version = db.query(POC.version).filter(POC.id == poc_id).scalar()
+    if version is None:
+        raise HTTPException(status_code=404, detail="POC not found")
+    return version
+
+
+def _calculate_progress(poc: POC) -> POCProgress:
+    """Return progress stats for a single POC from its denormalized counters."""
+    progress = POCService.progress_from_counters(poc)
+    return POCProgress(**progress, completion_pct=progress["tasks_pct"])
 
 
 # ---------------------------------------------------------------------------
@@ -63,6 +109,14 @@ class CustomerTaskUpdate(BaseModel):
     notes: Optional[str] = None
 
 
+class CustomerTaskBatchItem(CustomerTaskUpdate):
+    id: uuid.UUID
+
+
+class CustomerTaskBatchUpdate(BaseModel):
+    updates: list[CustomerTaskBatchItem] = Field(..., min_length=1, max_length=500)
+
+
 class CustomerCriterionUpdate(BaseModel):
     current_state: Optional[str] = None
     notes: Optional[str] = None
@@ -77,25 +131,126 @@ class GroupedTeamResponse(BaseModel):
     customer: list[TeamMemberResponse] = []
 
 
+# ---------------------------------------------------------------------------
+# Landing page bundle
+# ---------------------------------------------------------------------------
+
+class CustomerBundleResponse(BaseModel):
+    summary: POCSummary
+    value_framework: Optional[ValueFrameworkResponse] = None
+    milestones: list[MilestoneResponse] = []
+    phases: list[PhaseResponse] = []
+    success_criteria: list[SuccessCriterionResponse] = []
+    tech_stack: list[TechStackEntryResponse] = []
+    doc_links: list[DocLinkResponse] = []
+    team: GroupedTeamResponse
+
+
+@router.get("/{share_token}/bundle", response_model=CustomerBundleResponse)
+def get_customer_bundle(
+    share_token: str,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
+    """Everything the portal landing page shows, in one response.
+
+    The POC and its value framework are fetched in one query and each child
+    collection with one ``selectinload`` query, so the cost is fixed no
+    matter how many phases or tech stack entries the POC has.  Collections
+    are ordered the same way as their individual endpoints.
+    """
+    poc_id = resolve_share_token(share_token, db).poc_id
+    version = _poc_version(poc_id, db)
+    cached = not_modified(request, response, poc_etag(version, date.today()))
+    if cached:
+        return cached
+
+    poc = (
+        db.query(POC)
+        .options(
+            joinedload(POC.value_framework),
+            selectinload(POC.milestones),
+            selectinload(POC.phases).options(*load_options(PhaseResponse)),
+            selectinload(POC.success_criteria),
+            selectinload(POC.tech_stack_entries).options(
+                *load_options(TechStackEntryResponse)
+            ),
+            selectinload(POC.doc_links),
+            selectinload(POC.team_members),
+        )
+        .filter(POC.id == poc_id)
+        .one()
+    )
+
+    summary = POCSummary.model_validate(poc)
+    summary.progress = _calculate_progress(poc)
+
+    members = sorted(poc.team_members, key=lambda m: m.sort_order)
+    return CustomerBundleResponse(
+        summary=summary,
+        value_framework=poc.value_framework,
+        milestones=sorted(poc.milestones, key=lambda m: m.sort_order),
+        phases=sorted(poc.phases, key=lambda p: p.sort_order),
+        success_criteria=sorted(poc.success_criteria, key=lambda c: c.sort_order),
+        tech_stack=sorted(poc.tech_stack_entries, key=lambda e: (e.category, e.name)),
+        doc_links=sorted(poc.doc_links, key=lambda d: d.sort_order),
+        team=GroupedTeamResponse(
+            sentry=[m for m in members if m.team_side == "sentry"],
+            customer=[m for m in members if m.team_side == "customer"],
+        ),
+    )
+
+
+@router.get("/{share_token}/events")
+def stream_customer_events(
+    share_token: str, request: Request, db: Session = Depends(get_db)
+):
+    """Server-Sent Events stream of changes to the data the portal shows."""
+    poc_id = resolve_share_token(share_token, db).poc_id
+    db.close()
+    return StreamingResponse(
+        change_events(request, poc_id, CUSTOMER_ENTITY_TYPES),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
 # ---------------------------------------------------------------------------
 # POC Summary & Value Framework
 # ---------------------------------------------------------------------------
 
 @router.get("/{share_token}", response_model=POCSummary)
-def get_customer_poc_summary(share_token: str, db: Session = Depends(get_db)):
+def get_customer_poc_summary(
+    share_token: str,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """Get POC summary via share token."""
     poc = get_poc_by_token(share_token, db)
-    progress = _calculate_progress(db, poc.id)
+    cached = not_modified(request, response, poc_etag(poc.version, date.today()))
+    if cached:
+        return cached
+    progress = _calculate_progress(poc)
     summary = POCSummary.model_validate(poc)
     summary.progress = progress
     return summary
 
 
 @router.get("/{share_token}/value-framework", response_model=Optional[ValueFrameworkResponse])
-def get_customer_value_framework(share_token: str, db: Session = Depends(get_db)):
+def get_customer_value_framework(
+    share_token: str,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """Get the value framework for a POC."""
-    poc = get_poc_by_token(share_token, db)
-    vf = db.query(ValueFramework).filter(ValueFramework.poc_id == poc.id).first()
+    poc_id = resolve_share_token(share_token, db).poc_id
+    cached = not_modified(request, response, poc_etag(_poc_version(poc_id, db)))
+    if cached:
+        return cached
+    vf = db.query(ValueFramework).filter(ValueFramework.poc_id == poc_id).first()
     if not vf:
         return None
     return vf
@@ -106,12 +261,20 @@ def get_customer_value_framework(share_token: str, db: Session = Depends(get_db)
 # ---------------------------------------------------------------------------
 
 @router.get("/{share_token}/milestones", response_model=list[MilestoneResponse])
-def get_customer_milestones(share_token: str, db: Session = Depends(get_db)):
+def get_customer_milestones(
+    share_token: str,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """Get milestones for a POC."""
-    poc = get_poc_by_token(share_token, db)
+    poc_id = resolve_share_token(share_token, db).poc_id
+    cached = not_modified(request, response, poc_etag(_poc_version(poc_id, db)))
+    if cached:
+        return cached
     milestones = (
         db.query(Milestone)
-        .filter(Milestone.poc_id == poc.id)
+        .filter(Milestone.poc_id == poc_id)
         .order_by(Milestone.sort_order)
         .all()
     )
@@ -129,21 +292,20 @@ def update_customer_milestone(
     db: Session = Depends(get_db),
 ):
     """Update a milestone (limited to notes and status)."""
-    poc = get_poc_by_token(share_token, db)
-    milestone = (
-        db.query(Milestone)
-        .filter(Milestone.id == milestone_id, Milestone.poc_id == poc.id)
-        .first()
+    poc_id = resolve_share_token(share_token, db).poc_id
+    milestone = update_child_or_404(
+        db,
+        Milestone,
+        poc_id,
+        milestone_id,
+        payload.model_dump(exclude_unset=True),
+        "Milestone",
     )
-    if not milestone:
-        raise HTTPException(status_code=404, detail="Milestone not found")
-
-    update_data = payload.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(milestone, field, value)
-
+    if milestone.status != milestone.old_status:
+        POCService.adjust_milestone_counters(
+            db, poc_id, removed=[milestone.old_status], added=[milestone.status]
+        )
     db.commit()
-    db.refresh(milestone)
     return milestone
 
 
@@ -152,18 +314,47 @@ def update_customer_milestone(
 # ---------------------------------------------------------------------------
 
 @router.get("/{share_token}/phases", response_model=list[PhaseResponse])
-def get_customer_phases(share_token: str, db: Session = Depends(get_db)):
+def get_customer_phases(
+    share_token: str,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """Get phases with nested tasks."""
-    poc = get_poc_by_token(share_token, db)
+    poc_id = resolve_share_token(share_token, db).poc_id
+    cached = not_modified(request, response, poc_etag(_poc_version(poc_id, db)))
+    if cached:
+        return cached
     phases = (
         db.query(Phase)
-        .filter(Phase.poc_id == poc.id)
+        .options(*load_options(PhaseResponse))
+        .filter(Phase.poc_id == poc_id)
         .order_by(Phase.sort_order)
         .all()
     )
     return phases
 
 
+@router.patch(
+    "/{share_token}/tasks:batch",
+    response_model=list[TaskResponse],
+)
+def batch_update_customer_tasks(
+    share_token: str,
+    payload: CustomerTaskBatchUpdate,
+    db: Session = Depends(get_db),
+):
+    """Update status and/or notes of many tasks in one transaction."""
+    poc_id = resolve_share_token(share_token, db).poc_id
+    updates = [
+        item.model_dump(exclude_unset=True) | {"id": item.id}
+        for item in payload.updates
+    ]
+    tasks = batch_update_tasks(db, poc_id, updates)
+    db.commit()
+    return tasks
+
+
 @router.patch(
     "/{share_token}/tasks/{task_id}",
     response_model=TaskResponse,
@@ -175,21 +366,15 @@ def update_customer_task(
     db: Session = Depends(get_db),
 ):
     """Update a task (limited to status and notes)."""
-    poc = get_poc_by_token(share_token, db)
-    task = (
-        db.query(Task)
-        .filter(Task.id == task_id, Task.poc_id == poc.id)
-        .first()
+    poc_id = resolve_share_token(share_token, db).poc_id
+    task = update_child_or_404(
+        db, Task, poc_id, task_id, payload.model_dump(exclude_unset=True), "Task"
     )
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
-
-    update_data = payload.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(task, field, value)
-
+    if task.status != task.old_status:
+        POCService.adjust_task_counters(
+            db, poc_id, removed=[task.old_status], added=[task.status]
+        )
     db.commit()
-    db.refresh(task)
     return task
 
 
@@ -201,12 +386,20 @@ def update_customer_task(
     "/{share_token}/success-criteria",
     response_model=list[SuccessCriterionResponse],
 )
-def get_customer_success_criteria(share_token: str, db: Session = Depends(get_db)):
+def get_customer_success_criteria(
+    share_token: str,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """Get success criteria for a POC."""
-    poc = get_poc_by_token(share_token, db)
+    poc_id = resolve_share_token(share_token, db).poc_id
+    cached = not_modified(request, response, poc_etag(_poc_version(poc_id, db)))
+    if cached:
+        return cached
     criteria = (
         db.query(SuccessCriterion)
-        .filter(SuccessCriterion.poc_id == poc.id)
+        .filter(SuccessCriterion.poc_id == poc_id)
         .order_by(SuccessCriterion.sort_order)
         .all()
     )
@@ -224,21 +417,16 @@ def update_customer_criterion(
     db: Session = Depends(get_db),
 ):
     """Update a success criterion (limited to current_state and notes)."""
-    poc = get_poc_by_token(share_token, db)
-    criterion = (
-        db.query(SuccessCriterion)
-        .filter(SuccessCriterion.id == criterion_id, SuccessCriterion.poc_id == poc.id)
-        .first()
+    poc_id = resolve_share_token(share_token, db).poc_id
+    criterion = update_child_or_404(
+        db,
+        SuccessCriterion,
+        poc_id,
+        criterion_id,
+        payload.model_dump(exclude_unset=True),
+        "Success criterion",
     )
-    if not criterion:
-        raise HTTPException(status_code=404, detail="Success criterion not found")
-
-    update_data = payload.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(criterion, field, value)
-
     db.commit()
-    db.refresh(criterion)
     return criterion
 
 
@@ -247,12 +435,21 @@ def update_customer_criterion(
 # ---------------------------------------------------------------------------
 
 @router.get("/{share_token}/tech-stack", response_model=list[TechStackEntryResponse])
-def get_customer_tech_stack(share_token: str, db: Session = Depends(get_db)):
+def get_customer_tech_stack(
+    share_token: str,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """Get tech stack entries with doc links."""
-    poc = get_poc_by_token(share_token, db)
+    poc_id = resolve_share_token(share_token, db).poc_id
+    cached = not_modified(request, response, poc_etag(_poc_version(poc_id, db)))
+    if cached:
+        return cached
     entries = (
         db.query(TechStackEntry)
-        .filter(TechStackEntry.poc_id == poc.id)
+        .options(*load_options(TechStackEntryResponse))
+        .filter(TechStackEntry.poc_id == poc_id)
         .order_by(TechStackEntry.category, TechStackEntry.name)
         .all()
     )
@@ -270,18 +467,20 @@ def create_customer_tech_stack_entry(
     db: Session = Depends(get_db),
 ):
     """Add a tech stack entry (customer-facing)."""
-    poc = get_poc_by_token(share_token, db)
+    poc_id = resolve_share_token(share_token, db).poc_id
     entry = TechStackEntry(
-        poc_id=poc.id,
+        poc_id=poc_id,
         category=payload.category,
         name=payload.name,
         sentry_platform_key=payload.sentry_platform_key,
         confirmed_by_customer=payload.confirmed_by_customer,
+        doc_links=[],
     )
     db.add(entry)
+    flush_or_404(db)
+    created = TechStackEntryResponse.model_validate(entry)
     db.commit()
-    db.refresh(entry)
-    return entry
+    return created
 
 
 @router.patch(
@@ -294,19 +493,23 @@ def confirm_customer_tech_stack_entry(
     db: Session = Depends(get_db),
 ):
     """Confirm a tech stack entry."""
-    poc = get_poc_by_token(share_token, db)
-    entry = (
-        db.query(TechStackEntry)
-        .filter(TechStackEntry.id == entry_id, TechStackEntry.poc_id == poc.id)
-        .first()
+    poc_id = resolve_share_token(share_token, db).poc_id
+    entry = update_child_or_404(
+        db,
+        TechStackEntry,
+        poc_id,
+        entry_id,
+        {"confirmed_by_customer": True},
+        "Tech stack entry",
     )
-    if not entry:
-        raise HTTPException(status_code=404, detail="Tech stack entry not found")
-
-    entry.confirmed_by_customer = True
     db.commit()
-    db.refresh(entry)
-    return entry
+    doc_links = (
+        db.query(DocLink)
+        .filter(DocLink.tech_stack_entry_id == entry.id)
+        .order_by(DocLink.sort_order)
+        .all()
+    )
+    return {**entry._mapping, "doc_links": doc_links}
 
 
 # ---------------------------------------------------------------------------
@@ -314,12 +517,20 @@ def confirm_customer_tech_stack_entry(
 # ---------------------------------------------------------------------------
 
 @router.get("/{share_token}/doc-links", response_model=list[DocLinkResponse])
-def get_customer_doc_links(share_token: str, db: Session = Depends(get_db)):
+def get_customer_doc_links(
+    share_token: str,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """Get generated doc links for a POC."""
-    poc = get_poc_by_token(share_token, db)
+    poc_id = resolve_share_token(share_token, db).poc_id
+    cached = not_modified(request, response, poc_etag(_poc_version(poc_id, db)))
+    if cached:
+        return cached
     links = (
         db.query(DocLink)
-        .filter(DocLink.poc_id == poc.id)
+        .filter(DocLink.poc_id == poc_id)
         .order_by(DocLink.sort_order)
         .all()
     )
@@ -331,12 +542,20 @@ def get_customer_doc_links(share_token: str, db: Session = Depends(get_db)):
 # ---------------------------------------------------------------------------
 
 @router.get("/{share_token}/team", response_model=GroupedTeamResponse)
-def get_customer_team(share_token: str, db: Session = Depends(get_db)):
+def get_customer_team(
+    share_token: str,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """Get the team roster grouped by side."""
-    poc = get_poc_by_token(share_token, db)
+    poc_id = resolve_share_token(share_token, db).poc_id
+    cached = not_modified(request, response, poc_etag(_poc_version(poc_id, db)))
+    if cached:
+        return cached
     members = (
         db.query(TeamMember)
-        .filter(TeamMember.poc_id == poc.id)
+        .filter(TeamMember.poc_id == poc_id)
         .order_by(TeamMember.sort_order)
         .all()
     )
@@ -361,17 +580,22 @@ def create_customer_team_member(
     db: Session = Depends(get_db),
 ):
     """Add a customer team member. team_side is forced to 'customer'."""
-    poc = get_poc_by_token(share_token, db)
+    poc_id = resolve_share_token(share_token, db).poc_id
     member = TeamMember(
-        poc_id=poc.id,
+        poc_id=poc_id,
         team_side="customer",  # forced
         name=payload.name,
         role=payload.role,
         email=payload.email,
         is_primary_contact=payload.is_primary_contact,
-        sort_order=payload.sort_order or 0,
+        sort_order=(
+            payload.sort_order
+            if payload.sort_order is not None
+            else next_sort_key(db, TeamMember, poc_id=poc_id, team_side="customer")
+        ),
     )
     db.add(member)
+    flush_or_404(db)
+    created = TeamMemberResponse.model_validate(member)
     db.commit()
-    db.refresh(member)
-    return member
+    return created
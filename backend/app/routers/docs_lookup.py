@@ -1,6 +1,7 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -13,6 +14,18 @@ from app.schemas.tech_stack import (
     TechStackEntryUpdate,
     DocLinkResponse,
 )
+from app.services.change_tracking import (
+    Change,
+    not_modified,
+    poc_etag,
+    record_changes,
+)
+from app.services.load_policy import load_options
+from app.services.scoped_access import (
+    flush_or_404,
+    get_child_or_404,
+    update_child_or_404,
+)
 
 router = APIRouter(prefix="/pocs/{poc_id}", tags=["docs-lookup"])
 
@@ -29,16 +42,11 @@ def _get_poc_or_404(poc_id: uuid.UUID, db: Session) -> POC:
 
 
 def _get_entry_or_404(
-    poc_id: uuid.UUID, entry_id: uuid.UUID, db: Session
+    poc_id: uuid.UUID, entry_id: uuid.UUID, db: Session, *options
 ) -> TechStackEntry:
-    entry = (
-        db.query(TechStackEntry)
-        .filter(TechStackEntry.id == entry_id, TechStackEntry.poc_id == poc_id)
-        .first()
+    return get_child_or_404(
+        db, TechStackEntry, poc_id, entry_id, "Tech stack entry", *options
     )
-    if not entry:
-        raise HTTPException(status_code=404, detail="Tech stack entry not found")
-    return entry
 
 
 # ---------------------------------------------------------------------------
@@ -46,11 +54,20 @@ def _get_entry_or_404(
 # ---------------------------------------------------------------------------
 
 @router.get("/tech-stack", response_model=list[TechStackEntryResponse])
-def list_tech_stack(poc_id: uuid.UUID, db: Session = Depends(get_db)):
+def list_tech_stack(
+    poc_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """List all tech stack entries with their associated doc links."""
-    _get_poc_or_404(poc_id, db)
+    poc = _get_poc_or_404(poc_id, db)
+    cached = not_modified(request, response, poc_etag(poc.version))
+    if cached:
+        return cached
     entries = (
         db.query(TechStackEntry)
+        .options(*load_options(TechStackEntryResponse))
         .filter(TechStackEntry.poc_id == poc_id)
         .order_by(TechStackEntry.category, TechStackEntry.name)
         .all()
@@ -65,18 +82,19 @@ def create_tech_stack_entry(
     db: Session = Depends(get_db),
 ):
     """Add a tech stack entry to a POC."""
-    _get_poc_or_404(poc_id, db)
     entry = TechStackEntry(
         poc_id=poc_id,
         category=payload.category,
         name=payload.name,
         sentry_platform_key=payload.sentry_platform_key,
         confirmed_by_customer=payload.confirmed_by_customer,
+        doc_links=[],
     )
     db.add(entry)
+    flush_or_404(db)
+    created = TechStackEntryResponse.model_validate(entry)
     db.commit()
-    db.refresh(entry)
-    return entry
+    return created
 
 
 @router.delete("/tech-stack/{entry_id}", status_code=204)
@@ -86,7 +104,9 @@ def delete_tech_stack_entry(
     db: Session = Depends(get_db),
 ):
     """Remove a tech stack entry (and its associated doc links via cascade)."""
-    entry = _get_entry_or_404(poc_id, entry_id, db)
+    entry = _get_entry_or_404(
+        poc_id, entry_id, db, *load_options(TechStackEntryResponse)
+    )
     db.delete(entry)
     db.commit()
     return None
@@ -102,11 +122,22 @@ def confirm_tech_stack_entry(
     db: Session = Depends(get_db),
 ):
     """Confirm a tech stack entry (set confirmed_by_customer to True)."""
-    entry = _get_entry_or_404(poc_id, entry_id, db)
-    entry.confirmed_by_customer = True
+    entry = update_child_or_404(
+        db,
+        TechStackEntry,
+        poc_id,
+        entry_id,
+        {"confirmed_by_customer": True},
+        "Tech stack entry",
+    )
     db.commit()
-    db.refresh(entry)
-    return entry
+    doc_links = (
+        db.query(DocLink)
+        .filter(DocLink.tech_stack_entry_id == entry.id)
+        .order_by(DocLink.sort_order)
+        .all()
+    )
+    return {**entry._mapping, "doc_links": doc_links}
 
 
 # ---------------------------------------------------------------------------
@@ -157,7 +188,12 @@ def generate_doc_links(poc_id: uuid.UUID, db: Session = Depends(get_db)):
         )
 
     # Clear existing generated doc links for this POC before inserting new ones
-    db.query(DocLink).filter(DocLink.poc_id == poc_id).delete()
+    removed = db.execute(
+        delete(DocLink).where(DocLink.poc_id == poc_id).returning(DocLink.id)
+    ).scalars().all()
+    record_changes(
+        db, (Change(poc_id, "doc_link", link_id, "delete") for link_id in removed)
+    )
     db.flush()
 
     results: list[DocLink] = []
@@ -182,9 +218,17 @@ def generate_doc_links(poc_id: uuid.UUID, db: Session = Depends(get_db)):
 
 
 @router.get("/doc-links", response_model=list[DocLinkResponse])
-def list_doc_links(poc_id: uuid.UUID, db: Session = Depends(get_db)):
+def list_doc_links(
+    poc_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """Get all generated doc links for a POC."""
-    _get_poc_or_404(poc_id, db)
+    poc = _get_poc_or_404(poc_id, db)
+    cached = not_modified(request, response, poc_etag(poc.version))
+    if cached:
+        return cached
     links = (
         db.query(DocLink)
         .filter(DocLink.poc_id == poc_id)
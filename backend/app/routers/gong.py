@@ -1,15 +1,21 @@
 import uuid
-from datetime import date
+from datetime import date, datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from anyio import from_thread
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+from app.config import get_settings
 from app.database import get_db
 from app.models.poc import POC
 from app.models.gong import GongCall
 from app.schemas.gong import GongCallResponse
+from app.services.change_tracking import not_modified, poc_etag
+from app.services.gong_index import last_synced_at, search_index
+from app.services.gong_service import SYNC_OVERLAP, GongService, get_gong_service
+from app.services.scoped_access import get_child_or_404, update_child_or_404
 
 router = APIRouter(prefix="/pocs/{poc_id}/gong", tags=["gong"])
 
@@ -25,6 +31,53 @@ def _get_poc_or_404(poc_id: uuid.UUID, db: Session) -> POC:
     return poc
 
 
+def _gong_datetime(day: date | None, end_of_day: bool = False) -> str | None:
+    """Format a request date as a Gong ``fromDateTime``/``toDateTime``."""
+    if day is None:
+        return None
+    return f"{day.isoformat()}T{'23:59:59' if end_of_day else '00:00:00'}Z"
+
+
+def _parse_started(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _merge_calls(db: Session, poc: POC, calls_data: list[dict]) -> list[GongCall]:
+    """Upsert search results into ``gong_calls``, commit, and return all of
+    the POC's calls, newest first (as ``GET /calls`` lists them).
+
+    One query finds the calls already stored.
+    """
+    existing = {
+        call.gong_call_id: call
+        for call in db.query(GongCall).filter(
+            GongCall.gong_call_id.in_({c["gong_call_id"] for c in calls_data})
+        )
+    }
+    for call_data in calls_data:
+        call = existing.get(call_data["gong_call_id"])
+        if call is None:
+            call = GongCall(poc_id=poc.id, gong_call_id=call_data["gong_call_id"])
+            db.add(call)
+            existing[call.gong_call_id] = call
+        call.title = call_data.get("title", call.title)
+        call.started_at = _parse_started(call_data.get("started")) or call.started_at
+        call.duration_seconds = call_data.get(
+            "duration_seconds", call.duration_seconds
+        )
+        call.participant_emails = call_data.get(
+            "participant_emails", call.participant_emails
+        )
+
+    db.commit()
+    return (
+        db.query(GongCall)
+        .filter(GongCall.poc_id == poc.id)
+        .order_by(GongCall.started_at.desc().nullslast())
+        .all()
+    )
+
+
 # ---------------------------------------------------------------------------
 # Request models
 # ---------------------------------------------------------------------------
@@ -33,6 +86,8 @@ class SearchCallsRequest(BaseModel):
     account_domain: str
     date_from: Optional[date] = None
     date_to: Optional[date] = None
+    # Ignore the POC's last-sync mark and search the whole history
+    full_sync: bool = False
 
 
 class ToggleSelectedRequest(BaseModel):
@@ -48,70 +103,65 @@ def search_gong_calls(
     poc_id: uuid.UUID,
     payload: SearchCallsRequest,
     db: Session = Depends(get_db),
+    gong: GongService = Depends(get_gong_service),
 ):
     """
-    Search for Gong calls by account domain. Calls gong_service.search_calls()
-    to fetch from the Gong API, then upserts results into the database.
+    Search for Gong calls by account domain. Calls GongService.search_calls()
+    to fetch from the Gong API, then merges the results into the database.
+
+    Once the org-wide call index (``app.services.gong_index``) has synced,
+    the search is a local indexed query and does not call Gong.  Otherwise,
+    without ``date_from`` (and unless ``full_sync`` is set), only calls newer
+    than the POC's last sync of the same domain, minus ``SYNC_OVERLAP``, are
+    requested.  A search that reaches the present and starts no later than
+    the last sync moves the high-water mark to the time the search started.
+    Returns all of the POC's calls, including those found by earlier searches.
     """
     poc = _get_poc_or_404(poc_id, db)
+    domain = payload.account_domain.lower().strip()
 
-    # Import the gong service; if not yet implemented, handle gracefully
-    try:
-        from app.services import gong_service
-    except (ImportError, AttributeError):
-        raise HTTPException(
-            status_code=501,
-            detail="Gong service is not yet implemented",
-        )
+    if get_settings().gong_index_sync_interval_seconds > 0 and last_synced_at(db):
+        calls_data = search_index(db, domain, payload.date_from, payload.date_to)
+        return _merge_calls(db, poc, calls_data)
 
-    calls_data = gong_service.search_calls(
-        account_domain=payload.account_domain,
-        date_from=payload.date_from,
-        date_to=payload.date_to,
-    )
+    started = datetime.now(timezone.utc)
+    last_synced = None
+    if not payload.full_sync and poc.gong_synced_domain == domain:
+        last_synced = poc.gong_last_synced_at
+    date_from = _gong_datetime(payload.date_from)
+    if date_from is None and last_synced is not None:
+        date_from = (last_synced - SYNC_OVERLAP).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-    results: list[GongCall] = []
-    for call_data in calls_data:
-        # Upsert: check if call already exists by gong_call_id
-        existing = (
-            db.query(GongCall)
-            .filter(GongCall.gong_call_id == call_data["gong_call_id"])
-            .first()
-        )
-        if existing:
-            # Update fields
-            existing.title = call_data.get("title", existing.title)
-            existing.started_at = call_data.get("started_at", existing.started_at)
-            existing.duration_seconds = call_data.get(
-                "duration_seconds", existing.duration_seconds
-            )
-            existing.participant_emails = call_data.get(
-                "participant_emails", existing.participant_emails
-            )
-            results.append(existing)
-        else:
-            gong_call = GongCall(
-                poc_id=poc.id,
-                gong_call_id=call_data["gong_call_id"],
-                title=call_data.get("title"),
-                started_at=call_data.get("started_at"),
-                duration_seconds=call_data.get("duration_seconds"),
-                participant_emails=call_data.get("participant_emails"),
-            )
-            db.add(gong_call)
-            results.append(gong_call)
-
-    db.commit()
-    for r in results:
-        db.refresh(r)
+    # The service's pooled client lives on the event loop; this endpoint runs
+    # in the threadpool so the database work below does not block the loop.
+    calls_data = from_thread.run(
+        gong.search_calls,
+        domain,
+        date_from,
+        _gong_datetime(payload.date_to, end_of_day=True),
+    )
 
-    return results
+    covers_gap = payload.date_from is None or (
+        last_synced is not None and payload.date_from <= last_synced.date()
+    )
+    if payload.date_to is None and covers_gap:
+        poc.gong_last_synced_at = started
+        poc.gong_synced_domain = domain
+    return _merge_calls(db, poc, calls_data)
 
 
 @router.get("/calls", response_model=list[GongCallResponse])
-def list_gong_calls(poc_id: uuid.UUID, db: Session = Depends(get_db)):
+def list_gong_calls(
+    poc_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """List all cached Gong calls for this POC."""
-    _get_poc_or_404(poc_id, db)
+    poc = _get_poc_or_404(poc_id, db)
+    cached = not_modified(request, response, poc_etag(poc.version))
+    if cached:
+        return cached
     calls = (
         db.query(GongCall)
         .filter(GongCall.poc_id == poc_id)
@@ -129,34 +179,67 @@ def fetch_transcript(
     poc_id: uuid.UUID,
     gong_call_id: uuid.UUID,
     db: Session = Depends(get_db),
+    gong: GongService = Depends(get_gong_service),
 ):
-    """Fetch the transcript for a specific Gong call via gong_service."""
-    _get_poc_or_404(poc_id, db)
-    call = (
-        db.query(GongCall)
-        .filter(GongCall.id == gong_call_id, GongCall.poc_id == poc_id)
-        .first()
-    )
-    if not call:
-        raise HTTPException(status_code=404, detail="Gong call not found")
+    """Fetch the transcript for a specific Gong call via GongService."""
+    call = get_child_or_404(db, GongCall, poc_id, gong_call_id, "Gong call")
 
-    try:
-        from app.services import gong_service
-    except (ImportError, AttributeError):
-        raise HTTPException(
-            status_code=501,
-            detail="Gong service is not yet implemented",
-        )
-
-    transcript_data = gong_service.fetch_transcript(call.gong_call_id)
-    call.transcript_text = transcript_data.get("transcript_text")
-    call.transcript_fetched_at = transcript_data.get("fetched_at")
+    call.transcript_text = from_thread.run(gong.fetch_transcript, call.gong_call_id)
+    call.transcript_fetched_at = datetime.now(timezone.utc)
 
     db.commit()
     db.refresh(call)
     return call
 
 
+@router.post("/fetch-transcripts", response_model=list[GongCallResponse])
+def fetch_missing_transcripts(
+    poc_id: uuid.UUID,
+    db: Session = Depends(get_db),
+    gong: GongService = Depends(get_gong_service),
+):
+    """Fetch every missing transcript of the POC's Gong calls in one go.
+
+    Transcripts are requested in batches (see
+    ``GongService.fetch_transcripts``) and saved in one transaction; if Gong
+    fails part way, the transcripts received so far are still saved before
+    the error is returned.  Returns the calls that were updated.
+    """
+    _get_poc_or_404(poc_id, db)
+    calls = {
+        call.gong_call_id: call
+        for call in db.query(GongCall).filter(
+            GongCall.poc_id == poc_id, GongCall.transcript_text.is_(None)
+        )
+    }
+    if not calls:
+        return []
+
+    fetched_at = datetime.now(timezone.utc)
+    updated: list[uuid.UUID] = []
+    stream = gong.fetch_transcripts(list(calls))
+    try:
+        while True:
+            try:
+                gong_call_id, text = from_thread.run(stream.__anext__)
+            except StopAsyncIteration:
+                break
+            call = calls[gong_call_id]
+            call.transcript_text = text
+            call.transcript_fetched_at = fetched_at
+            updated.append(call.id)
+    finally:
+        from_thread.run(stream.aclose)
+        db.commit()
+
+    return (
+        db.query(GongCall)
+        .filter(GongCall.id.in_(updated))
+        .order_by(GongCall.started_at.desc().nullslast())
+        .all()
+    )
+
+
 @router.patch(
     "/calls/{gong_call_id}/select",
     response_model=GongCallResponse,
@@ -168,16 +251,13 @@ def toggle_call_selection(
     db: Session = Depends(get_db),
 ):
     """Toggle whether a Gong call is selected for AI analysis."""
-    _get_poc_or_404(poc_id, db)
-    call = (
-        db.query(GongCall)
-        .filter(GongCall.id == gong_call_id, GongCall.poc_id == poc_id)
-        .first()
+    call = update_child_or_404(
+        db,
+        GongCall,
+        poc_id,
+        gong_call_id,
+        {"selected_for_analysis": payload.selected_for_analysis},
+        "Gong call",
     )
-    if not call:
-        raise HTTPException(status_code=404, detail="Gong call not found")
-
-    call.selected_for_analysis = payload.selected_for_analysis
     db.commit()
-    db.refresh(call)
     return call
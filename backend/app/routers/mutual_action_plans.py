@@ -1,7 +1,7 @@
 import uuid
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -13,6 +13,16 @@ from app.schemas.mutual_action_plan import (
     MilestoneResponse,
     MilestoneUpdate,
 )
+from app.schemas.ordering import MoveRequest
+from app.services.change_tracking import not_modified, poc_etag
+from app.services.ordering_service import SORT_GAP, move_item, next_sort_key
+from app.services.poc_service import POCService
+from app.services.scoped_access import (
+    delete_child_or_404,
+    flush_or_404,
+    get_child_or_404,
+    update_child_or_404,
+)
 
 router = APIRouter(prefix="/pocs/{poc_id}/milestones", tags=["milestones"])
 
@@ -31,14 +41,7 @@ def _get_poc_or_404(poc_id: uuid.UUID, db: Session) -> POC:
 def _get_milestone_or_404(
     poc_id: uuid.UUID, milestone_id: uuid.UUID, db: Session
 ) -> Milestone:
-    milestone = (
-        db.query(Milestone)
-        .filter(Milestone.id == milestone_id, Milestone.poc_id == poc_id)
-        .first()
-    )
-    if not milestone:
-        raise HTTPException(status_code=404, detail="Milestone not found")
-    return milestone
+    return get_child_or_404(db, Milestone, poc_id, milestone_id, "Milestone")
 
 
 # ---------------------------------------------------------------------------
@@ -54,9 +57,17 @@ class ReorderRequest(BaseModel):
 # ---------------------------------------------------------------------------
 
 @router.get("", response_model=list[MilestoneResponse])
-def list_milestones(poc_id: uuid.UUID, db: Session = Depends(get_db)):
+def list_milestones(
+    poc_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """List all milestones for a POC, ordered by sort_order."""
-    _get_poc_or_404(poc_id, db)
+    poc = _get_poc_or_404(poc_id, db)
+    cached = not_modified(request, response, poc_etag(poc.version))
+    if cached:
+        return cached
     milestones = (
         db.query(Milestone)
         .filter(Milestone.poc_id == poc_id)
@@ -73,7 +84,6 @@ def create_milestone(
     db: Session = Depends(get_db),
 ):
     """Create a new milestone for a POC."""
-    _get_poc_or_404(poc_id, db)
     milestone = Milestone(
         poc_id=poc_id,
         title=payload.title,
@@ -81,44 +91,20 @@ def create_milestone(
         description=payload.description,
         notes=payload.notes,
         status=payload.status or "not_started",
-        sort_order=payload.sort_order or 0,
+        sort_order=(
+            payload.sort_order
+            if payload.sort_order is not None
+            else next_sort_key(db, Milestone, poc_id=poc_id)
+        ),
     )
     db.add(milestone)
+    # Flush first: the counter UPDATE would autoflush the insert and raise
+    # the missing-POC foreign key error outside ``flush_or_404``.
+    flush_or_404(db)
+    POCService.adjust_milestone_counters(db, poc_id, added=[milestone.status])
+    created = MilestoneResponse.model_validate(milestone)
     db.commit()
-    db.refresh(milestone)
-    return milestone
-
-
-@router.patch("/{milestone_id}", response_model=MilestoneResponse)
-def update_milestone(
-    poc_id: uuid.UUID,
-    milestone_id: uuid.UUID,
-    payload: MilestoneUpdate,
-    db: Session = Depends(get_db),
-):
-    """Update a milestone."""
-    milestone = _get_milestone_or_404(poc_id, milestone_id, db)
-
-    update_data = payload.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(milestone, field, value)
-
-    db.commit()
-    db.refresh(milestone)
-    return milestone
-
-
-@router.delete("/{milestone_id}", status_code=204)
-def delete_milestone(
-    poc_id: uuid.UUID,
-    milestone_id: uuid.UUID,
-    db: Session = Depends(get_db),
-):
-    """Delete a milestone."""
-    milestone = _get_milestone_or_404(poc_id, milestone_id, db)
-    db.delete(milestone)
-    db.commit()
-    return None
+    return created
 
 
 @router.patch("/reorder", response_model=list[MilestoneResponse])
@@ -127,20 +113,26 @@ def reorder_milestones(
     payload: ReorderRequest,
     db: Session = Depends(get_db),
 ):
-    """Reorder milestones by providing an ordered list of milestone IDs."""
+    """Reorder milestones by providing an ordered list of milestone IDs.
+
+    Writes evenly spaced sort keys and skips milestones already in place;
+    to move a single milestone prefer ``POST /{milestone_id}/move``.
+    """
     _get_poc_or_404(poc_id, db)
     milestones = (
         db.query(Milestone).filter(Milestone.poc_id == poc_id).all()
     )
     milestone_map = {m.id: m for m in milestones}
 
-    for idx, mid in enumerate(payload.ordered_ids):
+    for idx, mid in enumerate(payload.ordered_ids, start=1):
         if mid not in milestone_map:
             raise HTTPException(
                 status_code=400,
                 detail=f"Milestone {mid} not found in this POC",
             )
-        milestone_map[mid].sort_order = idx
+        key = idx * SORT_GAP
+        if milestone_map[mid].sort_order != key:
+            milestone_map[mid].sort_order = key
 
     db.commit()
 
@@ -151,3 +143,55 @@ def reorder_milestones(
         .all()
     )
     return updated
+
+
+@router.patch("/{milestone_id}", response_model=MilestoneResponse)
+def update_milestone(
+    poc_id: uuid.UUID,
+    milestone_id: uuid.UUID,
+    payload: MilestoneUpdate,
+    db: Session = Depends(get_db),
+):
+    """Update a milestone."""
+    milestone = update_child_or_404(
+        db,
+        Milestone,
+        poc_id,
+        milestone_id,
+        payload.model_dump(exclude_unset=True),
+        "Milestone",
+    )
+    if milestone.status != milestone.old_status:
+        POCService.adjust_milestone_counters(
+            db, poc_id, removed=[milestone.old_status], added=[milestone.status]
+        )
+    db.commit()
+    return milestone
+
+
+@router.delete("/{milestone_id}", status_code=204)
+def delete_milestone(
+    poc_id: uuid.UUID,
+    milestone_id: uuid.UUID,
+    db: Session = Depends(get_db),
+):
+    """Delete a milestone."""
+    milestone = delete_child_or_404(db, Milestone, poc_id, milestone_id, "Milestone")
+    POCService.adjust_milestone_counters(db, poc_id, removed=[milestone.status])
+    db.commit()
+    return None
+
+
+@router.post("/{milestone_id}/move", response_model=MilestoneResponse)
+def move_milestone(
+    poc_id: uuid.UUID,
+    milestone_id: uuid.UUID,
+    payload: MoveRequest,
+    db: Session = Depends(get_db),
+):
+    """Move a milestone directly after ``after_id`` (first if null)."""
+    milestone = _get_milestone_or_404(poc_id, milestone_id, db)
+    move_item(db, Milestone, milestone, payload.after_id)
+    db.commit()
+    db.refresh(milestone)
+    return milestone
@@ -1,6 +1,6 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -10,10 +10,23 @@ from app.schemas.phase import (
     PhaseCreate,
     PhaseResponse,
     PhaseUpdate,
+    TaskBatchUpdate,
     TaskCreate,
     TaskResponse,
     TaskUpdate,
 )
+from app.schemas.ordering import MoveRequest, TaskMoveRequest
+from app.services.change_tracking import not_modified, poc_etag
+from app.services.load_policy import load_options
+from app.services.ordering_service import move_item, next_sort_key
+from app.services.poc_service import POCService
+from app.services.scoped_access import (
+    delete_child_or_404,
+    flush_or_404,
+    get_child_or_404,
+    update_child_or_404,
+)
+from app.services.task_batch_service import batch_update_tasks
 
 router = APIRouter(prefix="/pocs/{poc_id}", tags=["phases"])
 
@@ -29,26 +42,14 @@ def _get_poc_or_404(poc_id: uuid.UUID, db: Session) -> POC:
     return poc
 
 
-def _get_phase_or_404(poc_id: uuid.UUID, phase_id: uuid.UUID, db: Session) -> Phase:
-    phase = (
-        db.query(Phase)
-        .filter(Phase.id == phase_id, Phase.poc_id == poc_id)
-        .first()
-    )
-    if not phase:
-        raise HTTPException(status_code=404, detail="Phase not found")
-    return phase
+def _get_phase_or_404(
+    poc_id: uuid.UUID, phase_id: uuid.UUID, db: Session, *options
+) -> Phase:
+    return get_child_or_404(db, Phase, poc_id, phase_id, "Phase", *options)
 
 
 def _get_task_or_404(poc_id: uuid.UUID, task_id: uuid.UUID, db: Session) -> Task:
-    task = (
-        db.query(Task)
-        .filter(Task.id == task_id, Task.poc_id == poc_id)
-        .first()
-    )
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
-    return task
+    return get_child_or_404(db, Task, poc_id, task_id, "Task")
 
 
 # ---------------------------------------------------------------------------
@@ -56,11 +57,20 @@ def _get_task_or_404(poc_id: uuid.UUID, task_id: uuid.UUID, db: Session) -> Task
 # ---------------------------------------------------------------------------
 
 @router.get("/phases", response_model=list[PhaseResponse])
-def list_phases(poc_id: uuid.UUID, db: Session = Depends(get_db)):
+def list_phases(
+    poc_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """List phases with nested tasks, ordered by sort_order."""
-    _get_poc_or_404(poc_id, db)
+    poc = _get_poc_or_404(poc_id, db)
+    cached = not_modified(request, response, poc_etag(poc.version))
+    if cached:
+        return cached
     phases = (
         db.query(Phase)
+        .options(*load_options(PhaseResponse))
         .filter(Phase.poc_id == poc_id)
         .order_by(Phase.sort_order)
         .all()
@@ -75,17 +85,22 @@ def create_phase(
     db: Session = Depends(get_db),
 ):
     """Create a new phase for a POC."""
-    _get_poc_or_404(poc_id, db)
     phase = Phase(
         poc_id=poc_id,
         name=payload.name,
         description=payload.description,
-        sort_order=payload.sort_order or 0,
+        sort_order=(
+            payload.sort_order
+            if payload.sort_order is not None
+            else next_sort_key(db, Phase, poc_id=poc_id)
+        ),
+        tasks=[],
     )
     db.add(phase)
+    flush_or_404(db)
+    created = PhaseResponse.model_validate(phase)
     db.commit()
-    db.refresh(phase)
-    return phase
+    return created
 
 
 @router.patch("/phases/{phase_id}", response_model=PhaseResponse)
@@ -96,15 +111,17 @@ def update_phase(
     db: Session = Depends(get_db),
 ):
     """Update a phase."""
-    phase = _get_phase_or_404(poc_id, phase_id, db)
-
-    update_data = payload.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(phase, field, value)
-
+    phase = update_child_or_404(
+        db, Phase, poc_id, phase_id, payload.model_dump(exclude_unset=True), "Phase"
+    )
     db.commit()
-    db.refresh(phase)
-    return phase
+    tasks = (
+        db.query(Task)
+        .filter(Task.phase_id == phase.id)
+        .order_by(Task.sort_order)
+        .all()
+    )
+    return {**phase._mapping, "tasks": tasks}
 
 
 @router.delete("/phases/{phase_id}", status_code=204)
@@ -114,12 +131,30 @@ def delete_phase(
     db: Session = Depends(get_db),
 ):
     """Delete a phase and all its tasks (cascade)."""
-    phase = _get_phase_or_404(poc_id, phase_id, db)
+    phase = _get_phase_or_404(poc_id, phase_id, db, *load_options(PhaseResponse))
+    POCService.adjust_task_counters(
+        db, poc_id, removed=[t.status for t in phase.tasks]
+    )
     db.delete(phase)
     db.commit()
     return None
 
 
+@router.post("/phases/{phase_id}/move", response_model=PhaseResponse)
+def move_phase(
+    poc_id: uuid.UUID,
+    phase_id: uuid.UUID,
+    payload: MoveRequest,
+    db: Session = Depends(get_db),
+):
+    """Move a phase directly after ``after_id`` (first if null)."""
+    phase = _get_phase_or_404(poc_id, phase_id, db)
+    move_item(db, Phase, phase, payload.after_id)
+    db.commit()
+    db.refresh(phase)
+    return phase
+
+
 # ---------------------------------------------------------------------------
 # Task endpoints
 # ---------------------------------------------------------------------------
@@ -134,7 +169,6 @@ def create_task(
     db: Session = Depends(get_db),
 ):
     """Create a task in a specific phase."""
-    _get_poc_or_404(poc_id, db)
     _get_phase_or_404(poc_id, phase_id, db)
 
     task = Task(
@@ -148,12 +182,39 @@ def create_task(
         status=payload.status or "not_started",
         notes=payload.notes,
         is_optional=payload.is_optional,
-        sort_order=payload.sort_order or 0,
+        sort_order=(
+            payload.sort_order
+            if payload.sort_order is not None
+            else next_sort_key(db, Task, poc_id=poc_id, phase_id=phase_id)
+        ),
     )
     db.add(task)
+    POCService.adjust_task_counters(db, poc_id, added=[task.status])
+    db.flush()
+    created = TaskResponse.model_validate(task)
     db.commit()
-    db.refresh(task)
-    return task
+    return created
+
+
+@router.patch("/tasks:batch", response_model=list[TaskResponse])
+def batch_update(
+    poc_id: uuid.UUID,
+    payload: TaskBatchUpdate,
+    db: Session = Depends(get_db),
+):
+    """Apply partial updates to many tasks at once (e.g. complete a phase or
+    reassign an owner) in one statement and one transaction.
+
+    All-or-nothing: an unknown task or phase id fails the whole batch.
+    Returns the updated tasks in request order.
+    """
+    updates = [
+        item.model_dump(exclude_unset=True) | {"id": item.id}
+        for item in payload.updates
+    ]
+    tasks = batch_update_tasks(db, poc_id, updates)
+    db.commit()
+    return tasks
 
 
 @router.patch("/tasks/{task_id}", response_model=TaskResponse)
@@ -164,14 +225,14 @@ def update_task(
     db: Session = Depends(get_db),
 ):
     """Update a task (status, owner, date, notes, etc.)."""
-    task = _get_task_or_404(poc_id, task_id, db)
-
-    update_data = payload.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(task, field, value)
-
+    task = update_child_or_404(
+        db, Task, poc_id, task_id, payload.model_dump(exclude_unset=True), "Task"
+    )
+    if task.status != task.old_status:
+        POCService.adjust_task_counters(
+            db, poc_id, removed=[task.old_status], added=[task.status]
+        )
     db.commit()
-    db.refresh(task)
     return task
 
 
@@ -182,7 +243,26 @@ def delete_task(
     db: Session = Depends(get_db),
 ):
     """Delete a task."""
-    task = _get_task_or_404(poc_id, task_id, db)
-    db.delete(task)
+    task = delete_child_or_404(db, Task, poc_id, task_id, "Task")
+    POCService.adjust_task_counters(db, poc_id, removed=[task.status])
     db.commit()
     return None
+
+
+@router.post("/tasks/{task_id}/move", response_model=TaskResponse)
+def move_task(
+    poc_id: uuid.UUID,
+    task_id: uuid.UUID,
+    payload: TaskMoveRequest,
+    db: Session = Depends(get_db),
+):
+    """Move a task directly after ``after_id`` (first if null), optionally
+    into another phase given by ``phase_id``."""
+    task = _get_task_or_404(poc_id, task_id, db)
+    scope = {}
+    if payload.phase_id is not None and payload.phase_id != task.phase_id:
+        scope["phase_id"] = _get_phase_or_404(poc_id, payload.phase_id, db).id
+    move_item(db, Task, task, payload.after_id, **scope)
+    db.commit()
+    db.refresh(task)
+    return task
@@ -1,45 +1,109 @@
+import base64
+import binascii
 import json
 import secrets
 import uuid
-from pathlib import Path
-from typing import Optional
+from datetime import date, datetime
+from typing import Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, literal_column, tuple_
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.models.poc import POC, ValueFramework
-from app.models.mutual_action_plan import Milestone
-from app.models.phase import Phase, Task
-from app.models.success_criteria import SuccessCriterion
+from app.models.poc import END_DATE_SORT_SQL, POC
 from app.schemas.poc import (
+    BulkPOCCreateRequest,
+    BulkPOCCreateResponse,
+    POCCloneRequest,
     POCCreate,
     POCProgress,
+    POCProgressDetail,
     POCResponse,
     POCSummary,
     POCUpdate,
 )
+from app.schemas.batch import BatchRequest, BatchResponse
+from app.schemas.sync import POCChangesResponse
+from app.services.batch_service import run_batch
+from app.services.bulk_import_service import (
+    MAX_BULK_ROWS,
+    bulk_create_pocs,
+    parse_csv,
+)
+from app.services.change_stream import SSE_HEADERS, change_events
+from app.services.change_tracking import not_modified, poc_etag
+from app.services.clone_service import clone_poc
+from app.services.delta_sync import changes_since
+from app.services.load_policy import load_options
+from app.services.poc_service import POCService
+from app.services.share_token_cache import get_share_token_cache
+from app.services.template_service import get_template_registry, instantiate_template
 
 router = APIRouter(prefix="/pocs", tags=["pocs"])
 
-DATA_DIR = Path(__file__).parent.parent / "data"
+# Page size bounds for GET /pocs.
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Response header carrying the opaque cursor for the next page.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Sort key expressions for the list endpoint, each backed by an
+# ``(expression, id)`` index on ``pocs``.
+SORT_KEYS = {
+    "created_at": POC.created_at,
+    "progress": POC.completion_pct,
+    "end_date": literal_column(END_DATE_SORT_SQL),
+    "account_name": POC.account_name,
+}
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _calculate_progress(db: Session, poc_id: uuid.UUID) -> POCProgress:
-    """Return progress stats for a single POC based on task completion."""
-    tasks = db.query(Task).filter(Task.poc_id == poc_id).all()
-    total = len(tasks)
-    completed = sum(1 for t in tasks if t.status == "completed")
-    pct = round((completed / total) * 100, 1) if total > 0 else 0.0
-    return POCProgress(total_tasks=total, completed_tasks=completed, completion_pct=pct)
-
-
-def _get_poc_or_404(poc_id: uuid.UUID, db: Session) -> POC:
-    poc = db.query(POC).filter(POC.id == poc_id).first()
+def _calculate_progress(poc: POC) -> POCProgress:
+    """Return progress stats for a single POC from its denormalized counters."""
+    progress = POCService.progress_from_counters(poc)
+    return POCProgress(**progress, completion_pct=progress["tasks_pct"])
+
+
+def _encode_cursor(sort_by: str, poc: POC) -> str:
+    """Encode the sort key and id of the last row on a page as a cursor."""
+    if sort_by == "created_at":
+        key = poc.created_at.isoformat()
+    elif sort_by == "progress":
+        key = poc.completion_pct
+    elif sort_by == "end_date":
+        key = (poc.poc_end_date or date(9999, 12, 31)).isoformat()
+    else:
+        key = poc.account_name
+    raw = json.dumps({"s": sort_by, "k": key, "id": str(poc.id)})
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str, sort_by: str) -> tuple:
+    """Decode a cursor from :func:`_encode_cursor` into ``(key, id)``."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if data["s"] != sort_by:
+            raise ValueError("cursor was issued for a different sort")
+        key = data["k"]
+        if sort_by == "created_at":
+            key = datetime.fromisoformat(key)
+        elif sort_by == "progress":
+            key = float(key)
+        elif sort_by == "end_date":
+            key = date.fromisoformat(key)
+        return key, uuid.UUID(data["id"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _get_poc_or_404(poc_id: uuid.UUID, db: Session, *options) -> POC:
+    poc = db.query(POC).options(*options).filter(POC.id == poc_id).first()
     if not poc:
         raise HTTPException(status_code=404, detail="POC not found")
     return poc
@@ -51,118 +115,266 @@ def _get_poc_or_404(poc_id: uuid.UUID, db: Session) -> POC:
 
 @router.get("", response_model=list[POCSummary])
 def list_pocs(
+    response: Response,
     status: Optional[str] = Query(None, description="Filter by POC status"),
+    account_domain: Optional[str] = Query(
+        None, description="Filter by account domain (case-insensitive)"
+    ),
+    created_from: Optional[datetime] = Query(None, description="Created at or after"),
+    created_to: Optional[datetime] = Query(None, description="Created before"),
+    end_date_from: Optional[date] = Query(None, description="POC ends on or after"),
+    end_date_to: Optional[date] = Query(None, description="POC ends on or before"),
+    min_progress: Optional[float] = Query(None, ge=0, le=100),
+    max_progress: Optional[float] = Query(None, ge=0, le=100),
+    sort_by: Literal["created_at", "progress", "end_date", "account_name"] = Query(
+        "created_at"
+    ),
+    sort_dir: Literal["asc", "desc"] = Query("desc"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(
+        None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header"
+    ),
     db: Session = Depends(get_db),
 ):
-    """List all POCs with optional status filter. Returns lightweight summaries."""
+    """List POCs as lightweight summaries, one keyset-paginated page at a time.
+
+    Results are ordered by ``sort_by`` with ``id`` as a tie-breaker.  When more
+    rows remain, the cursor for the next page is returned in the
+    ``X-Next-Cursor`` response header.
+    """
     query = db.query(POC)
     if status:
         query = query.filter(POC.status == status)
-    pocs = query.order_by(POC.created_at.desc()).all()
+    if account_domain:
+        query = query.filter(
+            func.lower(POC.account_domain) == account_domain.strip().lower()
+        )
+    if created_from:
+        query = query.filter(POC.created_at >= created_from)
+    if created_to:
+        query = query.filter(POC.created_at < created_to)
+    if end_date_from:
+        query = query.filter(POC.poc_end_date >= end_date_from)
+    if end_date_to:
+        query = query.filter(POC.poc_end_date <= end_date_to)
+    if min_progress is not None:
+        query = query.filter(POC.completion_pct >= min_progress)
+    if max_progress is not None:
+        query = query.filter(POC.completion_pct <= max_progress)
+
+    sort_key = SORT_KEYS[sort_by]
+    if cursor:
+        last_key, last_id = _decode_cursor(cursor, sort_by)
+        position = tuple_(sort_key, POC.id)
+        if sort_dir == "desc":
+            query = query.filter(position < tuple_(last_key, last_id))
+        else:
+            query = query.filter(position > tuple_(last_key, last_id))
+
+    if sort_dir == "desc":
+        query = query.order_by(sort_key.desc(), POC.id.desc())
+    else:
+        query = query.order_by(sort_key.asc(), POC.id.asc())
+
+    # Fetch one extra row to learn whether another page exists.
+    pocs = query.limit(limit + 1).all()
+    if len(pocs) > limit:
+        pocs = pocs[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(sort_by, pocs[-1])
 
     results: list[POCSummary] = []
     for poc in pocs:
-        progress = _calculate_progress(db, poc.id)
         summary = POCSummary.model_validate(poc)
-        summary.progress = progress
+        summary.progress = _calculate_progress(poc)
         results.append(summary)
     return results
 
 
 @router.post("", response_model=POCResponse, status_code=201)
 def create_poc(payload: POCCreate, db: Session = Depends(get_db)):
-    """Create a new POC with default milestones, phases/tasks, and success criteria."""
-    poc = POC(
-        account_name=payload.account_name,
-        account_domain=payload.account_domain,
-        opportunity_name=payload.opportunity_name,
-        poc_start_date=payload.poc_start_date,
-        poc_end_date=payload.poc_end_date,
-        notes=payload.notes,
-        share_token=secrets.token_urlsafe(32),
-        status="draft",
-    )
+    """Create a new POC with milestones, phases/tasks, and success criteria
+    from the requested template (``default`` unless specified)."""
+    template = get_template_registry().get(payload.template)
+    if template is None:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown POC template '{payload.template}'"
+        )
+
+    poc = POCService.build_poc(payload)
     db.add(poc)
-    db.flush()  # assigns poc.id
-
-    # Create empty ValueFramework
-    vf = ValueFramework(poc_id=poc.id)
-    db.add(vf)
-
-    # Load and create default milestones
-    milestones_path = DATA_DIR / "default_milestones.json"
-    if milestones_path.exists():
-        milestones_data = json.loads(milestones_path.read_text())
-        for m in milestones_data:
-            milestone = Milestone(
-                poc_id=poc.id,
-                title=m["title"],
-                description=m.get("description", ""),
-                sort_order=m.get("sort_order", 0),
-            )
-            db.add(milestone)
-
-    # Load and create default success criteria
-    criteria_path = DATA_DIR / "default_success_criteria.json"
-    if criteria_path.exists():
-        criteria_data = json.loads(criteria_path.read_text())
-        for c in criteria_data:
-            criterion = SuccessCriterion(
-                poc_id=poc.id,
-                feature=c["feature"],
-                priority=c.get("priority"),
-                criteria=c.get("criteria"),
-                current_state=c.get("current_state"),
-                notes=c.get("notes"),
-                sort_order=c.get("sort_order", 0),
-            )
-            db.add(criterion)
-
-    # Load and create default phases with tasks
-    phases_path = DATA_DIR / "default_phases.json"
-    if phases_path.exists():
-        phases_data = json.loads(phases_path.read_text())
-        for p in phases_data:
-            phase = Phase(
-                poc_id=poc.id,
-                name=p["title"],
-                description=p.get("description", ""),
-                sort_order=p.get("phase_number", 0),
-            )
-            db.add(phase)
-            db.flush()  # assigns phase.id
-
-            for t in p.get("tasks", []):
-                task = Task(
-                    poc_id=poc.id,
-                    phase_id=phase.id,
-                    title=t["title"],
-                    resource_url=t.get("resource_url"),
-                    resource_label=t.get("resource_label"),
-                    is_optional=t.get("is_optional", False),
-                    sort_order=t.get("sort_order", 0),
-                )
-                db.add(task)
+    instantiate_template(db, poc, template)
 
     db.commit()
     db.refresh(poc)
 
-    progress = _calculate_progress(db, poc.id)
+    progress = _calculate_progress(poc)
     response = POCResponse.model_validate(poc)
     response.progress = progress
     return response
 
 
+def _check_bulk_size(rows: list) -> None:
+    if len(rows) > MAX_BULK_ROWS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {MAX_BULK_ROWS} accounts can be imported at once",
+        )
+
+
+async def _read_csv_body(request: Request) -> str:
+    """Return the raw request body decoded as UTF-8 CSV text."""
+    try:
+        return (await request.body()).decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="CSV body must be UTF-8")
+
+
+@router.post("/bulk", response_model=BulkPOCCreateResponse, status_code=201)
+def bulk_create(payload: BulkPOCCreateRequest, db: Session = Depends(get_db)):
+    """Create POCs for a list of accounts in chunked, set-based inserts.
+
+    Rows that fail validation or insertion are reported in ``errors`` by
+    their position; the remaining rows are still created.
+    """
+    _check_bulk_size(payload.accounts)
+    return bulk_create_pocs(db, payload.accounts, default_template=payload.template)
+
+
+@router.post("/bulk/csv", response_model=BulkPOCCreateResponse, status_code=201)
+def bulk_create_csv(
+    template: Optional[str] = Query(None, max_length=100),
+    body: str = Depends(_read_csv_body),
+    db: Session = Depends(get_db),
+):
+    """Same as ``POST /pocs/bulk`` but takes a ``text/csv`` body whose header
+    row names the ``POCCreate`` fields. Row numbers exclude the header."""
+    rows = parse_csv(body)
+    _check_bulk_size(rows)
+    return bulk_create_pocs(db, rows, default_template=template)
+
+
 @router.get("/{poc_id}", response_model=POCResponse)
-def get_poc(poc_id: uuid.UUID, db: Session = Depends(get_db)):
+def get_poc(
+    poc_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """Get full POC details including value_framework and progress."""
-    poc = _get_poc_or_404(poc_id, db)
-    progress = _calculate_progress(db, poc.id)
+    poc = _get_poc_or_404(poc_id, db, *load_options(POCResponse))
+    # days_remaining/days_elapsed change daily, so the date is part of the tag.
+    cached = not_modified(request, response, poc_etag(poc.version, date.today()))
+    if cached:
+        return cached
+    result = POCResponse.model_validate(poc)
+    result.progress = _calculate_progress(poc)
+    return result
+
+
+@router.post("/{poc_id}/clone", response_model=POCResponse, status_code=201)
+def clone(
+    poc_id: uuid.UUID,
+    payload: Optional[POCCloneRequest] = None,
+    db: Session = Depends(get_db),
+):
+    """Deep-copy a POC's plan (milestones, phases, tasks, success criteria,
+    team and tech stack) into a new draft POC, in a single statement."""
+    new_id = clone_poc(db, poc_id, payload or POCCloneRequest())
+    if new_id is None:
+        raise HTTPException(status_code=404, detail="POC not found")
+    db.commit()
+
+    poc = db.get(POC, new_id)
     response = POCResponse.model_validate(poc)
-    response.progress = progress
+    response.progress = _calculate_progress(poc)
     return response
 
 
+@router.get("/{poc_id}/progress", response_model=POCProgressDetail)
+def get_poc_progress(
+    poc_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
+    """Full progress breakdown: weighted score, per-phase numbers and dates."""
+    version = db.query(POC.version).filter(POC.id == poc_id).scalar()
+    if version is None:
+        raise HTTPException(status_code=404, detail="POC not found")
+    cached = not_modified(request, response, poc_etag(version, date.today()))
+    if cached:
+        return cached
+    progress = POCService.calculate_progress_sql(db, poc_id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail="POC not found")
+    return progress
+
+
+@router.get("/{poc_id}/changes", response_model=POCChangesResponse)
+def get_poc_changes(
+    poc_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    since: int = Query(0, ge=0, description="POC version from the previous sync"),
+    db: Session = Depends(get_db),
+):
+    """Milestones, phases, tasks, criteria, team, tech stack and doc links
+    upserted or deleted since POC version ``since``.
+
+    Send the returned ``version`` as the next ``since``.  ``since=0`` returns
+    the full plan; an up-to-date cursor returns an empty delta (or a 304).
+    """
+    version = db.query(POC.version).filter(POC.id == poc_id).scalar()
+    if version is None:
+        raise HTTPException(status_code=404, detail="POC not found")
+    if since > version:
+        raise HTTPException(
+            status_code=400, detail=f"Cursor {since} is ahead of POC version {version}"
+        )
+    cached = not_modified(request, response, poc_etag(version, "changes", since))
+    if cached:
+        return cached
+    return changes_since(db, poc_id, version, since)
+
+
+@router.post("/{poc_id}/batch", response_model=BatchResponse)
+def apply_batch(
+    poc_id: uuid.UUID, payload: BatchRequest, db: Session = Depends(get_db)
+):
+    """Apply an ordered list of create/update/delete operations on the POC's
+    milestones, phases, tasks, success criteria, team and tech stack in one
+    transaction.
+
+    All-or-nothing: the first failing operation aborts the batch and its
+    ``index`` is returned in the error detail.
+    """
+    if db.query(POC.id).filter(POC.id == poc_id).scalar() is None:
+        raise HTTPException(status_code=404, detail="POC not found")
+    results = run_batch(db, poc_id, payload.operations)
+    version = db.query(POC.version).filter(POC.id == poc_id).scalar()
+    return {"version": version, "results": results}
+
+
+@router.get("/{poc_id}/events")
+def stream_poc_events(
+    poc_id: uuid.UUID, request: Request, db: Session = Depends(get_db)
+):
+    """Server-Sent Events stream of entity-level changes to this POC.
+
+    Each ``change`` event carries ``entity_type``, ``entity_id``, ``op`` and
+    the resulting POC ``version``; clients refetch only what changed.
+    """
+    _get_poc_or_404(poc_id, db)
+    # The stream polls with its own short-lived sessions; don't hold this
+    # request's connection for the lifetime of the stream.
+    db.close()
+    return StreamingResponse(
+        change_events(request, poc_id),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
 @router.patch("/{poc_id}", response_model=POCResponse)
 def update_poc(poc_id: uuid.UUID, payload: POCUpdate, db: Session = Depends(get_db)):
     """Update POC fields (status, dates, notes, account_name, etc.)."""
@@ -173,9 +385,10 @@ def update_poc(poc_id: uuid.UUID, payload: POCUpdate, db: Session = Depends(get_
         setattr(poc, field, value)
 
     db.commit()
+    get_share_token_cache().invalidate_poc(poc.id)
     db.refresh(poc)
 
-    progress = _calculate_progress(db, poc.id)
+    progress = _calculate_progress(poc)
     response = POCResponse.model_validate(poc)
     response.progress = progress
     return response
@@ -187,9 +400,30 @@ def delete_poc(poc_id: uuid.UUID, db: Session = Depends(get_db)):
     poc = _get_poc_or_404(poc_id, db)
     poc.status = "archived"
     db.commit()
+    get_share_token_cache().invalidate_poc(poc.id)
+    db.refresh(poc)
+
+    progress = _calculate_progress(poc)
+    response = POCResponse.model_validate(poc)
+    response.progress = progress
+    return response
+
+
+@router.post("/{poc_id}/share-token", response_model=POCResponse)
+def rotate_share_token(poc_id: uuid.UUID, db: Session = Depends(get_db)):
+    """Issue a new customer share token; the old portal link stops working."""
+    poc = _get_poc_or_404(poc_id, db)
+    old_token = poc.share_token
+    poc.share_token = secrets.token_urlsafe(32)
+    db.commit()
+
+    cache = get_share_token_cache()
+    cache.invalidate_poc(poc.id)
+    cache.invalidate_token(old_token)
+    cache.invalidate_token(poc.share_token)
     db.refresh(poc)
 
-    progress = _calculate_progress(db, poc.id)
+    progress = _calculate_progress(poc)
     response = POCResponse.model_validate(poc)
     response.progress = progress
     return response
@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.schemas.portfolio import PortfolioDashboard
+from app.services.portfolio_service import PortfolioService
+
+router = APIRouter(prefix="/portfolio", tags=["portfolio"])
+
+
+# ---------------------------------------------------------------------------
+# Endpoints
+# ---------------------------------------------------------------------------
+
+@router.get("", response_model=PortfolioDashboard)
+def get_portfolio(
+    ending_within_days: int = Query(14, ge=0, le=365),
+    low_completion_pct: float = Query(50.0, ge=0, le=100),
+    db: Session = Depends(get_db),
+):
+    """
+    Portfolio health across all POCs: counts by status, active POCs ending
+    soon with low completion, and active POCs with overdue milestones.
+    Served from the periodically refreshed ``portfolio_metrics`` table.
+    """
+    return PortfolioService.get_dashboard(
+        db,
+        ending_within_days=ending_within_days,
+        low_completion_pct=low_completion_pct,
+    )
+
+
+@router.post("/refresh", response_model=PortfolioDashboard)
+def refresh_portfolio(
+    ending_within_days: int = Query(14, ge=0, le=365),
+    low_completion_pct: float = Query(50.0, ge=0, le=100),
+    db: Session = Depends(get_db),
+):
+    """Recompute the portfolio metrics now instead of waiting for the timer."""
+    if PortfolioService.refresh(db) is None:
+        raise HTTPException(
+            status_code=409,
+            detail="A portfolio refresh is already running",
+        )
+    return PortfolioService.get_dashboard(
+        db,
+        ending_within_days=ending_within_days,
+        low_completion_pct=low_completion_pct,
+    )
@@ -1,6 +1,6 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -11,6 +11,15 @@ from app.schemas.success_criteria import (
     SuccessCriterionResponse,
     SuccessCriterionUpdate,
 )
+from app.schemas.ordering import MoveRequest
+from app.services.change_tracking import not_modified, poc_etag
+from app.services.ordering_service import move_item, next_sort_key
+from app.services.scoped_access import (
+    delete_child_or_404,
+    flush_or_404,
+    get_child_or_404,
+    update_child_or_404,
+)
 
 router = APIRouter(prefix="/pocs/{poc_id}/success-criteria", tags=["success-criteria"])
 
@@ -29,14 +38,9 @@ def _get_poc_or_404(poc_id: uuid.UUID, db: Session) -> POC:
 def _get_criterion_or_404(
     poc_id: uuid.UUID, criterion_id: uuid.UUID, db: Session
 ) -> SuccessCriterion:
-    criterion = (
-        db.query(SuccessCriterion)
-        .filter(SuccessCriterion.id == criterion_id, SuccessCriterion.poc_id == poc_id)
-        .first()
+    return get_child_or_404(
+        db, SuccessCriterion, poc_id, criterion_id, "Success criterion"
     )
-    if not criterion:
-        raise HTTPException(status_code=404, detail="Success criterion not found")
-    return criterion
 
 
 # ---------------------------------------------------------------------------
@@ -44,9 +48,17 @@ def _get_criterion_or_404(
 # ---------------------------------------------------------------------------
 
 @router.get("", response_model=list[SuccessCriterionResponse])
-def list_success_criteria(poc_id: uuid.UUID, db: Session = Depends(get_db)):
+def list_success_criteria(
+    poc_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """List all success criteria for a POC, ordered by sort_order."""
-    _get_poc_or_404(poc_id, db)
+    poc = _get_poc_or_404(poc_id, db)
+    cached = not_modified(request, response, poc_etag(poc.version))
+    if cached:
+        return cached
     criteria = (
         db.query(SuccessCriterion)
         .filter(SuccessCriterion.poc_id == poc_id)
@@ -63,7 +75,6 @@ def create_success_criterion(
     db: Session = Depends(get_db),
 ):
     """Create a new success criterion for a POC."""
-    _get_poc_or_404(poc_id, db)
     criterion = SuccessCriterion(
         poc_id=poc_id,
         feature=payload.feature,
@@ -71,12 +82,17 @@ def create_success_criterion(
         criteria=payload.criteria,
         current_state=payload.current_state,
         notes=payload.notes,
-        sort_order=payload.sort_order or 0,
+        sort_order=(
+            payload.sort_order
+            if payload.sort_order is not None
+            else next_sort_key(db, SuccessCriterion, poc_id=poc_id)
+        ),
     )
     db.add(criterion)
+    flush_or_404(db)
+    created = SuccessCriterionResponse.model_validate(criterion)
     db.commit()
-    db.refresh(criterion)
-    return criterion
+    return created
 
 
 @router.patch("/{criterion_id}", response_model=SuccessCriterionResponse)
@@ -87,14 +103,15 @@ def update_success_criterion(
     db: Session = Depends(get_db),
 ):
     """Update a success criterion."""
-    criterion = _get_criterion_or_404(poc_id, criterion_id, db)
-
-    update_data = payload.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(criterion, field, value)
-
+    criterion = update_child_or_404(
+        db,
+        SuccessCriterion,
+        poc_id,
+        criterion_id,
+        payload.model_dump(exclude_unset=True),
+        "Success criterion",
+    )
     db.commit()
-    db.refresh(criterion)
     return criterion
 
 
@@ -105,7 +122,23 @@ def delete_success_criterion(
     db: Session = Depends(get_db),
 ):
     """Delete a success criterion."""
-    criterion = _get_criterion_or_404(poc_id, criterion_id, db)
-    db.delete(criterion)
+    delete_child_or_404(
+        db, SuccessCriterion, poc_id, criterion_id, "Success criterion"
+    )
     db.commit()
     return None
+
+
+@router.post("/{criterion_id}/move", response_model=SuccessCriterionResponse)
+def move_success_criterion(
+    poc_id: uuid.UUID,
+    criterion_id: uuid.UUID,
+    payload: MoveRequest,
+    db: Session = Depends(get_db),
+):
+    """Move a success criterion directly after ``after_id`` (first if null)."""
+    criterion = _get_criterion_or_404(poc_id, criterion_id, db)
+    move_item(db, SuccessCriterion, criterion, payload.after_id)
+    db.commit()
+    db.refresh(criterion)
+    return criterion
@@ -1,6 +1,6 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -11,6 +11,15 @@ from app.schemas.team_member import (
     TeamMemberResponse,
     TeamMemberUpdate,
 )
+from app.schemas.ordering import MoveRequest
+from app.services.change_tracking import not_modified, poc_etag
+from app.services.ordering_service import move_item, next_sort_key
+from app.services.scoped_access import (
+    delete_child_or_404,
+    flush_or_404,
+    get_child_or_404,
+    update_child_or_404,
+)
 
 router = APIRouter(prefix="/pocs/{poc_id}/team", tags=["team-members"])
 
@@ -29,14 +38,7 @@ def _get_poc_or_404(poc_id: uuid.UUID, db: Session) -> POC:
 def _get_member_or_404(
     poc_id: uuid.UUID, member_id: uuid.UUID, db: Session
 ) -> TeamMember:
-    member = (
-        db.query(TeamMember)
-        .filter(TeamMember.id == member_id, TeamMember.poc_id == poc_id)
-        .first()
-    )
-    if not member:
-        raise HTTPException(status_code=404, detail="Team member not found")
-    return member
+    return get_child_or_404(db, TeamMember, poc_id, member_id, "Team member")
 
 
 # ---------------------------------------------------------------------------
@@ -56,9 +58,17 @@ class GroupedTeamResponse(BaseModel):
 # ---------------------------------------------------------------------------
 
 @router.get("", response_model=GroupedTeamResponse)
-def list_team_members(poc_id: uuid.UUID, db: Session = Depends(get_db)):
+def list_team_members(
+    poc_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """List all team members grouped by team_side (sentry / customer)."""
-    _get_poc_or_404(poc_id, db)
+    poc = _get_poc_or_404(poc_id, db)
+    cached = not_modified(request, response, poc_etag(poc.version))
+    if cached:
+        return cached
     members = (
         db.query(TeamMember)
         .filter(TeamMember.poc_id == poc_id)
@@ -82,7 +92,6 @@ def create_team_member(
     db: Session = Depends(get_db),
 ):
     """Add a team member to a POC."""
-    _get_poc_or_404(poc_id, db)
     member = TeamMember(
         poc_id=poc_id,
         team_side=payload.team_side,
@@ -90,12 +99,19 @@ def create_team_member(
         role=payload.role,
         email=payload.email,
         is_primary_contact=payload.is_primary_contact,
-        sort_order=payload.sort_order or 0,
+        sort_order=(
+            payload.sort_order
+            if payload.sort_order is not None
+            else next_sort_key(
+                db, TeamMember, poc_id=poc_id, team_side=payload.team_side
+            )
+        ),
     )
     db.add(member)
+    flush_or_404(db)
+    created = TeamMemberResponse.model_validate(member)
     db.commit()
-    db.refresh(member)
-    return member
+    return created
 
 
 @router.patch("/{member_id}", response_model=TeamMemberResponse)
@@ -106,14 +122,15 @@ def update_team_member(
     db: Session = Depends(get_db),
 ):
     """Update a team member."""
-    member = _get_member_or_404(poc_id, member_id, db)
-
-    update_data = payload.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(member, field, value)
-
+    member = update_child_or_404(
+        db,
+        TeamMember,
+        poc_id,
+        member_id,
+        payload.model_dump(exclude_unset=True),
+        "Team member",
+    )
     db.commit()
-    db.refresh(member)
     return member
 
 
@@ -124,7 +141,22 @@ def delete_team_member(
     db: Session = Depends(get_db),
 ):
     """Remove a team member from a POC."""
-    member = _get_member_or_404(poc_id, member_id, db)
-    db.delete(member)
+    delete_child_or_404(db, TeamMember, poc_id, member_id, "Team member")
     db.commit()
     return None
+
+
+@router.post("/{member_id}/move", response_model=TeamMemberResponse)
+def move_team_member(
+    poc_id: uuid.UUID,
+    member_id: uuid.UUID,
+    payload: MoveRequest,
+    db: Session = Depends(get_db),
+):
+    """Move a team member directly after ``after_id`` on the same side
+    (first if null)."""
+    member = _get_member_or_404(poc_id, member_id, db)
+    move_item(db, TeamMember, member, payload.after_id)
+    db.commit()
+    db.refresh(member)
+    return member
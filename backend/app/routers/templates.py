@@ -0,0 +1,27 @@
+from fastapi import APIRouter
+
+from app.schemas.poc import POCTemplateSummary
+from app.services.template_service import get_template_registry
+
+router = APIRouter(prefix="/templates", tags=["templates"])
+
+
+# ---------------------------------------------------------------------------
+# Endpoints
+# ---------------------------------------------------------------------------
+
+@router.get("", response_model=list[POCTemplateSummary])
+def list_templates():
+    """List the POC templates available to ``POST /pocs``, with their versions."""
+    return [
+        POCTemplateSummary(
+            name=t.name,
+            version=t.version,
+            description=t.description,
+            milestone_count=len(t.milestones),
+            success_criteria_count=len(t.success_criteria),
+            phase_count=len(t.phases),
+            task_count=t.task_count,
+        )
+        for t in get_template_registry().all_templates()
+    ]
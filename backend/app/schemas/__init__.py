@@ -1,10 +1,18 @@
 from app.schemas.poc import (
     POCBase,
     POCCreate,
+    POCCloneRequest,
     POCUpdate,
     POCResponse,
     POCSummary,
     POCProgress,
+    POCProgressDetail,
+    PhaseProgress,
+    POCTemplateSummary,
+    BulkPOCCreateRequest,
+    BulkPOCCreated,
+    BulkPOCError,
+    BulkPOCCreateResponse,
     ValueFrameworkBase,
     ValueFrameworkCreate,
     ValueFrameworkUpdate,
@@ -24,6 +32,8 @@ from app.schemas.phase import (
     TaskBase,
     TaskCreate,
     TaskUpdate,
+    TaskBatchUpdateItem,
+    TaskBatchUpdate,
     TaskResponse,
 )
 from app.schemas.success_criteria import (
@@ -58,15 +68,39 @@ from app.schemas.tech_stack import (
     DocLinkUpdate,
     DocLinkResponse,
 )
+from app.schemas.batch import (
+    BatchOperation,
+    BatchRequest,
+    BatchOperationResult,
+    BatchResponse,
+)
+from app.schemas.ordering import MoveRequest, TaskMoveRequest
+from app.schemas.sync import (
+    PhaseRecord,
+    DeletedEntities,
+    POCChangesResponse,
+)
+from app.schemas.portfolio import (
+    PortfolioPOC,
+    PortfolioDashboard,
+)
 
 __all__ = [
     # POC
     "POCBase",
     "POCCreate",
+    "POCCloneRequest",
     "POCUpdate",
     "POCResponse",
     "POCSummary",
     "POCProgress",
+    "POCProgressDetail",
+    "PhaseProgress",
+    "POCTemplateSummary",
+    "BulkPOCCreateRequest",
+    "BulkPOCCreated",
+    "BulkPOCError",
+    "BulkPOCCreateResponse",
     # ValueFramework
     "ValueFrameworkBase",
     "ValueFrameworkCreate",
@@ -85,6 +119,8 @@ __all__ = [
     "TaskBase",
     "TaskCreate",
     "TaskUpdate",
+    "TaskBatchUpdateItem",
+    "TaskBatchUpdate",
     "TaskResponse",
     # SuccessCriterion
     "SuccessCriterionBase",
@@ -114,4 +150,19 @@ __all__ = [
     "DocLinkCreate",
     "DocLinkUpdate",
     "DocLinkResponse",
+    # Batch
+    "BatchOperation",
+    "BatchRequest",
+    "BatchOperationResult",
+    "BatchResponse",
+    # Ordering
+    "MoveRequest",
+    "TaskMoveRequest",
+    # Delta sync
+    "PhaseRecord",
+    "DeletedEntities",
+    "POCChangesResponse",
+    # Portfolio
+    "PortfolioPOC",
+    "PortfolioDashboard",
 ]
@@ -0,0 +1,49 @@
+import uuid
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+BatchEntity = Literal[
+    "milestone",
+    "phase",
+    "task",
+    "success_criterion",
+    "team_member",
+    "tech_stack_entry",
+]
+
+
+class BatchOperation(BaseModel):
+    """One step of ``POST /pocs/{id}/batch``.
+
+    ``create`` takes the entity's create fields in ``data`` and may name the
+    new row with ``ref``; ``update`` (partial ``data``) and ``delete`` target
+    ``id``.  Later steps can write ``"$<ref>"`` wherever an id is expected,
+    e.g. ``{"phase_id": "$discovery"}`` for a task in a phase created earlier
+    in the same batch.
+    """
+    op: Literal["create", "update", "delete"]
+    entity: BatchEntity
+    id: Optional[str] = None
+    ref: Optional[str] = Field(None, max_length=100)
+    data: dict[str, Any] = {}
+
+
+class BatchRequest(BaseModel):
+    operations: list[BatchOperation] = Field(..., min_length=1, max_length=200)
+
+
+class BatchOperationResult(BaseModel):
+    index: int
+    op: str
+    entity: str
+    id: uuid.UUID
+    # The entity after the batch; null for deletes.
+    data: Optional[dict[str, Any]] = None
+
+
+class BatchResponse(BaseModel):
+    """Per-operation results, in request order, and the POC version after
+    the batch committed (usable as a delta sync cursor)."""
+    version: int
+    results: list[BatchOperationResult]
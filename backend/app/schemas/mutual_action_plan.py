@@ -19,7 +19,7 @@ class MilestoneBase(BaseModel):
 class MilestoneCreate(MilestoneBase):
     """Required: title. Everything else is optional."""
     status: Optional[str] = Field("not_started", max_length=50)
-    sort_order: Optional[int] = 0
+    sort_order: Optional[int] = None  # None: append after the last sibling
 
 
 class MilestoneUpdate(BaseModel):
@@ -0,0 +1,16 @@
+import uuid
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class MoveRequest(BaseModel):
+    """Drag-and-drop move: place the item directly after ``after_id``, or
+    first when ``after_id`` is null."""
+    after_id: Optional[uuid.UUID] = None
+
+
+class TaskMoveRequest(MoveRequest):
+    """``phase_id`` moves the task into another phase of the same POC;
+    ``after_id`` then refers to a task of that phase."""
+    phase_id: Optional[uuid.UUID] = None
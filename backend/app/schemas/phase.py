@@ -23,7 +23,7 @@ class TaskCreate(TaskBase):
     """Required: title. phase_id is typically supplied via the URL path."""
     phase_id: Optional[uuid.UUID] = None
     status: Optional[str] = Field("not_started", max_length=50)
-    sort_order: Optional[int] = 0
+    sort_order: Optional[int] = None  # None: append after the last sibling
 
 
 class TaskUpdate(BaseModel):
@@ -40,6 +40,15 @@ class TaskUpdate(BaseModel):
     sort_order: Optional[int] = None
 
 
+class TaskBatchUpdateItem(TaskUpdate):
+    """One entry of a batch update: the task id plus the fields to change."""
+    id: uuid.UUID
+
+
+class TaskBatchUpdate(BaseModel):
+    updates: list[TaskBatchUpdateItem] = Field(..., min_length=1, max_length=500)
+
+
 class TaskResponse(TaskBase):
     model_config = ConfigDict(from_attributes=True)
 
@@ -63,7 +72,7 @@ class PhaseBase(BaseModel):
 
 class PhaseCreate(PhaseBase):
     """Required: name."""
-    sort_order: Optional[int] = 0
+    sort_order: Optional[int] = None  # None: append after the last sibling
 
 
 class PhaseUpdate(BaseModel):
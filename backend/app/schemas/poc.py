@@ -48,10 +48,59 @@ class ValueFrameworkResponse(ValueFrameworkBase):
 # ---------------------------------------------------------------------------
 
 class POCProgress(BaseModel):
-    """Lightweight progress summary embedded in POCResponse / POCSummary."""
+    """Lightweight progress summary embedded in POCResponse / POCSummary.
+
+    ``completion_pct`` is the task completion percentage; ``overall_pct`` is
+    the 40/60 weighted milestone/task score.
+    """
     total_tasks: int = 0
     completed_tasks: int = 0
+    in_progress_tasks: int = 0
     completion_pct: float = 0.0
+    total_milestones: int = 0
+    completed_milestones: int = 0
+    milestones_pct: float = 0.0
+    overall_pct: float = 0.0
+
+
+class PhaseProgress(BaseModel):
+    phase_id: uuid.UUID
+    phase_name: str
+    sort_order: int
+    total_tasks: int
+    completed_tasks: int
+    in_progress_tasks: int
+    not_started_tasks: int
+    completion_pct: float
+
+
+class POCProgressDetail(BaseModel):
+    """Full progress breakdown returned by GET /pocs/{id}/progress."""
+    total_milestones: int
+    completed_milestones: int
+    milestones_pct: float
+    total_tasks: int
+    completed_tasks: int
+    in_progress_tasks: int
+    tasks_pct: float
+    overall_pct: float
+    phases: list[PhaseProgress] = []
+    days_remaining: Optional[int] = None
+    days_elapsed: Optional[int] = None
+
+
+# ---------------------------------------------------------------------------
+# POC templates
+# ---------------------------------------------------------------------------
+
+class POCTemplateSummary(BaseModel):
+    name: str
+    version: str
+    description: str
+    milestone_count: int
+    success_criteria_count: int
+    phase_count: int
+    task_count: int
 
 
 # ---------------------------------------------------------------------------
@@ -69,6 +118,21 @@ class POCCreate(POCBase):
     poc_start_date: Optional[date] = None
     poc_end_date: Optional[date] = None
     notes: Optional[str] = None
+    template: str = Field("default", max_length=100)
+
+
+class POCCloneRequest(BaseModel):
+    """Overrides for ``POST /pocs/{id}/clone``.
+
+    Account fields left unset are copied from the source POC; dates and
+    notes start empty.
+    """
+    account_name: Optional[str] = Field(None, max_length=255)
+    account_domain: Optional[str] = Field(None, max_length=255)
+    opportunity_name: Optional[str] = Field(None, max_length=255)
+    poc_start_date: Optional[date] = None
+    poc_end_date: Optional[date] = None
+    notes: Optional[str] = None
 
 
 class POCUpdate(BaseModel):
@@ -91,6 +155,9 @@ class POCResponse(POCBase):
     poc_start_date: Optional[date] = None
     poc_end_date: Optional[date] = None
     notes: Optional[str] = None
+    template_name: Optional[str] = None
+    template_version: Optional[str] = None
+    gong_last_synced_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
 
@@ -105,6 +172,39 @@ class POCSummary(BaseModel):
 
     id: uuid.UUID
     account_name: str
+    account_domain: Optional[str] = None
     status: str
+    poc_end_date: Optional[date] = None
     created_at: datetime
     progress: Optional[POCProgress] = None
+
+
+# ---------------------------------------------------------------------------
+# Bulk creation
+# ---------------------------------------------------------------------------
+
+class BulkPOCCreateRequest(BaseModel):
+    """Accounts to create POCs for; each item has the ``POCCreate`` fields.
+
+    Items are validated individually so one bad row does not reject the
+    whole request.
+    """
+    accounts: list[dict[str, Any]]
+    template: Optional[str] = Field(None, max_length=100)
+
+
+class BulkPOCCreated(BaseModel):
+    row: int
+    id: uuid.UUID
+    account_name: str
+    share_token: str
+
+
+class BulkPOCError(BaseModel):
+    row: int
+    error: str
+
+
+class BulkPOCCreateResponse(BaseModel):
+    created: list[BulkPOCCreated]
+    errors: list[BulkPOCError]
@@ -0,0 +1,36 @@
+import uuid
+from datetime import date, datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+# ---------------------------------------------------------------------------
+# Portfolio dashboard
+# ---------------------------------------------------------------------------
+
+class PortfolioPOC(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    poc_id: uuid.UUID
+    account_name: str
+    status: str
+    poc_start_date: Optional[date] = None
+    poc_end_date: Optional[date] = None
+    total_milestones: int
+    completed_milestones: int
+    overdue_milestones: int
+    oldest_overdue_due_date: Optional[date] = None
+    total_tasks: int
+    completed_tasks: int
+    in_progress_tasks: int
+    milestones_pct: float
+    tasks_pct: float
+    overall_pct: float
+
+
+class PortfolioDashboard(BaseModel):
+    refreshed_at: Optional[datetime] = None
+    status_counts: dict[str, int] = {}
+    ending_soon: list[PortfolioPOC] = []
+    overdue: list[PortfolioPOC] = []
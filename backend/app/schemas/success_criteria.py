@@ -19,7 +19,7 @@ class SuccessCriterionBase(BaseModel):
 
 class SuccessCriterionCreate(SuccessCriterionBase):
     """Required: feature."""
-    sort_order: Optional[int] = 0
+    sort_order: Optional[int] = None  # None: append after the last sibling
 
 
 class SuccessCriterionUpdate(BaseModel):
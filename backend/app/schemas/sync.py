@@ -0,0 +1,54 @@
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+from app.schemas.mutual_action_plan import MilestoneResponse
+from app.schemas.phase import PhaseBase, TaskResponse
+from app.schemas.success_criteria import SuccessCriterionResponse
+from app.schemas.team_member import TeamMemberResponse
+from app.schemas.tech_stack import DocLinkResponse, TechStackEntryResponse
+
+
+class PhaseRecord(PhaseBase):
+    """A phase without its nested tasks; tasks are synced on their own."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    poc_id: uuid.UUID
+    sort_order: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class DeletedEntities(BaseModel):
+    """Tombstones: ids deleted since the cursor."""
+    milestones: list[uuid.UUID] = []
+    phases: list[uuid.UUID] = []
+    tasks: list[uuid.UUID] = []
+    success_criteria: list[uuid.UUID] = []
+    team_members: list[uuid.UUID] = []
+    tech_stack: list[uuid.UUID] = []
+    doc_links: list[uuid.UUID] = []
+
+
+class POCChangesResponse(BaseModel):
+    """Entities upserted or deleted after POC version ``since``.
+
+    Pass ``version`` back as the next ``since``.  When ``reset`` is true the
+    upserted lists hold the full current plan and the client should replace
+    its copy rather than merge.
+    """
+    poc_id: uuid.UUID
+    since: int
+    version: int
+    reset: bool = False
+
+    milestones: list[MilestoneResponse] = []
+    phases: list[PhaseRecord] = []
+    tasks: list[TaskResponse] = []
+    success_criteria: list[SuccessCriterionResponse] = []
+    team_members: list[TeamMemberResponse] = []
+    tech_stack: list[TechStackEntryResponse] = []
+    doc_links: list[DocLinkResponse] = []
+    deleted: DeletedEntities = DeletedEntities()
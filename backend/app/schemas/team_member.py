@@ -19,7 +19,7 @@ class TeamMemberBase(BaseModel):
 
 class TeamMemberCreate(TeamMemberBase):
     """Required: team_side, name."""
-    sort_order: Optional[int] = 0
+    sort_order: Optional[int] = None  # None: append after the last sibling
 
 
 class TeamMemberUpdate(BaseModel):
@@ -0,0 +1,324 @@
+"""Transactional multi-operation batches over a POC's child entities.
+
+A batch is applied in one session: every ``update``/``delete`` target is
+prefetched with one query per entity type, operations run in order against
+the identity map, counter deltas are summed into one ``UPDATE`` per counter
+family, and everything is flushed and committed once.  Any failing
+operation aborts the whole batch.
+"""
+
+import uuid
+from dataclasses import dataclass
+
+from fastapi import HTTPException
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, selectinload
+
+from app.models.mutual_action_plan import Milestone
+from app.models.phase import Phase, Task
+from app.models.success_criteria import SuccessCriterion
+from app.models.team_member import TeamMember
+from app.models.tech_stack import TechStackEntry
+from app.schemas.batch import BatchOperation
+from app.schemas.mutual_action_plan import (
+    MilestoneCreate,
+    MilestoneResponse,
+    MilestoneUpdate,
+)
+from app.schemas.phase import (
+    PhaseCreate,
+    PhaseUpdate,
+    TaskCreate,
+    TaskResponse,
+    TaskUpdate,
+)
+from app.schemas.success_criteria import (
+    SuccessCriterionCreate,
+    SuccessCriterionResponse,
+    SuccessCriterionUpdate,
+)
+from app.schemas.sync import PhaseRecord
+from app.schemas.team_member import (
+    TeamMemberCreate,
+    TeamMemberResponse,
+    TeamMemberUpdate,
+)
+from app.schemas.tech_stack import (
+    TechStackEntryCreate,
+    TechStackEntryResponse,
+    TechStackEntryUpdate,
+)
+from app.services.load_policy import load_options
+from app.services.ordering_service import SCOPE_COLUMNS, SORT_GAP, next_sort_key
+from app.services.poc_service import POCService
+
+
+@dataclass(frozen=True)
+class EntitySpec:
+    model: type
+    create: type[BaseModel]
+    update: type[BaseModel]
+    response: type[BaseModel]
+    # POC counter family kept in step with this entity's status, if any.
+    counters: str | None = None
+
+
+ENTITIES = {
+    "milestone": EntitySpec(
+        Milestone, MilestoneCreate, MilestoneUpdate, MilestoneResponse, "milestones"
+    ),
+    "phase": EntitySpec(Phase, PhaseCreate, PhaseUpdate, PhaseRecord),
+    "task": EntitySpec(Task, TaskCreate, TaskUpdate, TaskResponse, "tasks"),
+    "success_criterion": EntitySpec(
+        SuccessCriterion,
+        SuccessCriterionCreate,
+        SuccessCriterionUpdate,
+        SuccessCriterionResponse,
+    ),
+    "team_member": EntitySpec(
+        TeamMember, TeamMemberCreate, TeamMemberUpdate, TeamMemberResponse
+    ),
+    "tech_stack_entry": EntitySpec(
+        TechStackEntry,
+        TechStackEntryCreate,
+        TechStackEntryUpdate,
+        TechStackEntryResponse,
+    ),
+}
+
+
+class _Batch:
+    """State of one batch while its operations are applied."""
+
+    def __init__(self, db: Session, poc_id: uuid.UUID) -> None:
+        self.db = db
+        self.poc_id = poc_id
+        self.rows: dict[tuple[str, uuid.UUID], object] = {}
+        self.refs: dict[str, tuple[str, uuid.UUID]] = {}
+        self.removed: dict[str, list] = {"tasks": [], "milestones": []}
+        self.added: dict[str, list] = {"tasks": [], "milestones": []}
+        # Next free sort key per ordering scope; rows created earlier in the
+        # batch are not flushed, so the database only seeds each scope once.
+        self.sort_keys: dict[tuple, int] = {}
+        self.index = 0
+        self.op = ""
+
+    def fail(self, status_code: int, detail) -> None:
+        raise HTTPException(
+            status_code=status_code, detail={"index": self.index, "error": detail}
+        )
+
+    # ------------------------------------------------------------------
+    # Id resolution
+    # ------------------------------------------------------------------
+
+    def resolve_id(self, value) -> uuid.UUID | None:
+        """Turn a UUID string or ``"$ref"`` into a UUID."""
+        if value is None:
+            return None
+        if isinstance(value, str) and value.startswith("$"):
+            if value[1:] not in self.refs:
+                self.fail(400, f"Unknown reference {value}")
+            return self.refs[value[1:]][1]
+        try:
+            return uuid.UUID(str(value))
+        except ValueError:
+            self.fail(422, f"Invalid id {value!r}")
+
+    def prefetch(self, operations: list[BatchOperation]) -> None:
+        """Load every existing row the batch targets, one query per type."""
+        wanted: dict[str, set] = {}
+        for op in operations:
+            if op.op != "create" and op.id and not op.id.startswith("$"):
+                wanted.setdefault(op.entity, set()).add(op.id)
+            phase_id = op.data.get("phase_id") if op.entity == "task" else None
+            if isinstance(phase_id, str) and not phase_id.startswith("$"):
+                wanted.setdefault("phase", set()).add(phase_id)
+        for entity, raw_ids in wanted.items():
+            ids = set()
+            for raw in raw_ids:
+                try:
+                    ids.add(uuid.UUID(raw))
+                except ValueError:
+                    continue  # reported when the operation runs
+            model = ENTITIES[entity].model
+            query = self.db.query(model).filter(
+                model.poc_id == self.poc_id, model.id.in_(ids)
+            )
+            if entity == "phase":
+                query = query.options(selectinload(Phase.tasks))
+            for row in query:
+                self.rows[(entity, row.id)] = row
+
+    def target(self, entity: str, raw_id) -> object:
+        row_id = self.resolve_id(raw_id)
+        if row_id is None:
+            self.fail(400, f"'{entity}' {self.op} requires an id")
+        row = self.rows.get((entity, row_id))
+        if row is None:
+            self.fail(404, f"{entity} {row_id} not found")
+        return row
+
+    def phase(self, raw_id) -> Phase:
+        row_id = self.resolve_id(raw_id)
+        row = self.rows.get(("phase", row_id))
+        if row is None:
+            self.fail(404, f"phase {row_id} not found")
+        return row
+
+    def next_key(self, model, scope: dict) -> int:
+        """Sort key appending a created row to the end of *scope*."""
+        key = (model, *scope.values())
+        if key not in self.sort_keys:
+            self.sort_keys[key] = next_sort_key(self.db, model, **scope)
+        else:
+            self.sort_keys[key] += SORT_GAP
+        return self.sort_keys[key]
+
+    # ------------------------------------------------------------------
+    # Operations
+    # ------------------------------------------------------------------
+
+    def validate(self, schema: type[BaseModel], data: dict) -> BaseModel:
+        try:
+            return schema.model_validate(data)
+        except ValidationError as exc:
+            self.fail(422, exc.errors(include_url=False, include_context=False))
+
+    def create(self, entity: str, op: BatchOperation) -> object:
+        spec = ENTITIES[entity]
+        data = dict(op.data)
+        phase = None
+        if entity == "task":
+            phase = self.phase(data.pop("phase_id", None))
+        payload = self.validate(spec.create, data)
+        # Leave unset optionals to the model defaults, as the create
+        # endpoints do with ``status or "not_started"``.
+        values = {k: v for k, v in payload.model_dump().items() if v is not None}
+        values.pop("phase_id", None)
+        if spec.model in SCOPE_COLUMNS and "sort_order" not in values:
+            scope = {"poc_id": self.poc_id}
+            if phase is not None:
+                scope["phase_id"] = phase.id
+            if "team_side" in values:
+                scope["team_side"] = values["team_side"]
+            values["sort_order"] = self.next_key(spec.model, scope)
+        row = spec.model(id=uuid.uuid4(), poc_id=self.poc_id, **values)
+        if phase is not None:
+            row.phase = phase
+        if spec.counters:
+            self.added[spec.counters].append(values.get("status", "not_started"))
+        self.db.add(row)
+        self.rows[(entity, row.id)] = row
+        if op.ref:
+            if op.ref in self.refs:
+                self.fail(400, f"Duplicate reference {op.ref!r}")
+            self.refs[op.ref] = (entity, row.id)
+        return row
+
+    def update(self, entity: str, op: BatchOperation) -> object:
+        spec = ENTITIES[entity]
+        row = self.target(entity, op.id)
+        data = dict(op.data)
+        if entity == "task" and data.get("phase_id") is not None:
+            row.phase = self.phase(data.pop("phase_id"))
+        payload = self.validate(spec.update, data)
+        old_status = getattr(row, "status", None)
+        for name, value in payload.model_dump(exclude_unset=True).items():
+            setattr(row, name, value)
+        if spec.counters and row.status != old_status:
+            self.removed[spec.counters].append(old_status)
+            self.added[spec.counters].append(row.status)
+        return row
+
+    def delete(self, entity: str, op: BatchOperation) -> object:
+        spec = ENTITIES[entity]
+        row = self.target(entity, op.id)
+        if spec.counters:
+            self.removed[spec.counters].append(row.status)
+        if entity == "phase":
+            self.removed["tasks"].extend(task.status for task in row.tasks)
+            for task in row.tasks:
+                self.rows.pop(("task", task.id), None)
+        if row in self.db.new:
+            # Created earlier in this batch: just never insert it.
+            self.db.expunge(row)
+        else:
+            self.db.delete(row)
+        del self.rows[(entity, row.id)]
+        return row
+
+    def apply_counters(self) -> None:
+        if self.removed["tasks"] or self.added["tasks"]:
+            POCService.adjust_task_counters(
+                self.db, self.poc_id, self.removed["tasks"], self.added["tasks"]
+            )
+        if self.removed["milestones"] or self.added["milestones"]:
+            POCService.adjust_milestone_counters(
+                self.db,
+                self.poc_id,
+                self.removed["milestones"],
+                self.added["milestones"],
+            )
+
+
+def run_batch(
+    db: Session, poc_id: uuid.UUID, operations: list[BatchOperation]
+) -> list[dict]:
+    """Apply *operations* in order and commit them as one transaction.
+
+    Returns one result dict per operation (``index``, ``op``, ``entity``,
+    ``id`` and the entity's response ``data``, ``None`` for deletes).
+
+    Raises ``HTTPException`` whose ``detail`` carries the ``index`` of the
+    first failing operation; nothing is applied in that case.
+    """
+    batch = _Batch(db, poc_id)
+    batch.prefetch(operations)
+
+    applied = []
+    for index, op in enumerate(operations):
+        batch.index, batch.op = index, op.op
+        row = getattr(batch, op.op)(op.entity, op)
+        applied.append((index, op, row.id))
+    batch.apply_counters()
+
+    try:
+        db.commit()
+    except SQLAlchemyError as exc:
+        db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail={"index": None, "error": str(getattr(exc, "orig", None) or exc)},
+        )
+
+    # One query per entity type reloads what the commit expired.
+    surviving: dict[str, set] = {}
+    for _, op, row_id in applied:
+        if (op.entity, row_id) in batch.rows:
+            surviving.setdefault(op.entity, set()).add(row_id)
+    loaded = {}
+    for entity, ids in surviving.items():
+        spec = ENTITIES[entity]
+        rows = (
+            db.query(spec.model)
+            .options(*load_options(spec.response))
+            .filter(spec.model.id.in_(ids))
+            .all()
+        )
+        for row in rows:
+            loaded[(entity, row.id)] = spec.response.model_validate(row).model_dump(
+                mode="json"
+            )
+
+    return [
+        {
+            "index": index,
+            "op": op.op,
+            "entity": op.entity,
+            "id": row_id,
+            "data": None if op.op == "delete" else loaded.get((op.entity, row_id)),
+        }
+        for index, op, row_id in applied
+    ]
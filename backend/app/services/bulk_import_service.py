@@ -0,0 +1,156 @@
+"""Bulk POC creation from CSV or JSON account lists."""
+
+import csv
+import io
+import json
+import logging
+from pathlib import Path
+
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.schemas.poc import POCCreate
+from app.services.poc_service import POCService
+from app.services.template_service import (
+    POCTemplate,
+    get_template_registry,
+    instantiate_templates,
+)
+
+logger = logging.getLogger(__name__)
+
+# Number of POCs created per transaction.
+BULK_CHUNK_SIZE = 200
+
+# Upper bound on rows accepted in a single import.
+MAX_BULK_ROWS = 5000
+
+
+def parse_csv(text: str) -> list[dict]:
+    """Parse CSV text with a header row into a list of row dicts.
+
+    Column names are matched to ``POCCreate`` fields (``account_name``,
+    ``account_domain``, ``poc_end_date``, ``template``, ...).  Blank cells
+    are treated as missing.
+    """
+    reader = csv.DictReader(io.StringIO(text.lstrip("\ufeff")))
+    return [
+        {
+            key.strip(): value.strip()
+            for key, value in row.items()
+            if key and value is not None and value.strip()
+        }
+        for row in reader
+    ]
+
+
+def load_rows(path: Path) -> list[dict]:
+    """Read an import file: ``.csv`` is parsed as CSV, anything else as a
+    JSON list of objects."""
+    text = path.read_text()
+    if path.suffix.lower() == ".csv":
+        return parse_csv(text)
+    rows = json.loads(text)
+    if not isinstance(rows, list):
+        raise ValueError("JSON import must be a list of account objects")
+    return rows
+
+
+def bulk_create_pocs(
+    db: Session,
+    rows: list[dict],
+    default_template: str | None = None,
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> dict:
+    """Create one POC per row, with its template children, in chunks.
+
+    Every row is validated against ``POCCreate`` first; invalid rows and rows
+    naming an unknown template are reported and skipped.  Valid rows are
+    created ``chunk_size`` at a time, each chunk in its own transaction with
+    one multi-row ``INSERT`` per table.  If a chunk fails to commit, its
+    rows are all reported as failed and the remaining chunks still run.
+
+    Parameters
+    ----------
+    rows:
+        Raw account dicts (0-based position is used as the row number).
+    default_template:
+        Template for rows that do not set ``template``.
+
+    Returns
+    -------
+    dict
+        ``created``: list of ``{row, id, account_name, share_token}``;
+        ``errors``: list of ``{row, error}``.
+    """
+    registry = get_template_registry()
+    created: list[dict] = []
+    errors: list[dict] = []
+    # Each row keeps the template resolved while validating it, so a hot
+    # reload before its chunk runs cannot swap or remove it.
+    valid: list[tuple[int, POCCreate, POCTemplate]] = []
+
+    for index, raw in enumerate(rows):
+        if not isinstance(raw, dict):
+            errors.append({"row": index, "error": "Row must be an object"})
+            continue
+        if default_template and "template" not in raw:
+            raw = {**raw, "template": default_template}
+        try:
+            payload = POCCreate.model_validate(raw)
+        except ValidationError as exc:
+            message = "; ".join(
+                f"{'.'.join(str(p) for p in e['loc'])}: {e['msg']}"
+                for e in exc.errors()
+            )
+            errors.append({"row": index, "error": message})
+            continue
+        template = registry.get(payload.template)
+        if template is None:
+            errors.append(
+                {"row": index, "error": f"Unknown POC template '{payload.template}'"}
+            )
+            continue
+        valid.append((index, payload, template))
+
+    for start in range(0, len(valid), chunk_size):
+        chunk = valid[start : start + chunk_size]
+        pocs = [
+            (index, POCService.build_poc(payload), payload, template)
+            for index, payload, template in chunk
+        ]
+        # Captured before commit: reading attributes afterwards would
+        # reload every expired POC with its own SELECT.
+        results = [
+            {
+                "row": index,
+                "id": poc.id,
+                "account_name": payload.account_name,
+                "share_token": poc.share_token,
+            }
+            for index, poc, payload, _ in pocs
+        ]
+        try:
+            db.add_all(poc for _, poc, _, _ in pocs)
+            instantiate_templates(
+                db, [(poc, template) for _, poc, _, template in pocs]
+            )
+            db.commit()
+        except SQLAlchemyError as exc:
+            db.rollback()
+            logger.exception(
+                "Bulk POC creation failed for rows %d-%d.", chunk[0][0], chunk[-1][0]
+            )
+            errors.extend(
+                {"row": index, "error": f"Database error: {exc.__class__.__name__}"}
+                for index, _, _, _ in pocs
+            )
+            continue
+        created.extend(results)
+
+    errors.sort(key=lambda e: e["row"])
+    logger.info(
+        "Bulk POC import: %d created, %d failed.", len(created), len(errors)
+    )
+    return {"created": created, "errors": errors}
@@ -0,0 +1,146 @@
+"""Server-Sent Events streams of a POC's entity-level changes.
+
+Streams tail the ``poc_changes`` log, so every API worker sees every write
+regardless of which worker committed it; event bus notifications tell them
+when to look.  Each event carries the change-log id as its SSE ``id``; a
+reconnecting client sends it back as ``Last-Event-ID`` and resumes without
+gaps.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections.abc import AsyncIterator, Collection
+
+from fastapi import Request
+from sqlalchemy import func, select
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.change_log import POCChange
+from app.services.event_bus import get_event_bus
+
+logger = logging.getLogger(__name__)
+
+# Entity types the customer portal renders; staff-only data is not streamed
+# to customers.
+CUSTOMER_ENTITY_TYPES = frozenset(
+    {
+        "poc",
+        "value_framework",
+        "milestone",
+        "phase",
+        "task",
+        "success_criterion",
+        "team_member",
+        "tech_stack_entry",
+        "doc_link",
+    }
+)
+
+# Maximum changes read from the log per poll.
+FETCH_LIMIT = 500
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    # Stop nginx-style proxies from buffering the stream.
+    "X-Accel-Buffering": "no",
+}
+
+
+def _latest_change_id(poc_id: uuid.UUID) -> int:
+    with SessionLocal() as db:
+        return db.scalar(
+            select(func.coalesce(func.max(POCChange.id), 0)).where(
+                POCChange.poc_id == poc_id
+            )
+        )
+
+
+def _fetch_changes(
+    poc_id: uuid.UUID,
+    after_id: int,
+    entity_types: Collection[str] | None,
+) -> list[POCChange]:
+    query = (
+        select(POCChange)
+        .where(POCChange.poc_id == poc_id, POCChange.id > after_id)
+        .order_by(POCChange.id)
+        .limit(FETCH_LIMIT)
+    )
+    if entity_types is not None:
+        query = query.where(POCChange.entity_type.in_(sorted(entity_types)))
+    with SessionLocal() as db:
+        return list(db.scalars(query))
+
+
+def format_event(change: POCChange) -> str:
+    data = json.dumps(
+        {
+            "entity_type": change.entity_type,
+            "entity_id": str(change.entity_id),
+            "op": change.op,
+            "version": change.version,
+        }
+    )
+    return f"id: {change.id}\nevent: change\ndata: {data}\n\n"
+
+
+def _parse_last_event_id(request: Request) -> int | None:
+    value = request.headers.get("last-event-id")
+    if value is None:
+        return None
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        return None
+
+
+async def change_events(
+    request: Request,
+    poc_id: uuid.UUID,
+    entity_types: Collection[str] | None = None,
+) -> AsyncIterator[str]:
+    """Yield SSE frames for changes to *poc_id* until the client disconnects.
+
+    Starts after ``Last-Event-ID`` if the client sent one, otherwise at the
+    current end of the log.  While the event bus is connected the stream
+    sleeps until a notification for this POC arrives (re-reading the log at
+    least every heartbeat); otherwise it polls the log.  Each read uses a
+    short-lived session, so an idle stream holds no database connection.
+    """
+    settings = get_settings()
+    poll_interval = settings.change_stream_poll_interval_seconds
+    heartbeat_interval = settings.change_stream_heartbeat_seconds
+
+    last_id = _parse_last_event_id(request)
+    if last_id is None:
+        last_id = await asyncio.to_thread(_latest_change_id, poc_id)
+
+    yield f"retry: {int(poll_interval * 1000) + 1000}\n\n"
+    bus = get_event_bus()
+    last_sent = time.monotonic()
+    with bus.watch(poc_id) as changed:
+        while not bus.closed and not await request.is_disconnected():
+            changed.clear()
+            changes = await asyncio.to_thread(
+                _fetch_changes, poc_id, last_id, entity_types
+            )
+            for change in changes:
+                last_id = change.id
+                yield format_event(change)
+            if changes:
+                last_sent = time.monotonic()
+                if len(changes) == FETCH_LIMIT:
+                    continue
+            elif time.monotonic() - last_sent >= heartbeat_interval:
+                yield ": keep-alive\n\n"
+                last_sent = time.monotonic()
+
+            timeout = heartbeat_interval if bus.connected else poll_interval
+            try:
+                await asyncio.wait_for(changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
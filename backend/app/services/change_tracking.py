@@ -0,0 +1,189 @@
+"""Per-POC version counter and change log, maintained on every ORM flush.
+
+Importing this module registers session listeners.  After each flush the
+POCs whose own columns or child rows were inserted, updated or deleted get
+``version = version + 1`` in one ``UPDATE ... RETURNING``, and one
+``poc_changes`` row per changed entity is inserted with the new version.
+A ``pg_notify`` per POC announces the change to every API process once the
+transaction commits (see ``app.services.event_bus``).  All of it runs on the
+flush's connection, so it commits or rolls back with the write itself.
+Read endpoints serve the version as a weak ETag (see :func:`not_modified`);
+change streams and delta sync read the log.
+
+Core-level bulk statements (``query(...).delete()``, template and clone
+inserts) bypass the ORM unit of work; callers issuing them on existing POCs
+must call :func:`record_changes` themselves.
+"""
+
+import uuid
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from fastapi import Request, Response
+from sqlalchemy import event, insert, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+
+from app.models.change_log import POCChange
+from app.models.gong import AIAnalysis, GongCall
+from app.models.mutual_action_plan import Milestone
+from app.models.phase import Phase, Task
+from app.models.poc import POC, ValueFramework
+from app.models.success_criteria import SuccessCriterion
+from app.models.team_member import TeamMember
+from app.models.tech_stack import DocLink, TechStackEntry
+from app.services.event_bus import encode_notice, publish
+
+# Models whose writes bump their POC's version, by entity type name.
+TRACKED_MODELS: dict[type, str] = {
+    POC: "poc",
+    ValueFramework: "value_framework",
+    Milestone: "milestone",
+    Phase: "phase",
+    Task: "task",
+    SuccessCriterion: "success_criterion",
+    TeamMember: "team_member",
+    TechStackEntry: "tech_stack_entry",
+    DocLink: "doc_link",
+    GongCall: "gong_call",
+    AIAnalysis: "ai_analysis",
+}
+
+_PENDING_KEY = "poc_versions"
+
+
+class Change(NamedTuple):
+    poc_id: uuid.UUID
+    entity_type: str
+    entity_id: uuid.UUID
+    op: str  # "insert", "update" or "delete"
+
+
+# ---------------------------------------------------------------------------
+# Recording changes
+# ---------------------------------------------------------------------------
+
+def _record(session: Session, changes: list[Change]) -> dict:
+    """Bump the affected POCs and log *changes*; return ``{poc_id: version}``."""
+    pocs = POC.__table__
+    rows = session.connection().execute(
+        update(pocs)
+        .where(pocs.c.id.in_({c.poc_id for c in changes}))
+        .values(version=pocs.c.version + 1)
+        .returning(pocs.c.id, pocs.c.version)
+    )
+    versions = dict(rows.all())
+    session.connection().execute(
+        insert(POCChange.__table__),
+        [
+            {**change._asdict(), "version": versions[change.poc_id]}
+            for change in changes
+            if change.poc_id in versions
+        ],
+    )
+
+    types_by_poc: dict[uuid.UUID, set[str]] = defaultdict(set)
+    for change in changes:
+        types_by_poc[change.poc_id].add(change.entity_type)
+    publish(
+        session.connection(),
+        [
+            encode_notice(poc_id, version, types_by_poc[poc_id])
+            for poc_id, version in versions.items()
+        ],
+    )
+    return versions
+
+
+def record_changes(session: Session, changes: Iterable[Change]) -> dict:
+    """Log writes made outside the ORM unit of work and bump their POCs.
+
+    Returns ``{poc_id: new_version}``.
+    """
+    changes = list(changes)
+    if not changes:
+        return {}
+    versions = _record(session, changes)
+    _sync_loaded(session, versions)
+    return versions
+
+
+def _sync_loaded(session: Session, versions: dict) -> None:
+    """Write new versions into any POCs already loaded in *session*."""
+    for poc_id, version in versions.items():
+        poc = session.identity_map.get(identity_key(POC, poc_id))
+        if poc is not None:
+            set_committed_value(poc, "version", version)
+
+
+def _pending_changes(session: Session) -> list[Change]:
+    """Entity changes in the flush that just ran, excluding POCs being created."""
+    created = {obj.id for obj in session.new if isinstance(obj, POC)}
+    changes: list[Change] = []
+    for op, objects in (
+        ("insert", session.new),
+        ("update", session.dirty),
+        ("delete", session.deleted),
+    ):
+        for obj in objects:
+            entity_type = TRACKED_MODELS.get(type(obj))
+            if entity_type is None:
+                continue
+            poc_id = obj.id if isinstance(obj, POC) else obj.poc_id
+            if poc_id is None or poc_id in created:
+                continue
+            if op == "update" and not session.is_modified(
+                obj, include_collections=False
+            ):
+                continue
+            changes.append(Change(poc_id, entity_type, obj.id, op))
+    return changes
+
+
+@event.listens_for(Session, "after_flush")
+def _record_after_flush(session: Session, flush_context) -> None:
+    changes = _pending_changes(session)
+    if not changes:
+        return
+    # Loaded POC state can only be changed once the flush has finished.
+    session.info.setdefault(_PENDING_KEY, {}).update(_record(session, changes))
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _apply_after_flush(session: Session, flush_context) -> None:
+    versions = session.info.pop(_PENDING_KEY, None)
+    if versions:
+        _sync_loaded(session, versions)
+
+
+# ---------------------------------------------------------------------------
+# HTTP helpers
+# ---------------------------------------------------------------------------
+
+def poc_etag(version: int, *qualifiers: object) -> str:
+    """Weak ETag for a representation of a POC at *version*.
+
+    *qualifiers* distinguish payloads that also depend on something other
+    than the stored data, e.g. today's date for ``days_remaining``.
+    """
+    tag = "-".join(str(part) for part in (version, *qualifiers))
+    return f'W/"{tag}"'
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Response | None:
+    """Set the ``ETag`` header; return a 304 if ``If-None-Match`` matches it.
+
+    Call before running the endpoint's child queries and return the result
+    when it is not ``None``.
+    """
+    response.headers["ETag"] = etag
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        # Weak comparison: W/"x" and "x" match each other.
+        bare = etag.removeprefix("W/")
+        if "*" in candidates or etag in candidates or bare in candidates:
+            return Response(status_code=304, headers={"ETag": etag})
+    return None
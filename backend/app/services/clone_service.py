@@ -0,0 +1,229 @@
+"""Server-side deep copy of a POC's plan."""
+
+import secrets
+import uuid
+
+from sqlalchemy import false, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from app.models.mutual_action_plan import Milestone
+from app.models.phase import Phase, Task
+from app.models.poc import POC, ValueFramework
+from app.models.success_criteria import SuccessCriterion
+from app.models.team_member import TeamMember
+from app.models.tech_stack import DocLink, TechStackEntry
+from app.schemas.poc import POCCloneRequest
+
+# Status given to every cloned milestone and task.
+RESET_STATUS = "not_started"
+
+
+def _id_map(model, source_id: uuid.UUID):
+    """CTE pairing each of the source POC's *model* ids with a fresh UUID.
+
+    CTEs that call volatile functions are evaluated exactly once, so every
+    reference to the map sees the same new ids.
+    """
+    return (
+        select(model.id.label("old_id"), func.gen_random_uuid().label("new_id"))
+        .where(model.poc_id == source_id)
+        .cte(f"{model.__tablename__}_map")
+    )
+
+
+def _copy(model, columns: dict, query):
+    """Data-modifying CTE: ``INSERT INTO model (columns) <query>``.
+
+    *columns* maps target column names to the expressions selected for them;
+    *query* is a ``select()`` of those expressions with its FROM/WHERE set.
+    """
+    return (
+        insert(model)
+        .from_select(
+            list(columns),
+            query.with_only_columns(*columns.values(), maintain_column_froms=True),
+            include_defaults=False,
+        )
+        .cte(f"copy_{model.__tablename__}")
+    )
+
+
+def clone_poc(
+    db: Session, source_id: uuid.UUID, overrides: POCCloneRequest
+) -> uuid.UUID | None:
+    """Deep-copy a POC's plan into a new draft POC in one statement.
+
+    Copies milestones, phases with their tasks, success criteria, the team
+    roster and the tech stack with its doc links, and creates an empty value
+    framework.  Milestone and task statuses are reset to ``not_started`` and
+    their dates cleared, and tech stack entries are marked unconfirmed.  Gong
+    calls and AI analyses belong to the source account and are not copied.
+
+    Everything runs as a single ``INSERT ... SELECT`` on ``pocs`` with one
+    data-modifying CTE per child table.  Child ids come from
+    ``gen_random_uuid()``; phase and tech stack ids are generated once in
+    mapping CTEs so tasks and doc links can be re-pointed at their copies.
+
+    Returns
+    -------
+    uuid.UUID | None
+        The new POC's id, or ``None`` if *source_id* does not exist.  Does not
+        commit.
+    """
+    new_id = uuid.uuid4()
+    new_poc = literal(new_id, POC.id.type)
+    reset = literal(RESET_STATUS)
+
+    phase_map = _id_map(Phase, source_id)
+    tech_map = _id_map(TechStackEntry, source_id)
+
+    children = [
+        _copy(
+            ValueFramework,
+            {"id": func.gen_random_uuid(), "poc_id": new_poc, "ai_generated": false()},
+            select(POC).where(POC.id == source_id),
+        ),
+        _copy(
+            Milestone,
+            {
+                "id": func.gen_random_uuid(),
+                "poc_id": new_poc,
+                "title": Milestone.title,
+                "description": Milestone.description,
+                "notes": Milestone.notes,
+                "status": reset,
+                "sort_order": Milestone.sort_order,
+            },
+            select(Milestone).where(Milestone.poc_id == source_id),
+        ),
+        _copy(
+            Phase,
+            {
+                "id": phase_map.c.new_id,
+                "poc_id": new_poc,
+                "name": Phase.name,
+                "description": Phase.description,
+                "sort_order": Phase.sort_order,
+            },
+            select(Phase).join(phase_map, phase_map.c.old_id == Phase.id),
+        ),
+        _copy(
+            Task,
+            {
+                "id": func.gen_random_uuid(),
+                "phase_id": phase_map.c.new_id,
+                "poc_id": new_poc,
+                "title": Task.title,
+                "resource_url": Task.resource_url,
+                "resource_label": Task.resource_label,
+                "owner": Task.owner,
+                "status": reset,
+                "notes": Task.notes,
+                "is_optional": Task.is_optional,
+                "sort_order": Task.sort_order,
+            },
+            select(Task).join(phase_map, phase_map.c.old_id == Task.phase_id),
+        ),
+        _copy(
+            SuccessCriterion,
+            {
+                "id": func.gen_random_uuid(),
+                "poc_id": new_poc,
+                "feature": SuccessCriterion.feature,
+                "priority": SuccessCriterion.priority,
+                "criteria": SuccessCriterion.criteria,
+                "current_state": SuccessCriterion.current_state,
+                "notes": SuccessCriterion.notes,
+                "sort_order": SuccessCriterion.sort_order,
+            },
+            select(SuccessCriterion).where(SuccessCriterion.poc_id == source_id),
+        ),
+        _copy(
+            TeamMember,
+            {
+                "id": func.gen_random_uuid(),
+                "poc_id": new_poc,
+                "team_side": TeamMember.team_side,
+                "name": TeamMember.name,
+                "role": TeamMember.role,
+                "email": TeamMember.email,
+                "is_primary_contact": TeamMember.is_primary_contact,
+                "sort_order": TeamMember.sort_order,
+            },
+            select(TeamMember).where(TeamMember.poc_id == source_id),
+        ),
+        _copy(
+            TechStackEntry,
+            {
+                "id": tech_map.c.new_id,
+                "poc_id": new_poc,
+                "category": TechStackEntry.category,
+                "name": TechStackEntry.name,
+                "sentry_platform_key": TechStackEntry.sentry_platform_key,
+                "confirmed_by_customer": false(),
+            },
+            select(TechStackEntry).join(
+                tech_map, tech_map.c.old_id == TechStackEntry.id
+            ),
+        ),
+        _copy(
+            DocLink,
+            {
+                "id": func.gen_random_uuid(),
+                "poc_id": new_poc,
+                "tech_stack_entry_id": tech_map.c.new_id,
+                "category": DocLink.category,
+                "title": DocLink.title,
+                "url": DocLink.url,
+                "relevance_note": DocLink.relevance_note,
+                "sort_order": DocLink.sort_order,
+            },
+            select(DocLink)
+            .outerjoin(tech_map, tech_map.c.old_id == DocLink.tech_stack_entry_id)
+            .where(DocLink.poc_id == source_id),
+        ),
+    ]
+
+    poc_columns = {
+        "id": new_poc,
+        "account_name": (
+            literal(overrides.account_name)
+            if overrides.account_name is not None
+            else POC.account_name
+        ),
+        "account_domain": (
+            literal(overrides.account_domain)
+            if overrides.account_domain is not None
+            else POC.account_domain
+        ),
+        "opportunity_name": (
+            literal(overrides.opportunity_name)
+            if overrides.opportunity_name is not None
+            else POC.opportunity_name
+        ),
+        "share_token": literal(secrets.token_urlsafe(32)),
+        "status": literal("draft"),
+        "poc_start_date": literal(overrides.poc_start_date, POC.poc_start_date.type),
+        "poc_end_date": literal(overrides.poc_end_date, POC.poc_end_date.type),
+        "notes": literal(overrides.notes, POC.notes.type),
+        "template_name": POC.template_name,
+        "template_version": POC.template_version,
+        "total_tasks": POC.total_tasks,
+        "total_milestones": POC.total_milestones,
+    }
+    stmt = (
+        insert(POC)
+        .from_select(
+            list(poc_columns),
+            select(*poc_columns.values()).where(POC.id == source_id),
+            include_defaults=False,
+        )
+        .returning(POC.id)
+    )
+    for cte in children:
+        stmt = stmt.add_cte(cte)
+
+    # Children reference the new POC before its row exists; Postgres checks
+    # the foreign keys once the whole statement has run.  A missing source
+    # POC inserts no rows at all.
+    return db.execute(stmt).scalar_one_or_none()
@@ -0,0 +1,111 @@
+"""Delta sync: a POC's plan entities changed since a version cursor.
+
+The cursor is the POC ``version`` (see ``app.services.change_tracking``).
+Every version bump writes ``poc_changes`` rows, so the entities touched
+after version *N* are one range scan of ``ix_poc_changes_poc_id_version``;
+only those rows are then loaded.  An entity that was logged but no longer
+exists is returned as a tombstone.
+
+Version numbers come from the same transaction as the write, so unlike an
+``updated_at`` high-water mark a cursor cannot skip a write that committed
+late with an earlier timestamp.
+"""
+
+import uuid
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.change_log import POCChange
+from app.models.mutual_action_plan import Milestone
+from app.models.phase import Phase, Task
+from app.models.success_criteria import SuccessCriterion
+from app.models.team_member import TeamMember
+from app.models.tech_stack import DocLink, TechStackEntry
+from app.schemas.tech_stack import TechStackEntryResponse
+from app.services.load_policy import load_options
+
+# Synced entity types: (model, response field, ordering).  Phases are
+# returned without tasks; tech stack entries nest their doc links.
+SYNCED_ENTITIES = {
+    "milestone": (Milestone, "milestones", (Milestone.sort_order,)),
+    "phase": (Phase, "phases", (Phase.sort_order,)),
+    "task": (Task, "tasks", (Task.phase_id, Task.sort_order)),
+    "success_criterion": (
+        SuccessCriterion,
+        "success_criteria",
+        (SuccessCriterion.sort_order,),
+    ),
+    "team_member": (TeamMember, "team_members", (TeamMember.sort_order,)),
+    "tech_stack_entry": (TechStackEntry, "tech_stack", (TechStackEntry.created_at,)),
+    "doc_link": (DocLink, "doc_links", (DocLink.sort_order,)),
+}
+
+
+def _changed_ids(db: Session, poc_id: uuid.UUID, since: int) -> dict[str, set]:
+    rows = db.execute(
+        select(POCChange.entity_type, POCChange.entity_id)
+        .where(
+            POCChange.poc_id == poc_id,
+            POCChange.version > since,
+            POCChange.entity_type.in_(SYNCED_ENTITIES),
+        )
+        .distinct()
+    )
+    changed: dict[str, set] = {}
+    for entity_type, entity_id in rows:
+        changed.setdefault(entity_type, set()).add(entity_id)
+    return changed
+
+
+def _log_is_complete(db: Session, poc_id: uuid.UUID, since: int) -> bool:
+    """Whether the log still holds every version after *since*."""
+    first = db.scalar(
+        select(func.min(POCChange.version)).where(
+            POCChange.poc_id == poc_id, POCChange.version > since
+        )
+    )
+    return first is None or first == since + 1
+
+
+def changes_since(db: Session, poc_id: uuid.UUID, version: int, since: int) -> dict:
+    """Build the ``POCChangesResponse`` payload for POC *poc_id*.
+
+    Parameters
+    ----------
+    version:
+        The POC's current version, returned as the next cursor.  Read it
+        before calling: a write landing in between is then re-sent on the
+        next poll rather than missed.
+    since:
+        The client's cursor.  ``0`` (or a cursor older than the retained
+        log) returns the full plan with ``reset`` set.
+    """
+    result: dict = {"poc_id": poc_id, "since": since, "version": version}
+    if since >= version:
+        return result
+
+    reset = since <= 0 or not _log_is_complete(db, poc_id, since)
+    changed = {} if reset else _changed_ids(db, poc_id, since)
+    deleted: dict[str, list] = {}
+
+    for entity_type, (model, field, ordering) in SYNCED_ENTITIES.items():
+        query = db.query(model).filter(model.poc_id == poc_id).order_by(*ordering)
+        if model is TechStackEntry:
+            query = query.options(*load_options(TechStackEntryResponse))
+        if reset:
+            rows = query.all()
+        elif entity_type in changed:
+            ids = changed[entity_type]
+            rows = query.filter(model.id.in_(ids)).all()
+            # Logged but gone: deleted (or moved to another POC).
+            gone = ids - {row.id for row in rows}
+            if gone:
+                deleted[field] = sorted(gone, key=str)
+        else:
+            continue
+        result[field] = rows
+
+    result["reset"] = reset
+    result["deleted"] = deleted
+    return result
@@ -0,0 +1,307 @@
+"""Cross-process change bus on Postgres ``LISTEN``/``NOTIFY``.
+
+Every transaction that logs POC changes also runs ``pg_notify`` (see
+``app.services.change_tracking``); Postgres delivers the notification to
+all listeners when, and only if, the transaction commits.  Each API process
+runs one :class:`EventBus` listener, started in the FastAPI lifespan, which
+fans notifications out to:
+
+* handlers registered with :meth:`EventBus.add_handler`, e.g. in-process
+  cache invalidators, and
+* per-POC watchers (:meth:`EventBus.watch`), which wake SSE streams.
+
+Notifications are best-effort: while the listener is reconnecting they are
+lost, so reconnect hooks (:meth:`EventBus.add_reconnect_handler`) let caches
+drop everything, and streams still re-read the change log periodically.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import queue
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import NamedTuple
+
+from sqlalchemy import Connection, text
+
+from app.database import engine
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "poc_changes"
+
+# Seconds to wait before reconnecting a dropped listener connection.
+RECONNECT_DELAY_SECONDS = 2.0
+
+_NOTIFY_SQL = text(
+    "SELECT pg_notify(:channel, payload) "
+    "FROM unnest(CAST(:payloads AS text[])) AS payload"
+)
+
+
+class ChangeNotice(NamedTuple):
+    poc_id: uuid.UUID
+    version: int
+    entity_types: frozenset[str]
+
+
+def encode_notice(poc_id: uuid.UUID, version: int, entity_types) -> str:
+    """Return the ``NOTIFY`` payload for a committed change to a POC."""
+    return json.dumps(
+        {"poc_id": str(poc_id), "version": version, "types": sorted(entity_types)}
+    )
+
+
+def decode_notice(payload: str) -> ChangeNotice:
+    data = json.loads(payload)
+    return ChangeNotice(
+        poc_id=uuid.UUID(data["poc_id"]),
+        version=int(data["version"]),
+        entity_types=frozenset(data.get("types", ())),
+    )
+
+
+def publish(connection: Connection, payloads: list[str], channel: str = CHANNEL) -> None:
+    """Queue *payloads* on *connection*'s transaction; sent on commit.
+
+    Postgres folds identical payloads sent in one transaction into one.
+    """
+    if payloads:
+        connection.execute(_NOTIFY_SQL, {"channel": channel, "payloads": payloads})
+
+
+class EventBus:
+    """Per-process ``LISTEN`` connection fanning notices out to subscribers."""
+
+    def __init__(self, channel: str = CHANNEL) -> None:
+        self.channel = channel
+        self._handlers: list[Callable[[ChangeNotice], None]] = []
+        self._reconnect_handlers: list[Callable[[], None]] = []
+        self._watchers: dict[uuid.UUID, set[asyncio.Event]] = defaultdict(set)
+        self._task: asyncio.Task | None = None
+        self._connected = False
+        self._closed = False
+        self.received = 0
+
+    @property
+    def connected(self) -> bool:
+        """Whether notices are currently being received."""
+        return self._connected
+
+    @property
+    def closed(self) -> bool:
+        """Whether :meth:`stop` has been called; streams should end."""
+        return self._closed
+
+    # ------------------------------------------------------------------
+    # Subscriptions
+    # ------------------------------------------------------------------
+
+    def add_handler(self, handler: Callable[[ChangeNotice], None]) -> None:
+        """Call *handler* (on the event loop) for every notice received."""
+        self._handlers.append(handler)
+
+    def add_reconnect_handler(self, handler: Callable[[], None]) -> None:
+        """Call *handler* after every (re)connect, when notices may have been
+        missed."""
+        self._reconnect_handlers.append(handler)
+
+    @contextmanager
+    def watch(self, poc_id: uuid.UUID) -> Iterator[asyncio.Event]:
+        """Yield an event that is set whenever *poc_id* changes.
+
+        The watcher stays registered for the whole ``with`` block, so a
+        change that lands while the caller is busy is not missed; clear the
+        event before re-reading state.
+        """
+        event = asyncio.Event()
+        self._watchers[poc_id].add(event)
+        try:
+            yield event
+        finally:
+            watchers = self._watchers.get(poc_id)
+            if watchers is not None:
+                watchers.discard(event)
+                if not watchers:
+                    del self._watchers[poc_id]
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        if self._task is None:
+            self._closed = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        self._closed = True
+        self._wake_all()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _dispatch(self, payload: str) -> None:
+        try:
+            notice = decode_notice(payload)
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed %s payload: %r", self.channel, payload)
+            return
+        self.received += 1
+        for handler in self._handlers:
+            try:
+                handler(notice)
+            except Exception:
+                logger.exception("Change handler %r failed.", handler)
+        for event in self._watchers.get(notice.poc_id, ()):
+            event.set()
+
+    def _wake_all(self) -> None:
+        for watchers in self._watchers.values():
+            for event in watchers:
+                event.set()
+
+    def _connect(self):
+        # A dedicated connection, detached from the pool: it stays in LISTEN
+        # mode for the life of the process.
+        raw = engine.raw_connection()
+        conn = raw.driver_connection
+        raw.detach()
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute(f'LISTEN "{self.channel}"')
+        return conn
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            conn = None
+            try:
+                conn = await asyncio.to_thread(self._connect)
+                lost = loop.create_future()
+
+                def on_readable() -> None:
+                    try:
+                        conn.poll()
+                    except Exception as exc:
+                        if not lost.done():
+                            lost.set_exception(exc)
+                        return
+                    while conn.notifies:
+                        self._dispatch(conn.notifies.pop(0).payload)
+
+                loop.add_reader(conn.fileno(), on_readable)
+                self._connected = True
+                logger.info("Listening for %s notifications.", self.channel)
+                for handler in self._reconnect_handlers:
+                    handler()
+                # Streams re-read the change log in case they missed a notice.
+                self._wake_all()
+                try:
+                    await lost
+                finally:
+                    loop.remove_reader(conn.fileno())
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception(
+                    "%s listener failed; reconnecting in %.0fs.",
+                    self.channel,
+                    RECONNECT_DELAY_SECONDS,
+                )
+            finally:
+                self._connected = False
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+
+@lru_cache()
+def get_event_bus() -> EventBus:
+    """Return this process's event bus (started by the app lifespan)."""
+    return EventBus()
+
+
+# ---------------------------------------------------------------------------
+# Diagnostics
+# ---------------------------------------------------------------------------
+
+def _listener_process(ready, results, expected: int, timeout: float) -> None:
+    """Run an event bus, as an API worker would, and report what it received."""
+
+    async def listen() -> int:
+        bus = EventBus()
+        seen: set[uuid.UUID] = set()
+        done = asyncio.Event()
+
+        def on_change(notice: ChangeNotice) -> None:
+            seen.add(notice.poc_id)
+            if len(seen) >= expected:
+                done.set()
+
+        bus.add_handler(on_change)
+        bus.add_reconnect_handler(ready.release)
+        bus.start()
+        try:
+            await asyncio.wait_for(done.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        await bus.stop()
+        return len(seen)
+
+    results.put(asyncio.run(listen()))
+
+
+def check_fanout(workers: int = 4, notices: int = 100, timeout: float = 10.0) -> list[int]:
+    """Start *workers* listener processes, publish *notices*, count deliveries.
+
+    Simulates a multi-worker deployment against the configured database.
+    Returns the number of distinct notices each worker received; every
+    entry equals *notices* when the bus is healthy.
+    """
+    context = multiprocessing.get_context("spawn")
+    ready = context.Semaphore(0)
+    results = context.Queue()
+    processes = [
+        context.Process(
+            target=_listener_process, args=(ready, results, notices, timeout)
+        )
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    deadline = time.monotonic() + timeout
+    for _ in processes:
+        if not ready.acquire(timeout=max(deadline - time.monotonic(), 0)):
+            break
+
+    payloads = [encode_notice(uuid.uuid4(), 1, {"poc"}) for _ in range(notices)]
+    with engine.begin() as connection:
+        publish(connection, payloads)
+
+    counts = []
+    for _ in processes:
+        try:
+            counts.append(results.get(timeout=timeout + 5))
+        except queue.Empty:
+            counts.append(0)
+    for process in processes:
+        process.join(timeout=5)
+    return counts
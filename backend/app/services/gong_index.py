@@ -0,0 +1,228 @@
+"""Org-wide Gong call index shared by all POCs.
+
+Gong cannot filter calls by participant domain, so a per-POC search has to
+page through every call of the organization.  Instead, one background sync
+pages ``/calls/extensive`` for calls newer than its high-water mark and
+upserts their metadata into ``gong_call_index``, plus an inverted index of
+participant email domains in ``gong_call_domains``.  POC searches are then
+a local indexed query, and Gong API usage grows with the number of new
+calls rather than with the number of POCs.
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal, engine
+from app.models.gong import GongCallDomain, GongCallIndexEntry, GongSyncState
+from app.services.gong_service import SYNC_OVERLAP, GongService, domain_keys
+
+logger = logging.getLogger(__name__)
+
+# ``gong_sync_state`` row holding the index's high-water mark.
+SYNC_NAME = "call_index"
+
+# Postgres advisory lock key ensuring only one worker syncs at a time.
+SYNC_LOCK_KEY = 0x474F4E47
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+def store_calls(db: Session, calls: list[dict]) -> int:
+    """Upsert one page of normalized calls and rebuild their domain keys.
+
+    *calls* are dicts as yielded by ``GongService.iter_call_pages``.  The
+    caller commits.  Returns the number of calls stored.
+    """
+    rows = {}
+    for call in calls:
+        if not call["gong_call_id"]:
+            continue
+        rows[call["gong_call_id"]] = {
+            "gong_call_id": call["gong_call_id"],
+            "title": call["title"] or None,
+            "started_at": (
+                datetime.fromisoformat(call["started"]) if call["started"] else None
+            ),
+            "duration_seconds": call["duration_seconds"],
+            "url": call["url"] or None,
+            "participant_emails": call["participant_emails"],
+        }
+    if not rows:
+        return 0
+
+    insert = pg_insert(GongCallIndexEntry).values(list(rows.values()))
+    db.execute(
+        insert.on_conflict_do_update(
+            index_elements=[GongCallIndexEntry.gong_call_id],
+            set_={
+                "title": insert.excluded.title,
+                "started_at": insert.excluded.started_at,
+                "duration_seconds": insert.excluded.duration_seconds,
+                "url": insert.excluded.url,
+                "participant_emails": insert.excluded.participant_emails,
+                "synced_at": func.now(),
+            },
+        )
+    )
+    db.execute(delete(GongCallDomain).where(GongCallDomain.gong_call_id.in_(rows)))
+    keys = [
+        {"domain": domain, "gong_call_id": call_id}
+        for call_id, row in rows.items()
+        for domain in set().union(*map(domain_keys, row["participant_emails"]))
+    ]
+    if keys:
+        db.execute(pg_insert(GongCallDomain).values(keys).on_conflict_do_nothing())
+    return len(rows)
+
+
+def last_synced_at(db: Session) -> datetime | None:
+    """The index's high-water mark; ``None`` until a first sync completes."""
+    return db.scalar(
+        select(GongSyncState.last_synced_at).where(GongSyncState.name == SYNC_NAME)
+    )
+
+
+def search_index(
+    db: Session,
+    account_domain: str,
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> list[dict]:
+    """Indexed calls with a participant in *account_domain* (or a subdomain).
+
+    *date_from* and *date_to* are inclusive days in UTC.  Returns dicts
+    shaped like ``GongService.search_calls`` results, oldest first.
+    """
+    query = (
+        select(GongCallIndexEntry)
+        .join(
+            GongCallDomain,
+            GongCallDomain.gong_call_id == GongCallIndexEntry.gong_call_id,
+        )
+        .where(GongCallDomain.domain == account_domain.lower().strip())
+        .order_by(GongCallIndexEntry.started_at)
+    )
+    if date_from is not None:
+        start = datetime.combine(date_from, time.min, timezone.utc)
+        query = query.where(GongCallIndexEntry.started_at >= start)
+    if date_to is not None:
+        end = datetime.combine(date_to + timedelta(days=1), time.min, timezone.utc)
+        query = query.where(GongCallIndexEntry.started_at < end)
+    return [
+        {
+            "gong_call_id": entry.gong_call_id,
+            "title": entry.title or "",
+            "started": entry.started_at.isoformat() if entry.started_at else "",
+            "duration_seconds": entry.duration_seconds,
+            "participant_emails": entry.participant_emails or [],
+            "url": entry.url or "",
+        }
+        for entry in db.scalars(query)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Sync
+# ---------------------------------------------------------------------------
+
+def _execute_scalar(connection, expression):
+    # Commit so the lock connection does not idle inside a transaction;
+    # advisory locks taken at session level outlive it.
+    value = connection.execute(select(expression)).scalar()
+    connection.commit()
+    return value
+
+
+def _store_page(calls: list[dict]) -> int:
+    db = SessionLocal()
+    try:
+        stored = store_calls(db, calls)
+        db.commit()
+        return stored
+    finally:
+        db.close()
+
+
+def _read_mark() -> datetime | None:
+    db = SessionLocal()
+    try:
+        return last_synced_at(db)
+    finally:
+        db.close()
+
+
+def _write_mark(synced_at: datetime) -> None:
+    db = SessionLocal()
+    try:
+        insert = pg_insert(GongSyncState).values(
+            name=SYNC_NAME, last_synced_at=synced_at
+        )
+        db.execute(
+            insert.on_conflict_do_update(
+                index_elements=[GongSyncState.name],
+                set_={"last_synced_at": insert.excluded.last_synced_at},
+            )
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+async def sync_call_index(gong: GongService) -> int | None:
+    """Page calls newer than the index's mark into the index.
+
+    The first run pages the whole history; later runs start
+    ``SYNC_OVERLAP`` before the mark.  Every page is committed as it
+    arrives, but the mark only moves once the run completes, so a failed
+    run is repeated from the same point.
+
+    Returns the number of calls stored, or ``None`` if another worker holds
+    the sync lock.
+    """
+    connection = await asyncio.to_thread(engine.connect)
+    locked = False
+    try:
+        locked = await asyncio.to_thread(
+            _execute_scalar, connection, func.pg_try_advisory_lock(SYNC_LOCK_KEY)
+        )
+        if not locked:
+            return None
+
+        started = datetime.now(timezone.utc)
+        mark = await asyncio.to_thread(_read_mark)
+        date_from = None
+        if mark is not None:
+            date_from = (mark - SYNC_OVERLAP).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        stored = 0
+        async for calls in gong.iter_call_pages(date_from):
+            stored += await asyncio.to_thread(_store_page, calls)
+        await asyncio.to_thread(_write_mark, started)
+        logger.info("Gong call index synced: %d call(s) stored.", stored)
+        return stored
+    finally:
+        if locked:
+            await asyncio.to_thread(
+                _execute_scalar, connection, func.pg_advisory_unlock(SYNC_LOCK_KEY)
+            )
+        await asyncio.to_thread(connection.close)
+
+
+async def sync_periodically(gong: GongService, interval_seconds: int) -> None:
+    """Run :func:`sync_call_index` every *interval_seconds* until cancelled.
+
+    Started from the FastAPI lifespan when Gong credentials are configured.
+    """
+    while True:
+        try:
+            await sync_call_index(gong)
+        except Exception:
+            logger.exception("Gong call index sync failed.")
+        await asyncio.sleep(interval_seconds)
@@ -2,11 +2,16 @@
 
 import asyncio
 import base64
+import importlib.util
 import logging
-from datetime import datetime, timezone
+import math
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import aclosing
+from datetime import datetime, timedelta, timezone
+from functools import partial
 
 import httpx
-from fastapi import HTTPException
+from fastapi import HTTPException, Request
 
 from app.config import Settings
 
@@ -21,6 +26,58 @@ BASE_BACKOFF_SECONDS = 1.0
 # HTTP timeout for individual Gong API requests (seconds).
 REQUEST_TIMEOUT = 30.0
 
+# Incremental searches start this long before the POC's last sync, to catch
+# calls Gong indexed late or with a skewed clock.
+SYNC_OVERLAP = timedelta(hours=6)
+
+# Call IDs per ``/calls/transcript`` request (Gong's page size for the filter).
+TRANSCRIPT_BATCH_SIZE = 100
+
+# Call searches estimated at more pages than this are split into date-window
+# shards of about this many pages each, paged concurrently.
+SHARD_PAGES = 10
+
+# Upper bound on the shards of one search, and the shortest window a shard
+# covers.
+MAX_SHARDS = 12
+MIN_SHARD_SPAN = timedelta(days=1)
+
+GONG_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def domain_keys(email: str) -> set[str]:
+    """Domains an address matches: its own and every parent domain.
+
+    ``jo@eu.acme.com`` gives ``{"eu.acme.com", "acme.com"}``; bare top-level
+    domains are left out.  Both :meth:`GongService.search_calls` and the call
+    index (``app.services.gong_index``) match account domains against these.
+    """
+    domain = email.rpartition("@")[2].strip().lower()
+    labels = [label for label in domain.split(".") if label]
+    if len(labels) < 2:
+        return set()
+    return {".".join(labels[i:]) for i in range(len(labels) - 1)}
+
+
+def create_http_client(settings: Settings) -> httpx.AsyncClient:
+    """Create the pooled HTTP client shared by all Gong requests of a process.
+
+    Keep-alive connections (and their TLS sessions) are reused across pages
+    and requests.  HTTP/2 is negotiated when ``gong_http2`` is set and the
+    ``h2`` package is installed.  The caller owns the client and must
+    ``aclose()`` it; the app does both in its lifespan.
+    """
+    http2 = settings.gong_http2 and importlib.util.find_spec("h2") is not None
+    return httpx.AsyncClient(
+        timeout=REQUEST_TIMEOUT,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.gong_max_connections,
+            max_keepalive_connections=settings.gong_max_keepalive_connections,
+            keepalive_expiry=settings.gong_keepalive_expiry_seconds,
+        ),
+    )
+
 
 class GongService:
     """Async client for the Gong v2 API.
@@ -29,13 +86,32 @@ class GongService:
     - Basic Auth with base64-encoded access_key:access_key_secret
     - Concurrency limiting via ``asyncio.Semaphore`` (max 3 in-flight requests)
     - Automatic retry with exponential backoff on 429 / 5xx responses
+    - One pooled ``httpx.AsyncClient`` for every request (see
+      :func:`create_http_client`)
+
+    Parameters
+    ----------
+    settings:
+        Credentials, base URL and pool limits.
+    client:
+        The shared HTTP client.  When omitted the service creates its own,
+        and :meth:`aclose` closes it.
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self, settings: Settings, client: httpx.AsyncClient | None = None
+    ) -> None:
         self.base_url = settings.gong_api_base_url.rstrip("/")
         self.access_key = settings.gong_access_key
         self.access_key_secret = settings.gong_access_key_secret
         self._semaphore = asyncio.Semaphore(3)
+        self._owns_client = client is None
+        self._client = client or create_http_client(settings)
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this service created it."""
+        if self._owns_client:
+            await self._client.aclose()
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -58,6 +134,22 @@ class GongService:
         encoded = base64.b64encode(credentials.encode()).decode()
         return f"Basic {encoded}"
 
+    async def _fetch_call_page(
+        self, date_from: str, date_to: str, cursor: str | None = None
+    ) -> dict:
+        """One ``POST /v2/calls/extensive`` page of the window."""
+        body: dict = {
+            "filter": {"fromDateTime": date_from, "toDateTime": date_to},
+            "contentSelector": {
+                "exposedFields": {
+                    "parties": True,
+                }
+            },
+        }
+        if cursor:
+            body["cursor"] = cursor
+        return await self._make_request("POST", "/calls/extensive", json_data=body)
+
     async def _make_request(
         self,
         method: str,
@@ -98,13 +190,12 @@ class GongService:
         for attempt in range(MAX_RETRIES):
             async with self._semaphore:
                 try:
-                    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-                        response = await client.request(
-                            method,
-                            url,
-                            headers=headers,
-                            json=json_data,
-                        )
+                    response = await self._client.request(
+                        method,
+                        url,
+                        headers=headers,
+                        json=json_data,
+                    )
 
                     # Successful response
                     if response.status_code == 200:
@@ -172,6 +263,90 @@ class GongService:
     # Public methods
     # ------------------------------------------------------------------
 
+    async def iter_call_pages(
+        self,
+        date_from: str | None = None,
+        date_to: str | None = None,
+    ) -> AsyncIterator[list[dict]]:
+        """Page through every call in a date range, one list per API page.
+
+        Calls ``POST /v2/calls/extensive`` with ``exposedFields.parties``.
+        Gong pages by cursor, so one window can only be read sequentially;
+        when the first page's ``totalRecords`` shows more than
+        ``SHARD_PAGES`` pages, the window is split into equal date-window
+        shards (one per ``SHARD_PAGES`` pages, at most ``MAX_SHARDS``, none
+        shorter than ``MIN_SHARD_SPAN``) that are paged concurrently under
+        the service semaphore.  Pages are yielded as they arrive, so their
+        order is not chronological; calls are deduplicated by ID.  Each call
+        is normalized to the dict described in :meth:`search_calls`.
+
+        Parameters
+        ----------
+        date_from:
+            ISO-8601 start of the window (default 2020-01-01).
+        date_to:
+            ISO-8601 end of the window (default now).
+        """
+        self._ensure_configured()
+
+        date_from = date_from or "2020-01-01T00:00:00Z"
+        date_to = date_to or datetime.now(timezone.utc).strftime(
+            GONG_DATETIME_FORMAT
+        )
+        seen: set[str] = set()
+
+        def unseen(calls: list[dict]) -> list[dict]:
+            page = []
+            for call in map(_normalize_call, calls):
+                if call["gong_call_id"] not in seen:
+                    seen.add(call["gong_call_id"])
+                    page.append(call)
+            return page
+
+        data = await self._fetch_call_page(date_from, date_to)
+        yield unseen(data.get("calls", []))
+        records = data.get("records", {})
+        cursor = records.get("cursor")
+        if not cursor:
+            return
+
+        windows = _shard_window(
+            date_from,
+            date_to,
+            math.ceil(
+                records.get("totalRecords", 0) / max(len(data.get("calls", [])), 1)
+            ),
+        )
+        if len(windows) == 1:
+            while cursor:
+                data = await self._fetch_call_page(date_from, date_to, cursor)
+                yield unseen(data.get("calls", []))
+                cursor = data.get("records", {}).get("cursor")
+            return
+
+        # The shards re-read the first page's calls; ``unseen`` drops them.
+        async def page_shard(window: tuple[str, str], pages: asyncio.Queue) -> None:
+            shard_cursor: str | None = None
+            while True:
+                shard = await self._fetch_call_page(*window, shard_cursor)
+                await pages.put(shard.get("calls", []))
+                shard_cursor = shard.get("records", {}).get("cursor")
+                if not shard_cursor:
+                    return
+
+        logger.info(
+            "Paging Gong calls from %s to %s in %d concurrent shard(s).",
+            date_from,
+            date_to,
+            len(windows),
+        )
+        shards = _merged_pages([partial(page_shard, window) for window in windows])
+        async with aclosing(shards):
+            async for calls in shards:
+                page = unseen(calls)
+                if page:
+                    yield page
+
     async def search_calls(
         self,
         account_domain: str,
@@ -180,9 +355,10 @@ class GongService:
     ) -> list[dict]:
         """Search Gong calls by filtering participant emails for a domain.
 
-        Calls ``POST /v2/calls/extensive`` with a date range filter and
-        ``exposedFields.parties = true``, then filters results where at least
-        one participant email contains *account_domain*.
+        Pages through the window with :meth:`iter_call_pages` and keeps the
+        calls with a participant in *account_domain* or one of its
+        subdomains, as defined by :func:`domain_keys` (Gong cannot filter by
+        domain server-side).
 
         Parameters
         ----------
@@ -196,65 +372,20 @@ class GongService:
         Returns
         -------
         list[dict]
-            List of call metadata dicts, each containing keys like
-            ``metaData``, ``parties``, ``gongCallId``, etc.
+            Normalized call metadata with keys ``gong_call_id``, ``title``,
+            ``started``, ``duration_seconds``, ``participant_emails`` and
+            ``url``.
         """
-        self._ensure_configured()
-
         domain_lower = account_domain.lower().strip()
         all_matching_calls: list[dict] = []
-        cursor: str | None = None
 
-        while True:
-            body: dict = {
-                "filter": {
-                    "fromDateTime": date_from or "2020-01-01T00:00:00Z",
-                    "toDateTime": date_to or datetime.now(timezone.utc).strftime(
-                        "%Y-%m-%dT%H:%M:%SZ"
-                    ),
-                },
-                "contentSelector": {
-                    "exposedFields": {
-                        "parties": True,
-                    }
-                },
-            }
-
-            if cursor:
-                body["cursor"] = cursor
-
-            data = await self._make_request("POST", "/calls/extensive", json_data=body)
-
-            calls = data.get("calls", [])
+        async for calls in self.iter_call_pages(date_from, date_to):
             for call in calls:
-                parties = call.get("parties", [])
-                emails = [
-                    p.get("emailAddress", "").lower()
-                    for p in parties
-                    if p.get("emailAddress")
-                ]
-
-                if any(domain_lower in email for email in emails):
-                    # Build a normalized metadata dict
-                    meta = call.get("metaData", {})
-                    all_matching_calls.append(
-                        {
-                            "gong_call_id": meta.get("id", ""),
-                            "title": meta.get("title", ""),
-                            "started": meta.get("started", ""),
-                            "duration_seconds": meta.get("duration", 0),
-                            "participant_emails": emails,
-                            "url": meta.get("url", ""),
-                        }
-                    )
-
-            # Handle pagination
-            records_cursor = data.get("records", {})
-            cursor = records_cursor.get("cursor")
-            total_records = records_cursor.get("totalRecords", 0)
-
-            if not cursor or len(all_matching_calls) >= total_records:
-                break
+                if any(
+                    domain_lower in domain_keys(email)
+                    for email in call["participant_emails"]
+                ):
+                    all_matching_calls.append(call)
 
         logger.info(
             "Found %d Gong calls matching domain '%s'.",
@@ -266,56 +397,161 @@ class GongService:
     async def fetch_transcript(self, gong_call_id: str) -> str:
         """Fetch the full transcript text for a specific Gong call.
 
-        Calls ``POST /v2/calls/transcript`` with a ``callIds`` filter and
-        concatenates all sentences from all speakers into a single text string.
-
-        Parameters
-        ----------
-        gong_call_id:
-            The Gong-internal call identifier.
-
-        Returns
-        -------
-        str
-            The full transcript as a concatenated text block.
+        A single-call :meth:`fetch_transcripts`; returns ``""`` when the call
+        has no transcript.
+        """
+        transcript = ""
+        async for _, transcript in self.fetch_transcripts([gong_call_id]):
+            pass
+        return transcript
+
+    async def fetch_transcripts(
+        self, gong_call_ids: Iterable[str]
+    ) -> AsyncIterator[tuple[str, str]]:
+        """Fetch transcripts for many calls, yielding ``(call_id, text)``.
+
+        IDs are sent ``TRANSCRIPT_BATCH_SIZE`` at a time in the ``callIds``
+        filter of ``POST /v2/calls/transcript``.  All batches start at once;
+        the service semaphore keeps at most 3 requests in flight and the
+        usual 429 backoff applies.  Transcripts are yielded as soon as the
+        response page carrying them arrives, and calls Gong returned no
+        transcript for are yielded last with ``""``.
 
         Raises
         ------
         HTTPException
-            If the call has no transcript or the API returns an error.
+            If a batch fails; batches still running are cancelled.
         """
         self._ensure_configured()
 
-        body: dict = {
-            "filter": {
-                "callIds": [gong_call_id],
-            }
-        }
-
-        data = await self._make_request("POST", "/calls/transcript", json_data=body)
+        pending = list(dict.fromkeys(gong_call_ids))
+        if not pending:
+            return
+        batches = [
+            pending[i : i + TRANSCRIPT_BATCH_SIZE]
+            for i in range(0, len(pending), TRANSCRIPT_BATCH_SIZE)
+        ]
+
+        async def fetch_batch(call_ids: list[str], pages: asyncio.Queue) -> None:
+            cursor: str | None = None
+            while True:
+                body: dict = {"filter": {"callIds": call_ids}}
+                if cursor:
+                    body["cursor"] = cursor
+                data = await self._make_request(
+                    "POST", "/calls/transcript", json_data=body
+                )
+                await pages.put(data.get("callTranscripts", []))
+                cursor = data.get("records", {}).get("cursor")
+                if not cursor:
+                    return
+
+        remaining = set(pending)
+        responses = _merged_pages([partial(fetch_batch, batch) for batch in batches])
+        async with aclosing(responses):
+            async for entries in responses:
+                for entry in entries:
+                    call_id = entry.get("callId")
+                    if call_id in remaining:
+                        remaining.discard(call_id)
+                        yield call_id, _transcript_text(entry)
+
+        for call_id in pending:
+            if call_id in remaining:
+                logger.warning("No transcript found for Gong call %s.", call_id)
+                yield call_id, ""
 
-        call_transcripts = data.get("callTranscripts", [])
-        if not call_transcripts:
-            logger.warning("No transcript found for Gong call %s.", gong_call_id)
-            return ""
+        logger.info(
+            "Fetched transcripts for %d Gong call(s) in %d batch(es).",
+            len(pending) - len(remaining),
+            len(batches),
+        )
 
-        # Concatenate all sentences across all transcript entries.
-        lines: list[str] = []
-        for transcript_entry in call_transcripts:
-            transcript = transcript_entry.get("transcript", [])
-            for segment in transcript:
-                speaker_id = segment.get("speakerId", "Unknown")
-                sentences = segment.get("sentences", [])
-                for sentence in sentences:
-                    text = sentence.get("text", "").strip()
-                    if text:
-                        lines.append(f"[Speaker {speaker_id}]: {text}")
 
-        full_text = "\n".join(lines)
+async def _merged_pages(
+    producers: list[Callable[[asyncio.Queue], Awaitable[None]]],
+) -> AsyncIterator[list]:
+    """Run *producers* concurrently and yield what they put on their queue.
 
-        logger.info(
-            "Fetched transcript for call %s (%d characters).",
-            gong_call_id,
-            len(full_text),
-        )
-        return full_text
+    Each producer is called with a shared ``asyncio.Queue`` and puts pages on
+    it.  Pages are yielded in arrival order until every producer has
+    returned.  If one fails, the others are cancelled and its exception is
+    raised; they are also cancelled when the caller stops iterating early.
+    """
+    pages: asyncio.Queue = asyncio.Queue()
+    tasks = [asyncio.create_task(producer(pages)) for producer in producers]
+    done = asyncio.gather(*tasks)
+    try:
+        while True:
+            get = asyncio.ensure_future(pages.get())
+            await asyncio.wait({get, done}, return_when=asyncio.FIRST_COMPLETED)
+            if get.done():
+                yield get.result()
+                continue
+            get.cancel()
+            done.result()  # re-raises a failed producer
+            if pages.empty():
+                return
+            yield pages.get_nowait()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if done.done() and not done.cancelled():
+            done.exception()  # consumed, even if the caller stopped early
+
+
+def _shard_window(
+    date_from: str, date_to: str, total_pages: int
+) -> list[tuple[str, str]]:
+    """Split a search window into contiguous shards for *total_pages* pages.
+
+    Returns ``(from, to)`` pairs in Gong's datetime format; a single pair
+    (the window itself) when sharding would not pay off.
+    """
+    start = datetime.fromisoformat(date_from)
+    end = datetime.fromisoformat(date_to)
+    count = min(
+        math.ceil(total_pages / SHARD_PAGES),
+        MAX_SHARDS,
+        (end - start) // MIN_SHARD_SPAN,
+    )
+    if count < 2:
+        return [(date_from, date_to)]
+    bounds = [start + (end - start) * i / count for i in range(count)]
+    bounds = [bound.strftime(GONG_DATETIME_FORMAT) for bound in bounds]
+    return list(zip(bounds, [*bounds[1:], date_to]))
+
+
+def _normalize_call(call: dict) -> dict:
+    """Flatten a ``/calls/extensive`` entry into the metadata we store."""
+    meta = call.get("metaData", {})
+    return {
+        "gong_call_id": meta.get("id", ""),
+        "title": meta.get("title", ""),
+        "started": meta.get("started", ""),
+        "duration_seconds": meta.get("duration", 0),
+        "participant_emails": [
+            p.get("emailAddress", "").lower()
+            for p in call.get("parties", [])
+            if p.get("emailAddress")
+        ],
+        "url": meta.get("url", ""),
+    }
+
+
+def _transcript_text(call_transcript: dict) -> str:
+    """Join the sentences of one ``callTranscripts`` entry, one per line."""
+    lines: list[str] = []
+    for segment in call_transcript.get("transcript", []):
+        speaker_id = segment.get("speakerId", "Unknown")
+        for sentence in segment.get("sentences", []):
+            text = sentence.get("text", "").strip()
+            if text:
+                lines.append(f"[Speaker {speaker_id}]: {text}")
+    return "\n".join(lines)
+
+
+def get_gong_service(request: Request) -> GongService:
+    """FastAPI dependency: the process-wide service created in the lifespan."""
+    return request.app.state.gong_service
@@ -0,0 +1,36 @@
+"""Eager-loading policy for response schemas that nest relationships.
+
+Serializing an ORM row into a schema with nested collections touches the
+relationship of every row; left lazy that is one SELECT per row.  Routers
+returning these schemas apply the policy to their query::
+
+    db.query(Phase).options(*load_options(PhaseResponse))
+
+and parent queries chain it onto their own loaders::
+
+    selectinload(POC.phases).options(*load_options(PhaseResponse))
+
+``selectinload`` costs one extra query per nested collection regardless of
+row count; ``joinedload`` is used for to-one relationships.
+"""
+
+from pydantic import BaseModel
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.models.phase import Phase
+from app.models.poc import POC
+from app.models.tech_stack import TechStackEntry
+from app.schemas.phase import PhaseResponse
+from app.schemas.poc import POCResponse
+from app.schemas.tech_stack import TechStackEntryResponse
+
+LOAD_POLICIES: dict[type[BaseModel], tuple] = {
+    PhaseResponse: (selectinload(Phase.tasks),),
+    TechStackEntryResponse: (selectinload(TechStackEntry.doc_links),),
+    POCResponse: (joinedload(POC.value_framework),),
+}
+
+
+def load_options(schema: type[BaseModel]) -> tuple:
+    """Loader options that let *schema* serialize without lazy loads."""
+    return LOAD_POLICIES.get(schema, ())
@@ -0,0 +1,199 @@
+"""Drag-and-drop ordering with sparse integer sort keys.
+
+Sortable rows keep their ``sort_order`` integer column, but keys are spaced
+``SORT_GAP`` apart, so moving an item between two neighbours writes the
+midpoint of their keys to that one row.  When two neighbours have no
+integer left between them (or a key drifts past ``MAX_SORT_KEY``) the
+whole scope is renumbered in one ``UPDATE`` and the move retried; with a
+gap of 1024 that takes about ten moves into the same slot.
+
+A *scope* is the set of rows ordered against each other, e.g. the tasks of
+one phase or one side of a POC's team.
+"""
+
+import uuid
+
+from fastapi import HTTPException
+from sqlalchemy import func, or_, select, tuple_, update
+from sqlalchemy.orm import Session
+
+from app.models.mutual_action_plan import Milestone
+from app.models.phase import Phase, Task
+from app.models.success_criteria import SuccessCriterion
+from app.models.team_member import TeamMember
+from app.services.change_tracking import TRACKED_MODELS, Change, record_changes
+
+# Distance between neighbouring keys after a rebalance.
+SORT_GAP = 1024
+
+# Keys beyond +/- this trigger a rebalance (sort_order is a 32-bit column).
+MAX_SORT_KEY = 2**30
+
+# Columns whose values define an ordering scope, per sortable model.
+SCOPE_COLUMNS = {
+    Milestone: ("poc_id",),
+    Phase: ("poc_id",),
+    Task: ("poc_id", "phase_id"),
+    SuccessCriterion: ("poc_id",),
+    TeamMember: ("poc_id", "team_side"),
+}
+
+
+def _scope_filter(model, item) -> list:
+    return [
+        getattr(model, name) == getattr(item, name) for name in SCOPE_COLUMNS[model]
+    ]
+
+
+def _sort_position(model):
+    return tuple_(model.sort_order, model.id)
+
+
+def next_sort_key(db: Session, model, **scope_values) -> int:
+    """Key for a row appended to a scope: the scope's last key + ``SORT_GAP``.
+
+    *scope_values* name the scope (``SCOPE_COLUMNS`` of *model*), e.g.
+    ``poc_id=..., phase_id=...`` for a task.  Gapped keys let the first
+    move into the scope update a single row.
+    """
+    last = db.scalar(
+        select(func.max(model.sort_order)).where(
+            *(getattr(model, name) == value for name, value in scope_values.items())
+        )
+    )
+    return SORT_GAP if last is None else last + SORT_GAP
+
+
+# ---------------------------------------------------------------------------
+# Rebalancing
+# ---------------------------------------------------------------------------
+
+def rebalance_scope(db: Session, model, scope: list) -> int:
+    """Renumber the rows matching *scope* to ``SORT_GAP, 2 * SORT_GAP, ...``.
+
+    Keeps the current ``(sort_order, id)`` order and only writes rows whose
+    key changes.  Returns the number of rows rewritten.
+    """
+    table = model.__table__
+    ranked = (
+        select(
+            model.id,
+            (
+                func.row_number().over(order_by=(model.sort_order, model.id))
+                * SORT_GAP
+            ).label("new_key"),
+        )
+        .where(*scope)
+        .subquery()
+    )
+    rows = db.execute(
+        update(table)
+        .where(table.c.id == ranked.c.id, table.c.sort_order != ranked.c.new_key)
+        .values(sort_order=ranked.c.new_key)
+        .returning(table.c.id, table.c.poc_id)
+    ).all()
+    entity_type = TRACKED_MODELS[model]
+    record_changes(
+        db, [Change(poc_id, entity_type, row_id, "update") for row_id, poc_id in rows]
+    )
+    # Rows already loaded in the session must not keep their old keys.
+    db.expire_all()
+    return len(rows)
+
+
+def rebalance_all(db: Session, model) -> int:
+    """Rebalance every scope of *model* that has run out of room somewhere.
+
+    A scope qualifies when two neighbours are less than 2 apart (including
+    the dense ``0, 1, 2, ...`` keys written before keys were gapped) or a
+    key is halfway to ``MAX_SORT_KEY``.  Returns the number of rows
+    rewritten; the caller commits.
+    """
+    columns = [getattr(model, name) for name in SCOPE_COLUMNS[model]]
+    gaps = select(
+        *columns,
+        model.sort_order,
+        (
+            model.sort_order
+            - func.lag(model.sort_order).over(
+                partition_by=columns, order_by=(model.sort_order, model.id)
+            )
+        ).label("gap"),
+    ).subquery()
+    scope_columns = [gaps.c[name] for name in SCOPE_COLUMNS[model]]
+    crowded = db.execute(
+        select(*scope_columns)
+        .where(
+            or_(
+                gaps.c.gap < 2,
+                func.abs(gaps.c.sort_order) > MAX_SORT_KEY // 2,
+            )
+        )
+        .distinct()
+    ).all()
+    fixed = 0
+    for values in crowded:
+        scope = [column == value for column, value in zip(columns, values)]
+        fixed += rebalance_scope(db, model, scope)
+    return fixed
+
+
+# ---------------------------------------------------------------------------
+# Moves
+# ---------------------------------------------------------------------------
+
+def _key_after(db: Session, model, item, scope: list, after) -> int | None:
+    """A free key right after *after* (or first, if ``None``), else ``None``."""
+    siblings = select(model.sort_order).where(*scope, model.id != item.id)
+    if after is None:
+        first = db.scalar(siblings.order_by(model.sort_order, model.id).limit(1))
+        key = SORT_GAP if first is None else first - SORT_GAP
+    else:
+        following = db.scalar(
+            siblings.where(
+                _sort_position(model) > tuple_(after.sort_order, after.id)
+            )
+            .order_by(model.sort_order, model.id)
+            .limit(1)
+        )
+        if following is None:
+            key = after.sort_order + SORT_GAP
+        elif following - after.sort_order >= 2:
+            key = (after.sort_order + following) // 2
+        else:
+            return None
+    return key if abs(key) <= MAX_SORT_KEY else None
+
+
+def move_item(db: Session, model, item, after_id: uuid.UUID | None, **scope_values):
+    """Move *item* directly after sibling *after_id* (to the top if ``None``).
+
+    *scope_values* move the item into another scope first (e.g. a task's
+    ``phase_id``).  Normally a single-row update; renumbers the scope first
+    when the neighbours' keys leave no room.  The caller commits.
+    """
+    for name, value in scope_values.items():
+        setattr(item, name, value)
+    scope = _scope_filter(model, item)
+
+    after = None
+    if after_id is not None:
+        if after_id == item.id:
+            raise HTTPException(
+                status_code=400, detail="Cannot move an item after itself"
+            )
+        after = db.scalar(select(model).where(model.id == after_id, *scope))
+        if after is None:
+            raise HTTPException(
+                status_code=400, detail=f"{after_id} is not a sibling of this item"
+            )
+
+    key = _key_after(db, model, item, scope, after)
+    if key is None:
+        db.flush()
+        rebalance_scope(db, model, scope)
+        if after is not None:
+            db.refresh(after)
+        key = _key_after(db, model, item, scope, after)
+    item.sort_order = key
+    return item
@@ -1,11 +1,18 @@
 """Utility service for POC lifecycle operations and progress calculations."""
 
 import logging
+import secrets
+import uuid
+from collections.abc import Iterable
 from datetime import date
 
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
 from app.models.poc import POC
 from app.models.phase import Phase, Task
 from app.models.mutual_action_plan import Milestone
+from app.schemas.poc import POCCreate
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +22,135 @@ COMPLETED_STATUSES = {"completed", "done"}
 # Task statuses that count as "in progress".
 IN_PROGRESS_STATUSES = {"in_progress", "in progress"}
 
+# Default number of POCs rebuilt per transaction by the counter reconciler.
+RECONCILE_BATCH_SIZE = 500
+
+
+def _counter_delta(
+    prefix: str,
+    removed: Iterable[str | None],
+    added: Iterable[str | None],
+) -> dict[str, int]:
+    """Translate removed/added statuses into deltas for the ``pocs`` counters.
+
+    ``prefix`` is ``"tasks"`` or ``"milestones"``; the returned keys are the
+    matching ``POC`` column names (``total_tasks``, ``completed_tasks``, ...).
+    """
+    delta = {
+        f"total_{prefix}": 0,
+        f"completed_{prefix}": 0,
+        f"in_progress_{prefix}": 0,
+    }
+    for statuses, sign in ((removed, -1), (added, 1)):
+        for status in statuses:
+            normalized = (status or "").lower()
+            delta[f"total_{prefix}"] += sign
+            if normalized in COMPLETED_STATUSES:
+                delta[f"completed_{prefix}"] += sign
+            elif normalized in IN_PROGRESS_STATUSES:
+                delta[f"in_progress_{prefix}"] += sign
+    return delta
+
+
+def _status_counts(model, poc_ids: list | None = None):
+    """Subquery of total / completed / in-progress row counts per ``poc_id``.
+
+    Restricted to *poc_ids* when given, otherwise covers every POC.
+    """
+    status = func.lower(model.status)
+    is_completed = status.in_(sorted(COMPLETED_STATUSES))
+    is_in_progress = status.in_(sorted(IN_PROGRESS_STATUSES))
+    query = select(
+        model.poc_id.label("poc_id"),
+        func.count().label("total"),
+        func.count().filter(is_completed).label("completed"),
+        func.count().filter(is_in_progress).label("in_progress"),
+    ).group_by(model.poc_id)
+    if poc_ids is not None:
+        query = query.where(model.poc_id.in_(poc_ids))
+    return query.subquery()
+
+
+def _pct(part: int, total: int) -> float:
+    return (part / total * 100.0) if total > 0 else 0.0
+
+
+def _summarize(
+    total_milestones: int,
+    completed_milestones: int,
+    total_tasks: int,
+    completed_tasks: int,
+    in_progress_tasks: int,
+) -> dict:
+    """Turn raw milestone/task counts into the headline progress numbers."""
+    milestones_pct = _pct(completed_milestones, total_milestones)
+    tasks_pct = _pct(completed_tasks, total_tasks)
+
+    # If there are both milestones and tasks, weight milestones 40% and tasks 60%.
+    # If only one category exists, use that alone.
+    if total_milestones > 0 and total_tasks > 0:
+        overall_pct = milestones_pct * 0.4 + tasks_pct * 0.6
+    elif total_milestones > 0:
+        overall_pct = milestones_pct
+    elif total_tasks > 0:
+        overall_pct = tasks_pct
+    else:
+        overall_pct = 0.0
+
+    return {
+        "total_milestones": total_milestones,
+        "completed_milestones": completed_milestones,
+        "milestones_pct": round(milestones_pct, 1),
+        "total_tasks": total_tasks,
+        "completed_tasks": completed_tasks,
+        "in_progress_tasks": in_progress_tasks,
+        "tasks_pct": round(tasks_pct, 1),
+        "overall_pct": round(overall_pct, 1),
+    }
+
+
+def _phase_progress(
+    phase_id,
+    phase_name: str,
+    sort_order: int,
+    total: int,
+    completed: int,
+    in_progress: int,
+) -> dict:
+    return {
+        "phase_id": phase_id,
+        "phase_name": phase_name,
+        "sort_order": sort_order,
+        "total_tasks": total,
+        "completed_tasks": completed,
+        "in_progress_tasks": in_progress,
+        "not_started_tasks": total - completed - in_progress,
+        "completion_pct": round(_pct(completed, total), 1),
+    }
+
+
+def _assemble_progress(
+    total_milestones: int,
+    completed_milestones: int,
+    phases: list[dict],
+    poc_start_date: date | None,
+    poc_end_date: date | None,
+) -> dict:
+    """Build the full :meth:`POCService.calculate_progress` structure."""
+    progress = _summarize(
+        total_milestones=total_milestones,
+        completed_milestones=completed_milestones,
+        total_tasks=sum(p["total_tasks"] for p in phases),
+        completed_tasks=sum(p["completed_tasks"] for p in phases),
+        in_progress_tasks=sum(p["in_progress_tasks"] for p in phases),
+    )
+
+    today = date.today()
+    progress["phases"] = phases
+    progress["days_remaining"] = (poc_end_date - today).days if poc_end_date else None
+    progress["days_elapsed"] = (today - poc_start_date).days if poc_start_date else None
+    return progress
+
 
 class POCService:
     """Stateless utility service for computing POC progress and metrics.
@@ -22,6 +158,29 @@ class POCService:
     All methods are static -- no instance state is required.
     """
 
+    @staticmethod
+    def build_poc(payload: POCCreate) -> POC:
+        """Return a new, unsaved draft POC with a fresh id and share token."""
+        return POC(
+            id=uuid.uuid4(),
+            account_name=payload.account_name,
+            account_domain=payload.account_domain,
+            opportunity_name=payload.opportunity_name,
+            poc_start_date=payload.poc_start_date,
+            poc_end_date=payload.poc_end_date,
+            notes=payload.notes,
+            share_token=secrets.token_urlsafe(32),
+            status="draft",
+            # Column defaults only apply at INSERT; set the counters now so
+            # they can be adjusted before the POC is flushed.
+            total_tasks=0,
+            completed_tasks=0,
+            in_progress_tasks=0,
+            total_milestones=0,
+            completed_milestones=0,
+            in_progress_milestones=0,
+        )
+
     @staticmethod
     def calculate_progress(poc: POC) -> dict:
         """Calculate completion progress across all milestones and phases of a POC.
@@ -54,72 +213,152 @@ class POCService:
         milestones: list[Milestone] = poc.milestones or []
         phases: list[Phase] = poc.phases or []
 
-        # --- Milestones ---
-        total_milestones = len(milestones)
         completed_milestones = sum(
             1
             for m in milestones
             if (m.status or "").lower() in COMPLETED_STATUSES
         )
-        milestones_pct = (
-            (completed_milestones / total_milestones * 100.0)
-            if total_milestones > 0
-            else 0.0
+        phase_progress_list = [POCService.get_phase_progress(p) for p in phases]
+
+        return _assemble_progress(
+            total_milestones=len(milestones),
+            completed_milestones=completed_milestones,
+            phases=phase_progress_list,
+            poc_start_date=poc.poc_start_date,
+            poc_end_date=poc.poc_end_date,
+        )
+
+    @staticmethod
+    def calculate_progress_sql(db: Session, poc_id) -> dict | None:
+        """Compute :meth:`calculate_progress` for a POC entirely in SQL.
+
+        Issues a single statement: ``pocs`` left-joined to its phases and their
+        tasks, grouped per phase, with the milestone counts as scalar
+        subqueries.  No milestone, phase or task rows are loaded.
+
+        Returns
+        -------
+        dict | None
+            The same structure as :meth:`calculate_progress`, or ``None`` if
+            the POC does not exist.
+        """
+        milestone_status = func.lower(Milestone.status)
+        milestone_total = (
+            select(func.count())
+            .where(Milestone.poc_id == POC.id)
+            .scalar_subquery()
+        )
+        milestone_completed = (
+            select(func.count())
+            .where(
+                Milestone.poc_id == POC.id,
+                milestone_status.in_(sorted(COMPLETED_STATUSES)),
+            )
+            .scalar_subquery()
         )
+        task_status = func.lower(Task.status)
 
-        # --- Tasks (aggregated across all phases) ---
-        total_tasks = 0
-        completed_tasks = 0
-        in_progress_tasks = 0
-        phase_progress_list: list[dict] = []
+        rows = db.execute(
+            select(
+                POC.poc_start_date,
+                POC.poc_end_date,
+                milestone_total.label("total_milestones"),
+                milestone_completed.label("completed_milestones"),
+                Phase.id.label("phase_id"),
+                Phase.name.label("phase_name"),
+                Phase.sort_order,
+                func.count(Task.id).label("total"),
+                func.count(Task.id)
+                .filter(task_status.in_(sorted(COMPLETED_STATUSES)))
+                .label("completed"),
+                func.count(Task.id)
+                .filter(task_status.in_(sorted(IN_PROGRESS_STATUSES)))
+                .label("in_progress"),
+            )
+            .select_from(POC)
+            .outerjoin(Phase, Phase.poc_id == POC.id)
+            .outerjoin(Task, Task.phase_id == Phase.id)
+            .where(POC.id == poc_id)
+            .group_by(POC.id, Phase.id)
+            .order_by(Phase.sort_order, Phase.id)
+        ).all()
+        if not rows:
+            return None
 
-        for phase in phases:
-            phase_data = POCService.get_phase_progress(phase)
-            phase_progress_list.append(phase_data)
+        first = rows[0]
+        phases = [
+            _phase_progress(
+                row.phase_id,
+                row.phase_name,
+                row.sort_order,
+                row.total,
+                row.completed,
+                row.in_progress,
+            )
+            for row in rows
+            if row.phase_id is not None
+        ]
+        return _assemble_progress(
+            total_milestones=first.total_milestones,
+            completed_milestones=first.completed_milestones,
+            phases=phases,
+            poc_start_date=first.poc_start_date,
+            poc_end_date=first.poc_end_date,
+        )
 
-            total_tasks += phase_data["total_tasks"]
-            completed_tasks += phase_data["completed_tasks"]
-            in_progress_tasks += phase_data["in_progress_tasks"]
+    @staticmethod
+    def progress_from_counters(poc: POC) -> dict:
+        """Summarize progress from the POC's denormalized counters.
 
-        tasks_pct = (
-            (completed_tasks / total_tasks * 100.0) if total_tasks > 0 else 0.0
+        Same weighting and status semantics as :meth:`calculate_progress`, but
+        O(1): no child rows are read.  The per-phase breakdown and the date
+        fields are omitted.
+        """
+        return _summarize(
+            total_milestones=poc.total_milestones,
+            completed_milestones=poc.completed_milestones,
+            total_tasks=poc.total_tasks,
+            completed_tasks=poc.completed_tasks,
+            in_progress_tasks=poc.in_progress_tasks,
         )
 
-        # --- Overall (weighted) ---
-        # If there are both milestones and tasks, weight milestones 40% and tasks 60%.
-        # If only one category exists, use that alone.
-        if total_milestones > 0 and total_tasks > 0:
-            overall_pct = milestones_pct * 0.4 + tasks_pct * 0.6
-        elif total_milestones > 0:
-            overall_pct = milestones_pct
-        elif total_tasks > 0:
-            overall_pct = tasks_pct
-        else:
-            overall_pct = 0.0
-
-        # --- Date calculations ---
-        today = date.today()
-        days_remaining: int | None = None
-        days_elapsed: int | None = None
-
-        if poc.poc_end_date:
-            days_remaining = (poc.poc_end_date - today).days
-
-        if poc.poc_start_date:
-            days_elapsed = (today - poc.poc_start_date).days
+    @staticmethod
+    def bulk_progress(db: Session, poc_ids: list | None = None) -> dict:
+        """Compute :meth:`progress_from_counters`-style summaries for many POCs.
+
+        Counts are aggregated straight from ``tasks`` and ``milestones`` (not
+        the denormalized counters) with one grouped statement.
+
+        Parameters
+        ----------
+        poc_ids:
+            POCs to include; ``None`` means every POC.
+
+        Returns
+        -------
+        dict
+            Mapping of POC id to the summary dict.
+        """
+        task_counts = _status_counts(Task, poc_ids)
+        milestone_counts = _status_counts(Milestone, poc_ids)
+        query = (
+            select(
+                POC.id,
+                func.coalesce(milestone_counts.c.total, 0),
+                func.coalesce(milestone_counts.c.completed, 0),
+                func.coalesce(task_counts.c.total, 0),
+                func.coalesce(task_counts.c.completed, 0),
+                func.coalesce(task_counts.c.in_progress, 0),
+            )
+            .outerjoin(task_counts, task_counts.c.poc_id == POC.id)
+            .outerjoin(milestone_counts, milestone_counts.c.poc_id == POC.id)
+        )
+        if poc_ids is not None:
+            query = query.where(POC.id.in_(poc_ids))
 
         return {
-            "total_milestones": total_milestones,
-            "completed_milestones": completed_milestones,
-            "milestones_pct": round(milestones_pct, 1),
-            "total_tasks": total_tasks,
-            "completed_tasks": completed_tasks,
-            "in_progress_tasks": in_progress_tasks,
-            "tasks_pct": round(tasks_pct, 1),
-            "overall_pct": round(overall_pct, 1),
-            "phases": phase_progress_list,
-            "days_remaining": days_remaining,
-            "days_elapsed": days_elapsed,
+            poc_id: _summarize(*counts)
+            for poc_id, *counts in db.execute(query)
         }
 
     @staticmethod
@@ -146,7 +385,6 @@ class POCService:
             - ``completion_pct`` (float): 0.0 -- 100.0
         """
         tasks: list[Task] = phase.tasks or []
-        total = len(tasks)
 
         completed = sum(
             1 for t in tasks if (t.status or "").lower() in COMPLETED_STATUSES
@@ -154,17 +392,117 @@ class POCService:
         in_progress = sum(
             1 for t in tasks if (t.status or "").lower() in IN_PROGRESS_STATUSES
         )
-        not_started = total - completed - in_progress
 
-        completion_pct = (completed / total * 100.0) if total > 0 else 0.0
+        return _phase_progress(
+            phase.id, phase.name, phase.sort_order, len(tasks), completed, in_progress
+        )
 
-        return {
-            "phase_id": phase.id,
-            "phase_name": phase.name,
-            "sort_order": phase.sort_order,
-            "total_tasks": total,
-            "completed_tasks": completed,
-            "in_progress_tasks": in_progress,
-            "not_started_tasks": not_started,
-            "completion_pct": round(completion_pct, 1),
+    # ------------------------------------------------------------------
+    # Denormalized counters
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _apply_counter_delta(db: Session, poc_id, delta: dict[str, int]) -> None:
+        """Atomically add *delta* to the counter columns of a single POC row."""
+        changes = {
+            getattr(POC, column): getattr(POC, column) + amount
+            for column, amount in delta.items()
+            if amount
         }
+        if not changes:
+            return
+        db.query(POC).filter(POC.id == poc_id).update(
+            changes, synchronize_session=False
+        )
+
+    @staticmethod
+    def adjust_task_counters(
+        db: Session,
+        poc_id,
+        removed: Iterable[str | None] = (),
+        added: Iterable[str | None] = (),
+    ) -> None:
+        """Update the POC's task counters for tasks leaving and entering a state.
+
+        Call with the task status(es) that were *removed* (deleted tasks, or the
+        old status of an updated task) and *added* (new tasks, or the new
+        status).  Runs inside the caller's transaction.
+        """
+        POCService._apply_counter_delta(
+            db, poc_id, _counter_delta("tasks", removed, added)
+        )
+
+    @staticmethod
+    def adjust_milestone_counters(
+        db: Session,
+        poc_id,
+        removed: Iterable[str | None] = (),
+        added: Iterable[str | None] = (),
+    ) -> None:
+        """Milestone counterpart of :meth:`adjust_task_counters`."""
+        POCService._apply_counter_delta(
+            db, poc_id, _counter_delta("milestones", removed, added)
+        )
+
+    @staticmethod
+    def reconcile_progress_counters(
+        db: Session, batch_size: int = RECONCILE_BATCH_SIZE
+    ) -> int:
+        """Rebuild the denormalized counters on ``pocs`` from ``tasks`` and
+        ``milestones``.
+
+        POCs are processed in primary-key order, ``batch_size`` at a time, with
+        one aggregate ``UPDATE ... FROM`` and one commit per batch.  Only rows
+        whose counters actually drifted are written.
+
+        Returns
+        -------
+        int
+            Number of POC rows that were corrected.
+        """
+        fixed = 0
+        last_id = None
+
+        while True:
+            id_query = select(POC.id).order_by(POC.id).limit(batch_size)
+            if last_id is not None:
+                id_query = id_query.where(POC.id > last_id)
+            batch_ids = list(db.execute(id_query).scalars())
+            if not batch_ids:
+                break
+            last_id = batch_ids[-1]
+
+            task_counts = _status_counts(Task, batch_ids)
+            milestone_counts = _status_counts(Milestone, batch_ids)
+            actual = (
+                select(
+                    POC.id.label("id"),
+                    *(
+                        func.coalesce(counts.c[kind], 0).label(f"{kind}_{prefix}")
+                        for counts, prefix in (
+                            (task_counts, "tasks"),
+                            (milestone_counts, "milestones"),
+                        )
+                        for kind in ("total", "completed", "in_progress")
+                    ),
+                )
+                .outerjoin(task_counts, task_counts.c.poc_id == POC.id)
+                .outerjoin(milestone_counts, milestone_counts.c.poc_id == POC.id)
+                .where(POC.id.in_(batch_ids))
+                .subquery()
+            )
+
+            columns = [c for c in actual.c.keys() if c != "id"]
+            result = db.execute(
+                POC.__table__.update()
+                .where(POC.id == actual.c.id)
+                .where(
+                    or_(*(getattr(POC, c) != actual.c[c] for c in columns))
+                )
+                .values({c: actual.c[c] for c in columns})
+            )
+            db.commit()
+            fixed += result.rowcount or 0
+
+        logger.info("Reconciled progress counters; %d POC(s) corrected.", fixed)
+        return fixed
@@ -0,0 +1,203 @@
+"""Precomputed portfolio metrics backing the sales-leadership dashboard."""
+
+import asyncio
+import logging
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.mutual_action_plan import Milestone
+from app.models.poc import POC
+from app.models.portfolio import PortfolioMetrics
+from app.services.poc_service import COMPLETED_STATUSES, POCService
+
+logger = logging.getLogger(__name__)
+
+# Postgres advisory lock key ensuring only one worker refreshes at a time.
+REFRESH_LOCK_KEY = 0x504F5254
+
+# Rows per multi-row upsert statement during a refresh.
+UPSERT_CHUNK_SIZE = 1000
+
+# POC statuses left out of the "ending soon" and "overdue" views.
+INACTIVE_STATUSES = {"completed", "archived"}
+
+
+class PortfolioService:
+    """Rebuilds and reads the ``portfolio_metrics`` table.
+
+    All methods are static -- no instance state is required.
+    """
+
+    @staticmethod
+    def refresh(db: Session) -> int | None:
+        """Recompute metrics for every POC and upsert them in bulk.
+
+        Progress comes from :meth:`POCService.bulk_progress`; overdue
+        milestones (due before today and not completed) are aggregated in the
+        same pass.  Commits on success.
+
+        Returns
+        -------
+        int | None
+            Number of POC rows written, or ``None`` if another worker holds
+            the refresh lock.
+        """
+        locked = db.execute(
+            select(func.pg_try_advisory_xact_lock(REFRESH_LOCK_KEY))
+        ).scalar()
+        if not locked:
+            return None
+
+        today = date.today()
+        refreshed_at = datetime.now(timezone.utc)
+        progress = POCService.bulk_progress(db)
+
+        overdue = (
+            select(
+                Milestone.poc_id.label("poc_id"),
+                func.count().label("count"),
+                func.min(Milestone.due_date).label("oldest"),
+            )
+            .where(
+                Milestone.due_date < today,
+                func.lower(Milestone.status).not_in(sorted(COMPLETED_STATUSES)),
+            )
+            .group_by(Milestone.poc_id)
+            .subquery()
+        )
+        pocs = db.execute(
+            select(
+                POC.id,
+                POC.account_name,
+                POC.status,
+                POC.poc_start_date,
+                POC.poc_end_date,
+                POC.total_milestones,
+                POC.completed_milestones,
+                POC.total_tasks,
+                POC.completed_tasks,
+                POC.in_progress_tasks,
+                func.coalesce(overdue.c.count, 0).label("overdue_count"),
+                overdue.c.oldest,
+            ).outerjoin(overdue, overdue.c.poc_id == POC.id)
+        ).all()
+
+        rows = [
+            {
+                "poc_id": poc.id,
+                "account_name": poc.account_name,
+                "status": poc.status,
+                "poc_start_date": poc.poc_start_date,
+                "poc_end_date": poc.poc_end_date,
+                "overdue_milestones": poc.overdue_count,
+                "oldest_overdue_due_date": poc.oldest,
+                "refreshed_at": refreshed_at,
+                # A POC committed after ``bulk_progress`` ran is not in it;
+                # its denormalized counters are current enough.
+                **(progress.get(poc.id) or POCService.progress_from_counters(poc)),
+            }
+            for poc in pocs
+        ]
+
+        for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            stmt = pg_insert(PortfolioMetrics).values(
+                rows[start : start + UPSERT_CHUNK_SIZE]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[PortfolioMetrics.poc_id],
+                set_={
+                    column.name: stmt.excluded[column.name]
+                    for column in PortfolioMetrics.__table__.columns
+                    if column.name != "poc_id"
+                },
+            )
+            db.execute(stmt)
+
+        db.commit()
+        logger.info("Refreshed portfolio metrics for %d POC(s).", len(rows))
+        return len(rows)
+
+    @staticmethod
+    def get_dashboard(
+        db: Session,
+        ending_within_days: int,
+        low_completion_pct: float,
+    ) -> dict:
+        """Read the dashboard from the precomputed table.
+
+        Returns
+        -------
+        dict
+            - ``refreshed_at``: time of the last refresh, or ``None``.
+            - ``status_counts``: number of POCs per status.
+            - ``ending_soon``: active POCs ending within *ending_within_days*
+              whose overall progress is below *low_completion_pct*.
+            - ``overdue``: active POCs with at least one overdue milestone.
+        """
+        today = date.today()
+        active = PortfolioMetrics.status.not_in(sorted(INACTIVE_STATUSES))
+
+        status_counts = dict(
+            db.execute(
+                select(PortfolioMetrics.status, func.count()).group_by(
+                    PortfolioMetrics.status
+                )
+            ).all()
+        )
+        refreshed_at = db.execute(
+            select(func.max(PortfolioMetrics.refreshed_at))
+        ).scalar()
+        ending_soon = (
+            db.query(PortfolioMetrics)
+            .filter(
+                active,
+                PortfolioMetrics.poc_end_date >= today,
+                PortfolioMetrics.poc_end_date
+                <= today + timedelta(days=ending_within_days),
+                PortfolioMetrics.overall_pct < low_completion_pct,
+            )
+            .order_by(PortfolioMetrics.poc_end_date, PortfolioMetrics.overall_pct)
+            .all()
+        )
+        overdue = (
+            db.query(PortfolioMetrics)
+            .filter(active, PortfolioMetrics.overdue_milestones > 0)
+            .order_by(
+                PortfolioMetrics.oldest_overdue_due_date,
+                PortfolioMetrics.overdue_milestones.desc(),
+            )
+            .all()
+        )
+
+        return {
+            "refreshed_at": refreshed_at,
+            "status_counts": status_counts,
+            "ending_soon": ending_soon,
+            "overdue": overdue,
+        }
+
+
+def _refresh_in_new_session() -> None:
+    db = SessionLocal()
+    try:
+        PortfolioService.refresh(db)
+    finally:
+        db.close()
+
+
+async def refresh_periodically(interval_seconds: int) -> None:
+    """Refresh the portfolio metrics every *interval_seconds* until cancelled.
+
+    Started from the FastAPI lifespan; the blocking refresh runs in a worker
+    thread so the event loop stays responsive.
+    """
+    while True:
+        try:
+            await asyncio.to_thread(_refresh_in_new_session)
+        except Exception:
+            logger.exception("Portfolio metrics refresh failed.")
+        await asyncio.sleep(interval_seconds)
@@ -0,0 +1,148 @@
+"""Data access for POC child entities, scoped to their POC in one statement.
+
+Routers used to load the POC and then the child (create_task even loaded
+the phase in between).  These helpers fold the parent check into the
+statement that does the work:
+
+* :func:`get_child_or_404` loads the child with a ``LEFT JOIN`` from
+  ``pocs``, so one round trip tells "POC not found" from "child not found";
+* :func:`update_child_or_404` / :func:`delete_child_or_404` are a single
+  ``UPDATE/DELETE ... WHERE id = :id AND poc_id = :poc_id RETURNING``; only
+  when nothing matched is a second query spent to pick the 404 message;
+* :func:`flush_or_404` lets an ``INSERT`` check its POC through the foreign
+  key instead of a ``SELECT`` beforehand.
+
+Writes made here bypass the ORM unit of work, so they log their changes
+with ``record_changes`` themselves.
+"""
+
+import uuid
+
+from fastapi import HTTPException
+from sqlalchemy import and_, delete, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.poc import POC
+from app.services.change_tracking import TRACKED_MODELS, Change, record_changes
+
+
+def _not_found(db: Session, poc_id: uuid.UUID, label: str) -> HTTPException:
+    """The 404 for a scoped statement that matched nothing."""
+    if db.query(POC.id).filter(POC.id == poc_id).first() is None:
+        return HTTPException(status_code=404, detail="POC not found")
+    return HTTPException(status_code=404, detail=f"{label} not found")
+
+
+def get_child_or_404(
+    db: Session,
+    model,
+    poc_id: uuid.UUID,
+    child_id: uuid.UUID,
+    label: str,
+    *options,
+):
+    """Load *model* row *child_id* of POC *poc_id* in one query.
+
+    Raises 404 "POC not found" or "<label> not found" as appropriate.
+    *options* are loader options for the child.
+    """
+    row = (
+        db.query(POC.id, model)
+        .outerjoin(model, and_(model.id == child_id, model.poc_id == POC.id))
+        .options(*options)
+        .filter(POC.id == poc_id)
+        .first()
+    )
+    if row is None:
+        raise HTTPException(status_code=404, detail="POC not found")
+    if row[1] is None:
+        raise HTTPException(status_code=404, detail=f"{label} not found")
+    return row[1]
+
+
+def update_child_or_404(
+    db: Session,
+    model,
+    poc_id: uuid.UUID,
+    child_id: uuid.UUID,
+    values: dict,
+    label: str,
+) -> Row:
+    """``UPDATE ... RETURNING`` one child row of a POC.
+
+    Returns the updated row; for models with a ``status`` column it also
+    carries ``old_status`` (the value before the update), read through a
+    self-join in the same statement.  With no *values* nothing is written
+    and the current row is returned.
+    """
+    table = model.__table__
+    scope = (table.c.id == child_id, table.c.poc_id == poc_id)
+    has_status = "status" in table.c
+
+    if not values:
+        columns = [*table.c]
+        if has_status:
+            columns.append(table.c.status.label("old_status"))
+        row = db.execute(select(*columns).where(*scope)).first()
+        if row is None:
+            raise _not_found(db, poc_id, label)
+        return row
+
+    statement = update(table).where(*scope).values(**values)
+    if has_status:
+        old = table.alias("old")
+        statement = statement.where(old.c.id == table.c.id).returning(
+            *table.c, old.c.status.label("old_status")
+        )
+    else:
+        statement = statement.returning(*table.c)
+
+    row = db.execute(statement).first()
+    if row is None:
+        raise _not_found(db, poc_id, label)
+    record_changes(db, [Change(poc_id, TRACKED_MODELS[model], row.id, "update")])
+    return row
+
+
+def delete_child_or_404(
+    db: Session,
+    model,
+    poc_id: uuid.UUID,
+    child_id: uuid.UUID,
+    label: str,
+) -> Row:
+    """``DELETE ... RETURNING`` one child row of a POC; returns the deleted row.
+
+    For leaf entities only: rows removed by database cascades are not
+    logged, so entities with ORM-cascaded children should be deleted
+    through the session.
+    """
+    table = model.__table__
+    row = db.execute(
+        delete(table)
+        .where(table.c.id == child_id, table.c.poc_id == poc_id)
+        .returning(*table.c)
+    ).first()
+    if row is None:
+        raise _not_found(db, poc_id, label)
+    record_changes(db, [Change(poc_id, TRACKED_MODELS[model], row.id, "delete")])
+    return row
+
+
+def flush_or_404(db: Session) -> None:
+    """Flush pending inserts, turning a missing POC into a 404.
+
+    Lets create endpoints skip the POC lookup: the ``poc_id`` foreign key
+    rejects the insert instead.  Server defaults are returned by the
+    ``INSERT``, so the new rows can be serialized without a refresh.
+    """
+    try:
+        db.flush()
+    except IntegrityError as exc:
+        db.rollback()
+        constraint = getattr(getattr(exc.orig, "diag", None), "constraint_name", "")
+        if constraint and constraint.endswith("_poc_id_fkey"):
+            raise HTTPException(status_code=404, detail="POC not found")
+        raise
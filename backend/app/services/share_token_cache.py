@@ -0,0 +1,188 @@
+"""In-process cache resolving customer share tokens to POCs."""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from functools import lru_cache
+from typing import NamedTuple
+
+from app.config import get_settings
+from app.services.event_bus import ChangeNotice
+
+
+class ShareTokenEntry(NamedTuple):
+    poc_id: uuid.UUID
+    status: str
+
+
+class _TTLCache:
+    """Bounded LRU whose entries expire ``ttl`` seconds after insertion.
+
+    Not thread-safe on its own; :class:`ShareTokenCache` holds the lock.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, object]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
+
+    def get(self, key: str):
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires, value = item
+        if expires <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: object) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: str):
+        item = self._data.pop(key, None)
+        return item[1] if item else None
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class ShareTokenCache:
+    """Share token -> ``ShareTokenEntry`` lookups with negative caching.
+
+    Known tokens and unknown tokens live in separate LRUs so a burst of
+    guessed tokens can only evict other misses, never real POCs.  Entries
+    expire after their TTL; writes that change a POC's token or status call
+    :meth:`invalidate_poc` so this process never serves a stale entry.
+    Other worker processes learn of such writes through the event bus
+    (:meth:`on_change`), with the TTL as a backstop.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        negative_maxsize: int,
+        negative_ttl: float,
+    ) -> None:
+        self._entries = _TTLCache(maxsize, ttl)
+        self._missing = _TTLCache(negative_maxsize, negative_ttl)
+        self._tokens_by_poc: dict[uuid.UUID, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Public methods
+    # ------------------------------------------------------------------
+
+    def get(self, token: str) -> ShareTokenEntry | bool | None:
+        """Look up *token*.
+
+        Returns the cached entry, ``False`` if the token is cached as
+        unknown, or ``None`` on a miss (the caller should query and then
+        :meth:`put` or :meth:`put_missing`).
+        """
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is not None:
+                self.hits += 1
+                return entry
+            if self._missing.get(token) is not None:
+                self.negative_hits += 1
+                return False
+            self.misses += 1
+            return None
+
+    def put(self, token: str, entry: ShareTokenEntry) -> None:
+        with self._lock:
+            self._missing.pop(token)
+            old_token = self._tokens_by_poc.get(entry.poc_id)
+            if old_token is not None and old_token != token:
+                self._entries.pop(old_token)
+            self._entries.put(token, entry)
+            self._tokens_by_poc[entry.poc_id] = token
+            if len(self._tokens_by_poc) > 2 * self._entries.maxsize:
+                self._prune_reverse_index()
+
+    def put_missing(self, token: str) -> None:
+        with self._lock:
+            self._missing.put(token, True)
+
+    def invalidate_token(self, token: str) -> None:
+        """Forget *token*, whether cached as known or unknown."""
+        with self._lock:
+            entry = self._entries.pop(token)
+            self._missing.pop(token)
+            if entry is not None:
+                self._tokens_by_poc.pop(entry.poc_id, None)
+
+    def invalidate_poc(self, poc_id: uuid.UUID) -> None:
+        """Forget the cached token of POC *poc_id*, if any."""
+        with self._lock:
+            token = self._tokens_by_poc.pop(poc_id, None)
+            if token is not None:
+                self._entries.pop(token)
+
+    def on_change(self, notice: ChangeNotice) -> None:
+        """Event bus handler: drop the entry of a POC changed by any process."""
+        if "poc" in notice.entity_types:
+            self.invalidate_poc(notice.poc_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._missing.clear()
+            self._tokens_by_poc.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.negative_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "negative_size": len(self._missing),
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "hit_ratio": (
+                    round((self.hits + self.negative_hits) / lookups, 4)
+                    if lookups
+                    else 0.0
+                ),
+            }
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _prune_reverse_index(self) -> None:
+        """Drop reverse-index rows whose token was evicted by the LRU."""
+        self._tokens_by_poc = {
+            poc_id: token
+            for poc_id, token in self._tokens_by_poc.items()
+            if token in self._entries
+        }
+
+
+@lru_cache()
+def get_share_token_cache() -> ShareTokenCache:
+    """Return the process-wide share token cache."""
+    settings = get_settings()
+    return ShareTokenCache(
+        maxsize=settings.share_token_cache_size,
+        ttl=settings.share_token_cache_ttl_seconds,
+        negative_maxsize=settings.share_token_negative_cache_size,
+        negative_ttl=settings.share_token_negative_cache_ttl_seconds,
+    )
@@ -0,0 +1,127 @@
+"""Apply many partial task updates in one statement."""
+
+import uuid
+
+from fastapi import HTTPException
+from sqlalchemy import Boolean, case, cast, column, select, update, values
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.models.phase import Phase, Task
+from app.services.change_tracking import Change, record_changes
+from app.services.poc_service import POCService
+
+
+def _batch_update_statement(poc_id: uuid.UUID, updates: list[dict]):
+    """``UPDATE tasks ... FROM (VALUES ...)`` applying every entry of *updates*.
+
+    Each VALUES row carries the task id, one value per column touched by any
+    entry, and - for columns only some entries touch - a ``set_<column>``
+    flag so the other rows keep their current value.  A self-join on the
+    pre-update row lets ``RETURNING`` report the old status alongside the
+    new row.
+    """
+    tasks = Task.__table__
+    fields = sorted({field for entry in updates for field in entry} - {"id"})
+    partial = [f for f in fields if not all(f in entry for entry in updates)]
+
+    columns = [column("id", UUID(as_uuid=True))]
+    for field in fields:
+        columns.append(column(field, tasks.c[field].type))
+        if field in partial:
+            columns.append(column(f"set_{field}", Boolean))
+    rows = []
+    for entry in updates:
+        row = [entry["id"]]
+        for field in fields:
+            row.append(entry.get(field))
+            if field in partial:
+                row.append(field in entry)
+        rows.append(tuple(row))
+    changes = values(*columns, name="changes").data(rows)
+
+    # VALUES columns are typed from their literals; NULL-only columns would
+    # come out as text, so cast back to the target column types.
+    assignments = {}
+    for field in fields:
+        value = cast(changes.c[field], tasks.c[field].type)
+        if field in partial:
+            value = case((changes.c[f"set_{field}"], value), else_=tasks.c[field])
+        assignments[field] = value
+
+    old = tasks.alias("old")
+    return (
+        update(tasks)
+        .where(
+            tasks.c.id == cast(changes.c.id, UUID(as_uuid=True)),
+            tasks.c.poc_id == poc_id,
+            old.c.id == tasks.c.id,
+        )
+        .values(**assignments)
+        .returning(*tasks.c, old.c.status.label("old_status"))
+    )
+
+
+def batch_update_tasks(db: Session, poc_id: uuid.UUID, updates: list[dict]) -> list[Row]:
+    """Apply partial updates to many tasks of a POC in one transaction.
+
+    Parameters
+    ----------
+    updates:
+        One dict per task: ``id`` plus only the fields to change (as from
+        ``model_dump(exclude_unset=True)``).
+
+    Returns
+    -------
+    list[Row]
+        The updated task rows, in the order of *updates*.  Nothing is
+        committed; the caller commits.
+
+    Raises ``HTTPException`` 400 for a repeated task id and 404 if any task
+    or target phase does not belong to the POC, leaving nothing applied.
+    """
+    ids = [entry["id"] for entry in updates]
+    if len(set(ids)) != len(ids):
+        raise HTTPException(status_code=400, detail="Duplicate task id in batch")
+
+    phase_ids = {entry["phase_id"] for entry in updates if entry.get("phase_id")}
+    if phase_ids:
+        found = set(
+            db.scalars(
+                select(Phase.id).where(Phase.id.in_(phase_ids), Phase.poc_id == poc_id)
+            )
+        )
+        if found != phase_ids:
+            raise HTTPException(status_code=404, detail="Phase not found")
+
+    has_changes = any(len(entry) > 1 for entry in updates)
+    if not has_changes:
+        # Nothing to change; still report unknown ids.
+        rows = db.execute(
+            select(*Task.__table__.c, Task.status.label("old_status")).where(
+                Task.id.in_(ids), Task.poc_id == poc_id
+            )
+        ).all()
+    else:
+        rows = db.execute(_batch_update_statement(poc_id, updates)).all()
+
+    by_id = {row.id: row for row in rows}
+    missing = [str(task_id) for task_id in ids if task_id not in by_id]
+    if missing:
+        db.rollback()
+        raise HTTPException(
+            status_code=404, detail=f"Task(s) not found: {', '.join(missing)}"
+        )
+
+    moved = [row for row in rows if row.status != row.old_status]
+    if moved:
+        POCService.adjust_task_counters(
+            db,
+            poc_id,
+            removed=[row.old_status for row in moved],
+            added=[row.status for row in moved],
+        )
+    if has_changes:
+        record_changes(db, [Change(poc_id, "task", row.id, "update") for row in rows])
+    return [by_id[task_id] for task_id in ids]
@@ -0,0 +1,358 @@
+"""POC templates: a hot-reloading registry of named, versioned playbooks.
+
+Each template lives in ``app/data/templates/<name>/`` and consists of a
+``template.json`` manifest (``name``, ``version``, ``description``) plus
+``milestones.json``, ``success_criteria.json`` and ``phases.json``.  Templates
+are compiled into immutable structures once and instantiated with set-based
+inserts.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.poc import POC, ValueFramework
+from app.models.mutual_action_plan import Milestone
+from app.models.phase import Phase, Task
+from app.models.success_criteria import SuccessCriterion
+from app.services.ordering_service import SORT_GAP
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES_DIR = Path(__file__).parent.parent / "data" / "templates"
+
+# Template used when ``POST /pocs`` does not name one.
+DEFAULT_TEMPLATE_NAME = "default"
+
+MANIFEST_FILE = "template.json"
+
+
+# ---------------------------------------------------------------------------
+# Compiled template structures
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class MilestoneTemplate:
+    title: str
+    description: str
+    sort_order: int
+
+
+@dataclass(frozen=True)
+class CriterionTemplate:
+    feature: str
+    priority: str | None
+    criteria: str | None
+    current_state: str | None
+    notes: str | None
+    sort_order: int
+
+
+@dataclass(frozen=True)
+class TaskTemplate:
+    title: str
+    resource_url: str | None
+    resource_label: str | None
+    is_optional: bool
+    sort_order: int
+
+
+@dataclass(frozen=True)
+class PhaseTemplate:
+    name: str
+    description: str
+    sort_order: int
+    tasks: tuple[TaskTemplate, ...]
+
+
+@dataclass(frozen=True)
+class POCTemplate:
+    name: str
+    version: str
+    description: str
+    milestones: tuple[MilestoneTemplate, ...]
+    success_criteria: tuple[CriterionTemplate, ...]
+    phases: tuple[PhaseTemplate, ...]
+
+    @property
+    def task_count(self) -> int:
+        return sum(len(p.tasks) for p in self.phases)
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+def _read_json(path: Path) -> list[dict]:
+    """Return the parsed JSON list at *path*, or ``[]`` if the file is absent."""
+    if not path.exists():
+        return []
+    return json.loads(path.read_text())
+
+
+def compile_template(template_dir: Path) -> POCTemplate:
+    """Parse the manifest and JSON files in *template_dir* into a ``POCTemplate``.
+
+    The version is the manifest's ``version`` plus a short hash of the
+    content files (``1+3f2a9c0d41be``), or the hash alone when the manifest
+    has none.  Editing a file without bumping the manifest therefore still
+    yields a new version, and POCs are stamped with the content they got.
+    """
+    manifest_path = template_dir / MANIFEST_FILE
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+
+    digest = hashlib.sha256()
+    for path in sorted(template_dir.glob("*.json")):
+        if path.name != MANIFEST_FILE:
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+    content_hash = digest.hexdigest()[:12]
+    release = manifest.get("version")
+    version = f"{release}+{content_hash}" if release else content_hash
+
+    milestones = tuple(
+        MilestoneTemplate(
+            title=m["title"],
+            description=m.get("description", ""),
+            sort_order=m.get("sort_order", 0),
+        )
+        for m in _read_json(template_dir / "milestones.json")
+    )
+    criteria = tuple(
+        CriterionTemplate(
+            feature=c["feature"],
+            priority=c.get("priority"),
+            criteria=c.get("criteria"),
+            current_state=c.get("current_state"),
+            notes=c.get("notes"),
+            sort_order=c.get("sort_order", 0),
+        )
+        for c in _read_json(template_dir / "success_criteria.json")
+    )
+    phases = tuple(
+        PhaseTemplate(
+            name=p["title"],
+            description=p.get("description", ""),
+            sort_order=p.get("phase_number", 0),
+            tasks=tuple(
+                TaskTemplate(
+                    title=t["title"],
+                    resource_url=t.get("resource_url"),
+                    resource_label=t.get("resource_label"),
+                    is_optional=t.get("is_optional", False),
+                    sort_order=t.get("sort_order", 0),
+                )
+                for t in p.get("tasks", [])
+            ),
+        )
+        for p in _read_json(template_dir / "phases.json")
+    )
+    return POCTemplate(
+        name=manifest.get("name", template_dir.name),
+        version=str(version),
+        description=manifest.get("description", ""),
+        milestones=milestones,
+        success_criteria=criteria,
+        phases=phases,
+    )
+
+
+class TemplateRegistry:
+    """In-memory registry of compiled templates with mtime-based hot reload.
+
+    Lookups are served from an immutable ``{name: POCTemplate}`` snapshot.  At
+    most every ``check_interval`` seconds a lookup stats the template files;
+    if any changed, all templates are recompiled and the snapshot reference
+    is swapped in one assignment, so readers never see a half-loaded set.  A
+    reload that fails to parse keeps the previous snapshot.
+    """
+
+    def __init__(self, root: Path, check_interval: float) -> None:
+        self.root = root
+        self.check_interval = check_interval
+        self._templates: dict[str, POCTemplate] = {}
+        self._signature: tuple = ()
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+        self._reload(self._file_signature())
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _file_signature(self) -> tuple:
+        """Return ``(path, mtime_ns, size)`` for every template file."""
+        return tuple(
+            (str(path), path.stat().st_mtime_ns, path.stat().st_size)
+            for path in sorted(self.root.glob("*/*.json"))
+        )
+
+    def _reload(self, signature: tuple) -> None:
+        templates: dict[str, POCTemplate] = {}
+        for template_dir in sorted(p for p in self.root.iterdir() if p.is_dir()):
+            template = compile_template(template_dir)
+            templates[template.name] = template
+
+        self._templates = templates
+        self._signature = signature
+        logger.info(
+            "Loaded %d POC template(s): %s",
+            len(templates),
+            ", ".join(f"{t.name}@{t.version}" for t in templates.values()),
+        )
+
+    def _maybe_reload(self) -> None:
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return
+        # Only one thread checks; the others keep using the current snapshot.
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._last_check = now
+            signature = self._file_signature()
+            if signature != self._signature:
+                self._reload(signature)
+        except Exception:
+            logger.exception("Failed to reload POC templates; keeping previous set.")
+        finally:
+            self._lock.release()
+
+    # ------------------------------------------------------------------
+    # Public methods
+    # ------------------------------------------------------------------
+
+    def get(self, name: str) -> POCTemplate | None:
+        """Return the current version of template *name*, or ``None``."""
+        self._maybe_reload()
+        return self._templates.get(name)
+
+    def all_templates(self) -> list[POCTemplate]:
+        """Return every registered template, ordered by name."""
+        self._maybe_reload()
+        return sorted(self._templates.values(), key=lambda t: t.name)
+
+
+@lru_cache()
+def get_template_registry() -> TemplateRegistry:
+    """Return the process-wide template registry, loading it on first use."""
+    return TemplateRegistry(
+        TEMPLATES_DIR,
+        check_interval=get_settings().template_reload_interval_seconds,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Instantiation
+# ---------------------------------------------------------------------------
+
+def instantiate_template(db: Session, poc: POC, template: POCTemplate) -> None:
+    """Create the value framework and template children for a new POC.
+
+    *poc* must be pending in *db* (added, not yet flushed).  See
+    :func:`instantiate_templates`.  Does not commit.
+    """
+    instantiate_templates(db, [(poc, template)])
+
+
+def _gapped(items):
+    """Yield ``(key, item)`` in template order with ``SORT_GAP``-spaced keys."""
+    ordered = sorted(items, key=lambda item: item.sort_order)
+    for index, item in enumerate(ordered):
+        yield (index + 1) * SORT_GAP, item
+
+
+def instantiate_templates(
+    db: Session, pocs: list[tuple[POC, POCTemplate]]
+) -> None:
+    """Create value frameworks and template children for many new POCs.
+
+    Each POC must be pending in *db* (added, not yet flushed).  IDs are
+    generated client-side so all POCs are flushed together and each child
+    table is written with a single multi-row ``INSERT`` (Core
+    ``executemany``, which psycopg2 batches into one ``VALUES`` list),
+    however many POCs are passed.  Children are keyed ``SORT_GAP`` apart in
+    template order, each POC's progress counters are initialised to match
+    and its template name and version recorded.  Does not commit.
+    """
+    milestone_rows: list[dict] = []
+    criterion_rows: list[dict] = []
+    phase_rows: list[dict] = []
+    task_rows: list[dict] = []
+
+    for poc, template in pocs:
+        if poc.id is None:
+            poc.id = uuid.uuid4()
+        poc.template_name = template.name
+        poc.template_version = template.version
+        # Template children all start not started.
+        poc.total_milestones = len(template.milestones)
+        poc.completed_milestones = poc.in_progress_milestones = 0
+        poc.total_tasks = template.task_count
+        poc.completed_tasks = poc.in_progress_tasks = 0
+        db.add(ValueFramework(poc_id=poc.id))
+
+        milestone_rows.extend(
+            {
+                "poc_id": poc.id,
+                "title": m.title,
+                "description": m.description,
+                "sort_order": key,
+            }
+            for key, m in _gapped(template.milestones)
+        )
+        criterion_rows.extend(
+            {
+                "poc_id": poc.id,
+                "feature": c.feature,
+                "priority": c.priority,
+                "criteria": c.criteria,
+                "current_state": c.current_state,
+                "notes": c.notes,
+                "sort_order": key,
+            }
+            for key, c in _gapped(template.success_criteria)
+        )
+        for phase_key, p in _gapped(template.phases):
+            phase_id = uuid.uuid4()
+            phase_rows.append(
+                {
+                    "id": phase_id,
+                    "poc_id": poc.id,
+                    "name": p.name,
+                    "description": p.description,
+                    "sort_order": phase_key,
+                }
+            )
+            task_rows.extend(
+                {
+                    "poc_id": poc.id,
+                    "phase_id": phase_id,
+                    "title": t.title,
+                    "resource_url": t.resource_url,
+                    "resource_label": t.resource_label,
+                    "is_optional": t.is_optional,
+                    "sort_order": key,
+                }
+                for key, t in _gapped(p.tasks)
+            )
+
+    db.flush()
+
+    for model, rows in (
+        (Milestone, milestone_rows),
+        (SuccessCriterion, criterion_rows),
+        (Phase, phase_rows),
+        (Task, task_rows),
+    ):
+        if rows:
+            db.execute(model.__table__.insert(), rows)
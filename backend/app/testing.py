@@ -0,0 +1,100 @@
+"""Query-count assertions for catching N+1 regressions.
+
+Use :func:`assert_max_queries` around any code path::
+
+    with assert_max_queries(3):
+        client.get(f"/api/v1/pocs/{poc_id}/phases")
+
+:data:`QUERY_BUDGETS` records the allowed statements per read endpoint.
+Budgets do not depend on the number of rows, so a lazy load sneaking into
+a serializer fails them as soon as a POC has more than a handful of
+children.  ``python -m app.cli check-query-budgets`` runs every budget
+against a real POC.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.database import engine as default_engine
+
+# Read endpoints and their maximum statements per request (without
+# If-None-Match).  Customer budgets include one share-token lookup for a cold
+# token cache.  ``{poc_id}`` and ``{token}`` are filled in per POC.
+QUERY_BUDGETS: dict[str, int] = {
+    "/api/v1/pocs/{poc_id}": 1,
+    "/api/v1/pocs/{poc_id}/progress": 2,
+    "/api/v1/pocs/{poc_id}/milestones": 2,
+    "/api/v1/pocs/{poc_id}/phases": 3,
+    "/api/v1/pocs/{poc_id}/success-criteria": 2,
+    "/api/v1/pocs/{poc_id}/team": 2,
+    "/api/v1/pocs/{poc_id}/tech-stack": 3,
+    "/api/v1/pocs/{poc_id}/changes?since=0": 9,
+    "/api/v1/customer/{token}": 2,
+    "/api/v1/customer/{token}/bundle": 11,
+    "/api/v1/customer/{token}/milestones": 3,
+    "/api/v1/customer/{token}/phases": 4,
+    "/api/v1/customer/{token}/success-criteria": 3,
+    "/api/v1/customer/{token}/tech-stack": 4,
+    "/api/v1/customer/{token}/team": 3,
+}
+
+
+class QueryCounter:
+    """Collects the SQL statements executed on an engine."""
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+
+@contextmanager
+def count_queries(engine: Engine = default_engine) -> Iterator[QueryCounter]:
+    """Count statements executed on *engine* inside the ``with`` block."""
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter)
+
+
+@contextmanager
+def assert_max_queries(
+    limit: int, engine: Engine = default_engine
+) -> Iterator[QueryCounter]:
+    """Fail with the executed SQL if the block runs more than *limit* statements."""
+    with count_queries(engine) as counter:
+        yield counter
+    if counter.count > limit:
+        listing = "\n".join(
+            f"  {n}. {sql.splitlines()[0][:120]}"
+            for n, sql in enumerate(counter.statements, start=1)
+        )
+        raise AssertionError(
+            f"Expected at most {limit} queries, got {counter.count}:\n{listing}"
+        )
+
+
+def check_query_budgets(client, poc_id, share_token) -> list[tuple[str, int, int]]:
+    """Request every budgeted endpoint for one POC through *client*.
+
+    *client* is a ``fastapi.testclient.TestClient``.  Returns
+    ``(path, queries, budget)`` for each endpoint.
+    """
+    results = []
+    for template, budget in QUERY_BUDGETS.items():
+        path = template.format(poc_id=poc_id, token=share_token)
+        with count_queries() as counter:
+            response = client.get(path)
+        response.raise_for_status()
+        results.append((path, counter.count, budget))
+    return results
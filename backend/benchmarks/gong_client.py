@@ -0,0 +1,166 @@
+"""Benchmark ``GongService.search_calls`` against a local mock Gong API.
+
+Starts a mock ``/v2/calls/extensive`` server in a background thread.
+Calls are spread over the last ``--days`` days, date filters are applied,
+and each response is delayed by ``--latency-ms``.  The script then times
+``search_calls`` and reports milliseconds per page and the number of TCP
+connections the server saw::
+
+    python -m benchmarks.gong_client --pages 10 --runs 5
+
+Keep ``--pages`` at or below ``SHARD_PAGES`` to time the sequential cursor
+path.  Larger searches are split into concurrent date windows.
+
+Real Gong is HTTPS, where a new connection also costs a TLS handshake.  To
+include that cost, pass a certificate and key and make the client trust the
+certificate::
+
+    openssl req -x509 -newkey rsa:2048 -nodes -days 1 -subj /CN=localhost \\
+        -keyout key.pem -out cert.pem
+    SSL_CERT_FILE=cert.pem python -m benchmarks.gong_client \\
+        --certfile cert.pem --keyfile key.pem
+
+The script uses only ``GongService(settings)`` and ``search_calls``, so it
+also runs in a checkout from before the pooled client was introduced.
+"""
+
+import argparse
+import asyncio
+import socket
+import statistics
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import uvicorn
+from fastapi import FastAPI, Request
+
+from app.config import Settings
+from app.services.gong_service import GongService
+
+PER_PAGE = 100
+
+
+def mock_gong(calls: list[dict], latency: float, seen: list) -> FastAPI:
+    """A paging ``/v2/calls/extensive`` that records each client address."""
+    api = FastAPI()
+
+    @api.post("/v2/calls/extensive")
+    async def extensive(request: Request):
+        seen.append((request.client.host, request.client.port))
+        body = await request.json()
+        low = datetime.fromisoformat(body["filter"]["fromDateTime"])
+        high = datetime.fromisoformat(body["filter"]["toDateTime"])
+        selected = [call for call in calls if low <= call["_started"] <= high]
+        start = int(body.get("cursor") or 0)
+        await asyncio.sleep(latency)
+        page = [
+            {key: value for key, value in call.items() if key != "_started"}
+            for call in selected[start : start + PER_PAGE]
+        ]
+        cursor = str(start + PER_PAGE) if start + PER_PAGE < len(selected) else None
+        return {
+            "calls": page,
+            "records": {"totalRecords": len(selected), "cursor": cursor},
+        }
+
+    return api
+
+
+def make_calls(count: int, days: int) -> list[dict]:
+    now = datetime.now(timezone.utc)
+    step = timedelta(days=days) / count
+    calls = []
+    for n in range(count):
+        started = now - timedelta(hours=1) - step * n
+        domain = "acme.com" if n % 10 == 0 else "other.com"
+        calls.append(
+            {
+                "_started": started,
+                "metaData": {
+                    "id": str(n),
+                    "title": f"Call {n}",
+                    "started": started.isoformat(),
+                    "duration": 1800,
+                },
+                "parties": [{"emailAddress": f"user{n}@{domain}"}],
+            }
+        )
+    calls.sort(key=lambda call: call["_started"])
+    return calls
+
+
+def serve(api: FastAPI, args: argparse.Namespace) -> tuple[uvicorn.Server, str]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    config = uvicorn.Config(
+        api,
+        host="127.0.0.1",
+        port=port,
+        log_level="warning",
+        ssl_certfile=args.certfile,
+        ssl_keyfile=args.keyfile,
+    )
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    scheme = "https" if args.certfile else "http"
+    host = "localhost" if args.certfile else "127.0.0.1"
+    return server, f"{scheme}://{host}:{port}/v2"
+
+
+async def run(base_url: str, args: argparse.Namespace, seen: list) -> None:
+    gong = GongService(
+        Settings(
+            gong_api_base_url=base_url,
+            gong_access_key="bench",
+            gong_access_key_secret="bench",
+        )
+    )
+    per_page = []
+    requests = []
+    opened = []
+    try:
+        for _ in range(args.runs):
+            seen.clear()
+            started = time.perf_counter()
+            calls = await gong.search_calls("acme.com")
+            per_page.append((time.perf_counter() - started) / args.pages * 1000)
+            requests.append(len(seen))
+            opened.append(len(set(seen)))
+    finally:
+        if hasattr(gong, "aclose"):
+            await gong.aclose()
+
+    print(f"pages per search:     {args.pages} ({len(calls)} matching calls)")
+    print(f"median ms per page:   {statistics.median(per_page):.1f}")
+    print(f"runs (ms per page):   {', '.join(f'{ms:.1f}' for ms in per_page)}")
+    print(f"requests / search:    {', '.join(map(str, requests))}")
+    print(f"connections / search: {', '.join(map(str, opened))}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=10, help="Pages per search")
+    parser.add_argument("--days", type=int, default=30, help="Span of the calls")
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--certfile", help="Serve HTTPS with this certificate")
+    parser.add_argument("--keyfile", help="Private key for --certfile")
+    args = parser.parse_args(argv)
+
+    seen: list = []
+    api = mock_gong(
+        make_calls(args.pages * PER_PAGE, args.days), args.latency_ms / 1000, seen
+    )
+    server, base_url = serve(api, args)
+    try:
+        asyncio.run(run(base_url, args, seen))
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
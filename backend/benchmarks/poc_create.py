@@ -0,0 +1,82 @@
+"""Benchmark ``POST /api/v1/pocs`` (create a POC from the default template).
+
+Creates POCs one after another through the ASGI test client and reports
+latency, throughput and SQL statements per create.  The schema of the
+target database is dropped and rebuilt, so only point it at a disposable
+database::
+
+    BENCH_DATABASE_URL=postgresql://.../poc_doc_bot_bench \\
+        python -m benchmarks.poc_create --count 50
+
+Only the public API and the engine are used, so the script can be copied
+into a checkout of an earlier commit to measure the same path there.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=50, help="POCs to create")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed creates")
+    args = parser.parse_args(argv)
+
+    url = os.environ.get("BENCH_DATABASE_URL")
+    if not url:
+        sys.exit("Set BENCH_DATABASE_URL to a disposable Postgres database.")
+    os.environ["DATABASE_URL"] = url
+    os.environ["EVENT_BUS_ENABLED"] = "false"
+    os.environ["PORTFOLIO_REFRESH_INTERVAL_SECONDS"] = "0"
+    os.environ["GONG_INDEX_SYNC_INTERVAL_SECONDS"] = "0"
+
+    from fastapi.testclient import TestClient
+    from sqlalchemy import event, text
+
+    import app.models  # noqa: F401
+    from app.database import Base, engine
+    from app.main import app
+
+    with engine.begin() as conn:
+        conn.execute(text("DROP SCHEMA public CASCADE"))
+        conn.execute(text("CREATE SCHEMA public"))
+    Base.metadata.create_all(engine)
+
+    statements = 0
+
+    def count(*_):
+        nonlocal statements
+        statements += 1
+
+    with TestClient(app) as client:
+        def create(n: int) -> None:
+            response = client.post(
+                "/api/v1/pocs", json={"account_name": f"Bench {n}"}
+            )
+            response.raise_for_status()
+
+        for n in range(args.warmup):
+            create(n)
+
+        event.listen(engine, "before_cursor_execute", count)
+        timings = []
+        started = time.perf_counter()
+        for n in range(args.count):
+            t = time.perf_counter()
+            create(n)
+            timings.append((time.perf_counter() - t) * 1000)
+        elapsed = time.perf_counter() - started
+        event.remove(engine, "before_cursor_execute", count)
+
+    print(f"POC creates:         {args.count}")
+    print(f"median latency:      {statistics.median(timings):.1f} ms")
+    print(f"p95 latency:         {statistics.quantiles(timings, n=20)[-1]:.1f} ms")
+    print(f"throughput:          {args.count / elapsed:.1f} POCs/s")
+    print(f"statements / create: {statements / args.count:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Shared fixtures for the backend test suite.
+
+Database tests need a dedicated, disposable Postgres database named by
+``TEST_DATABASE_URL``; its ``public`` schema is dropped and rebuilt with
+``create_all`` once per run and every table is truncated before each test.
+Without it those tests are skipped.  Background workers (change bus,
+portfolio refresher, Gong index sync) are disabled.
+"""
+
+import os
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+os.environ["EVENT_BUS_ENABLED"] = "false"
+os.environ["PORTFOLIO_REFRESH_INTERVAL_SECONDS"] = "0"
+os.environ["GONG_INDEX_SYNC_INTERVAL_SECONDS"] = "0"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def database():
+    """Rebuild the test schema once per run."""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    with engine.begin() as conn:
+        conn.execute(text("DROP SCHEMA public CASCADE"))
+        conn.execute(text("CREATE SCHEMA public"))
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(database):
+    """A session on an empty database."""
+    tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    with engine.begin() as conn:
+        conn.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(db):
+    """A test client with the app lifespan running."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def create_poc(client: TestClient, account_name: str = "Acme", **fields) -> dict:
+    """Create a POC from the default template through the API."""
+    response = client.post(
+        "/api/v1/pocs", json={"account_name": account_name, **fields}
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
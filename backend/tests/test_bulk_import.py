@@ -0,0 +1,36 @@
+"""Bulk POC creation from account lists."""
+
+from app.services.template_service import TemplateRegistry
+
+
+def test_bulk_create(client):
+    response = client.post(
+        "/api/v1/pocs/bulk",
+        json={
+            "accounts": [
+                {"account_name": "Acme"},
+                {"account_name": "Globex", "template": "missing"},
+            ]
+        },
+    )
+    assert response.status_code == 201, response.text
+    body = response.json()
+    assert [row["account_name"] for row in body["created"]] == ["Acme"]
+    assert [row["row"] for row in body["errors"]] == [1]
+
+
+def test_template_removed_by_reload_mid_import(client, monkeypatch):
+    get = TemplateRegistry.get
+    lookups = []
+
+    def removed_after_first_lookup(self, name):
+        lookups.append(name)
+        return get(self, name) if len(lookups) == 1 else None
+
+    monkeypatch.setattr(TemplateRegistry, "get", removed_after_first_lookup)
+    response = client.post(
+        "/api/v1/pocs/bulk", json={"accounts": [{"account_name": "Acme"}]}
+    )
+    assert response.status_code == 201, response.text
+    assert len(response.json()["created"]) == 1
+    assert lookups == ["default"]
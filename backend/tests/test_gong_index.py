@@ -0,0 +1,80 @@
+"""The org-wide Gong call index and the API search agree on domain matching."""
+
+import asyncio
+from datetime import datetime, timezone
+
+import httpx
+
+from app.config import get_settings
+from app.models.gong import GongSyncState
+from app.services.gong_index import SYNC_NAME, search_index, store_calls
+from app.services.gong_service import GongService, _normalize_call, domain_keys
+from tests.conftest import create_poc
+from tests.test_gong_service import SETTINGS
+
+EMAILS = {
+    "1": "jo@acme.com",
+    "2": "sam@eu.acme.com",
+    "3": "lee@notacme.com",
+    "4": "kim@acme.com.evil.io",
+    "5": "ann@ACME.COM",
+    "6": "pat@other.io",
+}
+CALLS = [
+    {
+        "metaData": {"id": call_id, "started": f"2026-01-0{call_id}T10:00:00+00:00"},
+        "parties": [{"emailAddress": email}],
+    }
+    for call_id, email in EMAILS.items()
+]
+
+
+def test_domain_keys():
+    assert domain_keys("jo@eu.acme.com") == {"eu.acme.com", "acme.com"}
+    assert domain_keys("JO@Acme.com ") == {"acme.com"}
+    assert domain_keys("root@localhost") == set()
+
+
+def api_search(domain: str) -> set[str]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, json={"calls": CALLS, "records": {"totalRecords": len(CALLS)}}
+        )
+
+    async def search():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            return await GongService(SETTINGS, client).search_calls(domain)
+        finally:
+            await client.aclose()
+
+    return {call["gong_call_id"] for call in asyncio.run(search())}
+
+
+def test_index_and_api_search_match_the_same_calls(db):
+    store_calls(db, [_normalize_call(call) for call in CALLS])
+    db.commit()
+
+    for domain in ("acme.com", "eu.acme.com", "ACME.com", "com", "other.io"):
+        indexed = {call["gong_call_id"] for call in search_index(db, domain)}
+        assert indexed == api_search(domain), domain
+
+    assert api_search("acme.com") == {"1", "2", "5"}
+
+
+def test_search_returns_all_of_the_pocs_calls(client, db, monkeypatch):
+    store_calls(db, [_normalize_call(call) for call in CALLS])
+    db.add(GongSyncState(name=SYNC_NAME, last_synced_at=datetime.now(timezone.utc)))
+    db.commit()
+    monkeypatch.setattr(get_settings(), "gong_index_sync_interval_seconds", 900)
+    poc = create_poc(client)
+    url = f"/api/v1/pocs/{poc['id']}/gong"
+
+    first = client.post(f"{url}/search-calls", json={"account_domain": "other.io"})
+    assert first.status_code == 200, first.text
+    response = client.post(f"{url}/search-calls", json={"account_domain": "acme.com"})
+    assert response.status_code == 200, response.text
+
+    found = [call["gong_call_id"] for call in response.json()]
+    assert found == ["6", "5", "2", "1"]
+    assert response.json() == client.get(f"{url}/calls").json()
@@ -0,0 +1,87 @@
+"""GongService against an in-process mock of the Gong API."""
+
+import asyncio
+import json
+
+import httpx
+from fastapi.testclient import TestClient
+
+from app.config import Settings
+from app.main import app
+from app.services.gong_service import GongService
+
+SETTINGS = Settings(
+    gong_api_base_url="https://gong.test/v2",
+    gong_access_key="key",
+    gong_access_key_secret="secret",
+)
+
+
+def paged_calls(pages: int):
+    """A ``/calls/extensive`` handler serving *pages* pages of two calls."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(json.loads(request.content).get("cursor") or 0)
+        calls = [
+            {
+                "metaData": {"id": f"{page}-{n}", "started": "2026-01-05T10:00:00Z"},
+                "parties": [{"emailAddress": f"user{n}@acme.com"}],
+            }
+            for n in range(2)
+        ]
+        cursor = str(page + 1) if page + 1 < pages else None
+        return httpx.Response(
+            200,
+            json={"calls": calls, "records": {"totalRecords": 2, "cursor": cursor}},
+        )
+
+    return handler
+
+
+def test_requests_share_one_client(monkeypatch):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return paged_calls(5)(request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    created = []
+    init = httpx.AsyncClient.__init__
+
+    def tracking_init(self, *args, **kwargs):
+        created.append(self)
+        init(self, *args, **kwargs)
+
+    monkeypatch.setattr(httpx.AsyncClient, "__init__", tracking_init)
+
+    async def search():
+        gong = GongService(SETTINGS, client)
+        first = await gong.search_calls("acme.com")
+        second = await gong.search_calls("acme.com")
+        await gong.aclose()
+        return first, second
+
+    first, second = asyncio.run(search())
+    assert len(first) == len(second) == 10
+    assert len(requests) == 10
+    assert created == []
+    # The service does not close a client it was given.
+    assert not client.is_closed
+    asyncio.run(client.aclose())
+
+
+def test_service_closes_the_client_it_created():
+    async def run():
+        gong = GongService(SETTINGS)
+        await gong.aclose()
+        return gong._client
+
+    assert asyncio.run(run()).is_closed
+
+
+def test_lifespan_owns_the_shared_client():
+    with TestClient(app):
+        gong = app.state.gong_service
+        assert not gong._client.is_closed
+    assert gong._client.is_closed
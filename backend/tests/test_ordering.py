@@ -0,0 +1,67 @@
+"""New rows get gapped sort keys, so moves update a single row."""
+
+from app.services.ordering_service import SORT_GAP
+from tests.conftest import create_poc
+
+
+def _keys(rows: list[dict]) -> list[int]:
+    return [row["sort_order"] for row in rows]
+
+
+def _gapped(count: int) -> list[int]:
+    return [(n + 1) * SORT_GAP for n in range(count)]
+
+
+def test_template_children_are_gapped(client):
+    poc = create_poc(client)
+    milestones = client.get(f"/api/v1/pocs/{poc['id']}/milestones").json()
+    phases = client.get(f"/api/v1/pocs/{poc['id']}/phases").json()
+
+    assert _keys(milestones) == _gapped(len(milestones))
+    assert _keys(phases) == _gapped(len(phases))
+    for phase in phases:
+        assert _keys(phase["tasks"]) == _gapped(len(phase["tasks"]))
+
+
+def test_created_rows_are_appended(client):
+    poc = create_poc(client)
+    url = f"/api/v1/pocs/{poc['id']}/milestones"
+    last = max(_keys(client.get(url).json()))
+
+    created = client.post(url, json={"title": "Executive readout"})
+    assert created.status_code == 201, created.text
+    assert created.json()["sort_order"] == last + SORT_GAP
+
+    batch = client.post(
+        f"/api/v1/pocs/{poc['id']}/batch",
+        json={
+            "operations": [
+                {"op": "create", "entity": "milestone", "data": {"title": title}}
+                for title in ("Renewal", "Expansion")
+            ]
+        },
+    )
+    assert batch.status_code == 200, batch.text
+    assert [result["data"]["sort_order"] for result in batch.json()["results"]] == [
+        last + 2 * SORT_GAP,
+        last + 3 * SORT_GAP,
+    ]
+
+
+def test_first_move_rewrites_one_row(client):
+    poc = create_poc(client)
+    url = f"/api/v1/pocs/{poc['id']}/milestones"
+    first, second, *rest = client.get(url).json()
+    moved = rest[-1]
+
+    response = client.post(
+        f"{url}/{moved['id']}/move", json={"after_id": first["id"]}
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["sort_order"] == (
+        first["sort_order"] + second["sort_order"]
+    ) // 2
+
+    after = {row["id"]: row["sort_order"] for row in client.get(url).json()}
+    for row in (first, second, *rest[:-1]):
+        assert after[row["id"]] == row["sort_order"]
@@ -0,0 +1,55 @@
+"""Creating a POC from a template bulk-inserts its children.
+
+``benchmarks/poc_create.py`` measures the latency of the same path.
+"""
+
+from app.schemas.poc import POCCreate
+from app.services.poc_service import POCService
+from app.services.template_service import get_template_registry, instantiate_template
+from app.testing import assert_max_queries
+from tests.conftest import create_poc
+
+# Statements per create: the POC and value framework INSERTs, one multi-row
+# INSERT per child table, and the reload of the POC for the response.
+POC_CREATE_QUERY_BUDGET = 8
+
+
+def test_create_runs_a_fixed_number_of_statements(client):
+    create_poc(client, "Warm-up")
+    for n in range(3):
+        with assert_max_queries(POC_CREATE_QUERY_BUDGET):
+            create_poc(client, f"Account {n}")
+
+
+def test_create_instantiates_every_template_child(client):
+    template = get_template_registry().get("default")
+    poc = create_poc(client)
+    base = f"/api/v1/pocs/{poc['id']}"
+
+    milestones = client.get(f"{base}/milestones").json()
+    criteria = client.get(f"{base}/success-criteria").json()
+    phases = client.get(f"{base}/phases").json()
+
+    assert len(milestones) == len(template.milestones)
+    assert len(criteria) == len(template.success_criteria)
+    assert [p["name"] for p in phases] == [p.name for p in template.phases]
+    assert [len(p["tasks"]) for p in phases] == [len(p.tasks) for p in template.phases]
+
+    progress = client.get(f"{base}/progress").json()
+    assert progress["total_tasks"] == sum(len(p.tasks) for p in template.phases)
+    assert progress["total_milestones"] == len(template.milestones)
+
+
+
+def test_counters_are_set_before_flush(db):
+    poc = POCService.build_poc(POCCreate(account_name="Acme"))
+    assert poc.total_tasks == poc.completed_milestones == 0
+    poc.total_milestones += 1
+
+    template = get_template_registry().get("default")
+    db.add(poc)
+    instantiate_template(db, poc, template)
+    assert poc.total_milestones == len(template.milestones)
+    assert poc.total_tasks == template.task_count
+    assert poc.completed_tasks == poc.in_progress_tasks == 0
+    db.rollback()
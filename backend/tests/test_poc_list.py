@@ -0,0 +1,40 @@
+"""Keyset pagination of ``GET /pocs``, as followed by the staff dashboard."""
+
+from app.routers.pocs import DEFAULT_PAGE_SIZE, NEXT_CURSOR_HEADER
+from tests.conftest import create_poc
+
+
+def _all_pages(client, **params) -> tuple[list[dict], int]:
+    pocs, pages, cursor = [], 0, None
+    while True:
+        query = {**params, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/v1/pocs", params=query)
+        assert response.status_code == 200, response.text
+        pocs.extend(response.json())
+        pages += 1
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            return pocs, pages
+
+
+def test_following_the_cursor_returns_every_poc_once(client):
+    created = {create_poc(client, f"Account {n:02}")["id"] for n in range(12)}
+
+    pocs, pages = _all_pages(client, limit=5)
+    assert pages == 3
+    assert [p["id"] for p in pocs] == list(dict.fromkeys(p["id"] for p in pocs))
+    assert {p["id"] for p in pocs} == created
+
+    first = client.get("/api/v1/pocs")
+    assert len(first.json()) == min(12, DEFAULT_PAGE_SIZE)
+
+
+def test_cursor_header_is_exposed_to_the_browser(client):
+    create_poc(client, "A")
+    create_poc(client, "B")
+    response = client.get(
+        "/api/v1/pocs",
+        params={"limit": 1},
+        headers={"Origin": "http://localhost:3000"},
+    )
+    assert NEXT_CURSOR_HEADER in response.headers["access-control-expose-headers"]
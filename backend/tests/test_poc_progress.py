@@ -0,0 +1,61 @@
+"""The POC list and progress endpoints run a fixed number of queries."""
+
+from app.testing import count_queries
+from tests.conftest import create_poc
+
+
+def _list_queries(client) -> tuple[int, list[dict]]:
+    with count_queries() as counter:
+        response = client.get("/api/v1/pocs", params={"limit": 100})
+    assert response.status_code == 200
+    return counter.count, response.json()
+
+
+def test_list_query_count_does_not_grow_with_pocs(client):
+    create_poc(client, "Account 0")
+    one, listed = _list_queries(client)
+    assert len(listed) == 1
+
+    for n in range(1, 20):
+        create_poc(client, f"Account {n}")
+    many, listed = _list_queries(client)
+    assert len(listed) == 20
+
+    assert many == one
+
+
+def test_list_progress_matches_detail(client):
+    poc = create_poc(client)
+    phases = client.get(f"/api/v1/pocs/{poc['id']}/phases").json()
+    task = phases[0]["tasks"][0]
+    response = client.patch(
+        f"/api/v1/pocs/{poc['id']}/tasks/{task['id']}",
+        json={"status": "completed"},
+    )
+    assert response.status_code == 200, response.text
+
+    _, listed = _list_queries(client)
+    detail = client.get(f"/api/v1/pocs/{poc['id']}/progress").json()
+    progress = listed[0]["progress"]
+    assert progress["completed_tasks"] == detail["completed_tasks"] == 1
+    assert progress["overall_pct"] == detail["overall_pct"]
+
+
+def test_progress_query_count_does_not_grow_with_tasks(client):
+    small = create_poc(client, "Small")
+    large = create_poc(client, "Large")
+    phase = client.get(f"/api/v1/pocs/{large['id']}/phases").json()[0]
+    for n in range(30):
+        response = client.post(
+            f"/api/v1/pocs/{large['id']}/phases/{phase['id']}/tasks",
+            json={"title": f"Task {n}"},
+        )
+        assert response.status_code == 201, response.text
+
+    counts = []
+    for poc in (small, large):
+        with count_queries() as counter:
+            response = client.get(f"/api/v1/pocs/{poc['id']}/progress")
+        assert response.status_code == 200
+        counts.append(counter.count)
+    assert counts[0] == counts[1]
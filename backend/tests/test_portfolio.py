@@ -0,0 +1,29 @@
+"""Portfolio dashboard refresh."""
+
+from sqlalchemy import select
+
+from app.models.portfolio import PortfolioMetrics
+from app.services.poc_service import POCService
+from app.services.portfolio_service import PortfolioService
+from tests.conftest import create_poc
+
+
+def test_refresh_covers_poc_created_after_progress_query(client, db, monkeypatch):
+    early = create_poc(client, "Early")
+    bulk_progress = POCService.bulk_progress
+
+    def progress_then_create(session, poc_ids=None):
+        progress = bulk_progress(session, poc_ids)
+        # Committed by another request between the two refresh statements
+        create_poc(client, "Late")
+        return progress
+
+    monkeypatch.setattr(POCService, "bulk_progress", progress_then_create)
+    assert PortfolioService.refresh(db) == 2
+
+    metrics = {
+        row.account_name: row for row in db.scalars(select(PortfolioMetrics))
+    }
+    assert str(metrics["Early"].poc_id) == early["id"]
+    assert metrics["Late"].total_tasks == metrics["Early"].total_tasks > 0
+    assert metrics["Late"].overall_pct == 0.0
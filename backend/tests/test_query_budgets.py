@@ -0,0 +1,63 @@
+"""Every read endpoint stays within its ``QUERY_BUDGETS`` entry (N+1 guard)."""
+
+import uuid
+
+import pytest
+
+from app.models.tech_stack import DocLink
+from app.services import load_policy
+from app.testing import QUERY_BUDGETS, check_query_budgets
+from tests.conftest import create_poc
+
+
+@pytest.fixture
+def seeded_poc(client, db) -> dict:
+    """A template POC plus tech stack entries, doc links and team members."""
+    poc = create_poc(client)
+    base = f"/api/v1/pocs/{poc['id']}"
+    for name in ("Python", "Django", "React", "Node.js", "Go"):
+        response = client.post(
+            f"{base}/tech-stack", json={"category": "framework", "name": name}
+        )
+        assert response.status_code == 201, response.text
+        # Doc link generation is not implemented yet; add links directly.
+        db.add_all(
+            DocLink(
+                poc_id=uuid.UUID(poc["id"]),
+                tech_stack_entry_id=uuid.UUID(response.json()["id"]),
+                category="setup",
+                title=f"{name} guide {n}",
+                url=f"https://docs.sentry.io/{name.lower()}/{n}",
+                sort_order=n,
+            )
+            for n in range(3)
+        )
+    db.commit()
+    entries = client.get(f"{base}/tech-stack").json()
+    assert all(len(entry["doc_links"]) == 3 for entry in entries)
+    for n in range(4):
+        side = "sentry" if n % 2 else "customer"
+        response = client.post(f"{base}/team", json={"team_side": side, "name": f"M{n}"})
+        assert response.status_code == 201, response.text
+
+    phases = client.get(f"{base}/phases").json()
+    assert len(phases) > 1 and all(phase["tasks"] for phase in phases)
+    return poc
+
+
+def test_read_endpoints_stay_within_query_budgets(client, seeded_poc):
+    results = check_query_budgets(client, seeded_poc["id"], seeded_poc["share_token"])
+    assert len(results) == len(QUERY_BUDGETS)
+    over = [
+        f"{path}: {queries} queries > budget {budget}"
+        for path, queries, budget in results
+        if queries > budget
+    ]
+    assert not over, "\n".join(over)
+
+
+def test_budgets_catch_lazy_loading(client, seeded_poc, monkeypatch):
+    # Without the eager-loading policy the serializers lazy-load per row.
+    monkeypatch.setattr(load_policy, "LOAD_POLICIES", {})
+    results = check_query_budgets(client, seeded_poc["id"], seeded_poc["share_token"])
+    assert any(queries > budget for _, queries, budget in results)
@@ -0,0 +1,90 @@
+"""POC child endpoints check their POC inside the statement doing the work."""
+
+import uuid
+
+import pytest
+
+from app.database import SessionLocal, get_db
+from app.main import app
+from app.testing import count_queries
+from tests.conftest import create_poc
+
+MISSING = uuid.uuid4()
+
+
+@pytest.mark.parametrize(
+    "path, payload",
+    [
+        ("milestones", {"title": "Kickoff"}),
+        ("phases", {"name": "Setup"}),
+        ("success-criteria", {"feature": "Alerts"}),
+        ("team", {"name": "Sam", "team_side": "customer"}),
+    ],
+)
+def test_create_for_missing_poc_is_404(client, path, payload):
+    response = client.post(f"/api/v1/pocs/{MISSING}/{path}", json=payload)
+    assert response.status_code == 404, response.text
+    assert response.json()["detail"] == "POC not found"
+
+
+def test_create_milestone_for_missing_poc_is_404_with_autoflush(client):
+    # The counter UPDATE must not flush the insert before ``flush_or_404``.
+    def autoflush_db():
+        db = SessionLocal(autoflush=True)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = autoflush_db
+    try:
+        response = client.post(
+            f"/api/v1/pocs/{MISSING}/milestones", json={"title": "Kickoff"}
+        )
+    finally:
+        del app.dependency_overrides[get_db]
+    assert response.status_code == 404, response.text
+    assert response.json()["detail"] == "POC not found"
+
+
+def test_create_milestone_adjusts_counters(client):
+    poc = create_poc(client)
+    before = client.get(f"/api/v1/pocs/{poc['id']}/progress").json()
+
+    response = client.post(
+        f"/api/v1/pocs/{poc['id']}/milestones",
+        json={"title": "Kickoff", "status": "completed"},
+    )
+    assert response.status_code == 201, response.text
+
+    after = client.get(f"/api/v1/pocs/{poc['id']}/progress").json()
+    assert after["total_milestones"] == before["total_milestones"] + 1
+    assert after["completed_milestones"] == before["completed_milestones"] + 1
+
+
+def test_update_missing_child_is_404(client):
+    poc = create_poc(client)
+    response = client.patch(
+        f"/api/v1/pocs/{poc['id']}/milestones/{MISSING}", json={"title": "x"}
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Milestone not found"
+
+    response = client.patch(
+        f"/api/v1/pocs/{MISSING}/milestones/{MISSING}", json={"title": "x"}
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "POC not found"
+
+
+def test_update_does_not_load_the_poc_first(client):
+    poc = create_poc(client)
+    milestone = client.get(f"/api/v1/pocs/{poc['id']}/milestones").json()[0]
+    with count_queries() as counter:
+        response = client.patch(
+            f"/api/v1/pocs/{poc['id']}/milestones/{milestone['id']}",
+            json={"title": "Renamed"},
+        )
+    assert response.status_code == 200
+    assert response.json()["title"] == "Renamed"
+    assert not any(sql.lstrip().startswith("SELECT pocs.") for sql in counter.statements)
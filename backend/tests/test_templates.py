@@ -0,0 +1,46 @@
+"""POC template registry versions and hot reload."""
+
+import json
+import shutil
+
+from app.services.template_service import TEMPLATES_DIR, TemplateRegistry
+
+
+def _registry(tmp_path) -> TemplateRegistry:
+    shutil.copytree(TEMPLATES_DIR / "default", tmp_path / "default")
+    return TemplateRegistry(tmp_path, check_interval=0)
+
+
+def test_version_combines_manifest_and_content_hash(tmp_path):
+    registry = _registry(tmp_path)
+    manifest = json.loads((tmp_path / "default" / "template.json").read_text())
+
+    release, _, content_hash = registry.get("default").version.partition("+")
+    assert release == manifest["version"]
+    assert len(content_hash) == 12
+
+
+def test_content_edit_without_version_bump_changes_version(tmp_path):
+    registry = _registry(tmp_path)
+    before = registry.get("default")
+
+    path = tmp_path / "default" / "milestones.json"
+    milestones = json.loads(path.read_text())
+    milestones.append({"title": "Executive readout", "sort_order": 99})
+    path.write_text(json.dumps(milestones))
+
+    after = registry.get("default")
+    assert len(after.milestones) == len(before.milestones) + 1
+    assert after.version != before.version
+    assert after.version.partition("+")[0] == before.version.partition("+")[0]
+
+
+def test_manifest_without_version_uses_content_hash(tmp_path):
+    registry = _registry(tmp_path)
+    path = tmp_path / "default" / "template.json"
+    manifest = json.loads(path.read_text())
+    del manifest["version"]
+    path.write_text(json.dumps(manifest))
+
+    version = registry.get("default").version
+    assert "+" not in version and len(version) == 12
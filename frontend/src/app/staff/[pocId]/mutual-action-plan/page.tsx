@@ -98,7 +98,6 @@ export default function MutualActionPlanPage() {
   const handleAddMilestone = () => {
     createMilestone.mutate({
       title: 'New Milestone',
-      sort_order: (milestones?.length ?? 0) + 1,
     });
   };
 
@@ -135,7 +135,6 @@ function PhaseTaskTable({
   const handleAddTask = () => {
     createTask.mutate({
       title: 'New Task',
-      sort_order: phase.tasks.length + 1,
     });
   };
 
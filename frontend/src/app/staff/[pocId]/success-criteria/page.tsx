@@ -41,7 +41,6 @@ export default function SuccessCriteriaPage() {
   const handleAdd = () => {
     createCriterion.mutate({
       feature: 'New Feature',
-      sort_order: (criteria?.length ?? 0) + 1,
     });
   };
 
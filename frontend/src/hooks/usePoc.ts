@@ -2,10 +2,27 @@ import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import api from '@/lib/api';
 import type { POC, POCSummary, POCCreate, POCUpdate } from '@/lib/types';
 
+// GET /pocs is keyset-paginated; the next page's cursor comes back in this header.
+const NEXT_CURSOR_HEADER = 'X-Next-Cursor';
+const POC_PAGE_SIZE = 200;
+
 export function usePocs(status?: string) {
   return useQuery<POCSummary[]>({
     queryKey: ['pocs', status],
-    queryFn: () => api.get(`/pocs${status ? `?status=${status}` : ''}`),
+    queryFn: async () => {
+      const pocs: POCSummary[] = [];
+      let cursor: string | null = null;
+      do {
+        const params = new URLSearchParams({ limit: String(POC_PAGE_SIZE) });
+        if (status) params.set('status', status);
+        if (cursor) params.set('cursor', cursor);
+        const page: { data: POCSummary[]; headers: Headers } =
+          await api.getWithHeaders<POCSummary[]>(`/pocs?${params}`);
+        pocs.push(...page.data);
+        cursor = page.headers.get(NEXT_CURSOR_HEADER);
+      } while (cursor);
+      return pocs;
+    },
   });
 }
 
@@ -8,7 +8,7 @@ class ApiError extends Error {
   }
 }
 
-async function apiClient<T>(path: string, options?: RequestInit): Promise<T> {
+async function request(path: string, options?: RequestInit): Promise<Response> {
   let res: Response;
   try {
     res = await fetch(`${API_BASE}${path}`, {
@@ -31,13 +31,25 @@ async function apiClient<T>(path: string, options?: RequestInit): Promise<T> {
     });
     throw error;
   }
+  return res;
+}
+
+async function apiClient<T>(path: string, options?: RequestInit): Promise<T> {
+  const res = await request(path, options);
   if (res.status === 204) return undefined as T;
   return res.json();
 }
 
+// GET that also returns the response headers (e.g. pagination cursors)
+async function getWithHeaders<T>(path: string): Promise<{ data: T; headers: Headers }> {
+  const res = await request(path);
+  return { data: await res.json(), headers: res.headers };
+}
+
 // Convenience methods
 export const api = {
   get: <T>(path: string) => apiClient<T>(path),
+  getWithHeaders,
   post: <T>(path: string, body?: any) => apiClient<T>(path, { method: 'POST', body: body ? JSON.stringify(body) : undefined }),
   patch: <T>(path: string, body: any) => apiClient<T>(path, { method: 'PATCH', body: JSON.stringify(body) }),
   delete: <T>(path: string) => apiClient<T>(path, { method: 'DELETE' }),